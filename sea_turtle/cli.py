@@ -85,6 +85,14 @@ def main():
 
     update_parser = subparsers.add_parser("update", help="Check for and install updates")
     update_parser.add_argument("--check", action="store_true", help="Only check, don't install")
+    update_parser.add_argument(
+        "--strategy", choices=["auto", "git", "pip"], default="auto",
+        help="auto: git pull in a checkout, else pip upgrade (default: auto)",
+    )
+    update_parser.add_argument(
+        "--in-process-pip", action="store_true",
+        help="Run pip inside this process (faster, but not time-limited)",
+    )
 
     args = parser.parse_args()
 
@@ -588,14 +596,20 @@ def cmd_onboard(args):
 
 def cmd_update(args):
     """Check for and install updates."""
-    from sea_turtle.updater.github import install_update
+    from sea_turtle.updater.github import install_update, set_data_dir
 
     print(f"🐢 Sea Turtle v{__version__}")
+    try:
+        data_dir = _load_cfg(args).get("global", {}).get("data_dir", "~/.sea_turtle")
+    except (OSError, ValueError):
+        # update must keep working without a (valid) config file.
+        data_dir = "~/.sea_turtle"
+    set_data_dir(data_dir)
 
     if args.check:
         from sea_turtle.updater.github import check_update
         print("Checking GitHub for latest release...")
-        latest = check_update()
+        latest = check_update(force=True)
         if latest is None:
             print("⚠️ Could not check for updates.")
         elif latest == __version__:
@@ -604,8 +618,9 @@ def cmd_update(args):
             print(f"📦 New release available: {latest}")
         return
 
-    print("Updating (git pull + pip install -e .) ...")
-    success = install_update()
+    strategy = getattr(args, "strategy", "auto")
+    print(f"Updating (strategy: {strategy}) ...")
+    success = install_update(strategy, in_process_pip=getattr(args, "in_process_pip", False))
     if success:
         print("✅ Update complete. Restart daemon: seaturtle stop && seaturtle start")
     else:
@@ -3,11 +3,12 @@
 import logging
 import multiprocessing
 import os
+import queue
 import time
 from dataclasses import dataclass, field
 from multiprocessing import Process, Queue
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from sea_turtle.core.agent_worker import run_agent_worker
 from sea_turtle.core.rules import init_agent_workspace
@@ -16,13 +17,40 @@ from sea_turtle.config.loader import get_agent_config
 logger = logging.getLogger("sea_turtle.agent")
 
 
+class Outbox:
+    """Agent -> daemon message channel the daemon can watch with a selector.
+
+    A one-way Pipe rather than a multiprocessing.Queue: the read end is a
+    public Connection, and an item is readable as soon as put() returns (a
+    Queue hands items to a feeder thread first). put() blocks while the
+    pipe is full, until the daemon catches up.
+    """
+
+    def __init__(self):
+        self._reader, self._writer = multiprocessing.Pipe(duplex=False)
+        self._write_lock = multiprocessing.Lock()
+
+    def fileno(self) -> int:
+        return self._reader.fileno()
+
+    def put(self, obj: Any) -> None:
+        with self._write_lock:
+            self._writer.send(obj)
+
+    def get_nowait(self) -> Any:
+        """Return the next item, or raise queue.Empty if none is waiting."""
+        if not self._reader.poll():
+            raise queue.Empty
+        return self._reader.recv()
+
+
 @dataclass
 class AgentHandle:
     """Handle to a running agent child process."""
     agent_id: str
     process: Process | None = None
     inbox: Queue = field(default_factory=Queue)
-    outbox: Queue = field(default_factory=Queue)
+    outbox: Outbox = field(default_factory=Outbox)
     started_at: float = 0.0
     restart_count: int = 0
 
@@ -53,6 +81,7 @@ class AgentManager:
     def __init__(self, config: dict):
         self.config = config
         self.agents: dict[str, AgentHandle] = {}
+        self.on_agent_started: Callable[[AgentHandle], None] | None = None
 
     def start_agent(self, agent_id: str) -> AgentHandle:
         """Start an agent child process.
@@ -95,6 +124,8 @@ class AgentManager:
         handle.process = process
         handle.started_at = time.time()
         self.agents[agent_id] = handle
+        if self.on_agent_started:
+            self.on_agent_started(handle)
 
         logger.info(f"Agent '{agent_id}' started (pid: {process.pid})")
         return handle
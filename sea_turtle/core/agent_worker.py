@@ -8,7 +8,7 @@ import signal
 import time
 from multiprocessing import Queue
 from pathlib import Path
-from typing import Any
+from typing import Any, TYPE_CHECKING
 
 from sea_turtle.config.loader import get_agent_config, resolve_secret
 from sea_turtle.core.context import ContextManager
@@ -36,11 +36,13 @@ from sea_turtle.core.tasks import (
     validate_script_command,
 )
 from sea_turtle.core.token_counter import TokenCounter
-from sea_turtle.llm.base import BaseLLMProvider, ToolDefinition
+from sea_turtle.llm.base import WARM_UP_IDLE_SECONDS, BaseLLMProvider, ToolDefinition
 from sea_turtle.llm.registry import resolve_provider
 from sea_turtle.security.system_prompt import build_system_prompt
 from sea_turtle.utils.logger import get_agent_logger
 
+if TYPE_CHECKING:
+    from sea_turtle.core.agent import Outbox
 
 # Tool definitions for function calling
 SHELL_TOOL = ToolDefinition(
@@ -382,22 +384,26 @@ def _create_llm_provider(
             f"API key not found for provider '{provider_name}'. "
             f"Set 'api_key' in config.json or env var '{provider_cfg.get('api_key_env', '')}'."
         )
+    cache_kwargs = {
+        "semantic_cache": bool(provider_cfg.get("semantic_cache", False)),
+        "embedding_model": provider_cfg.get("embedding_model"),
+    }
 
     if provider_name == "google":
         from sea_turtle.llm.google import GoogleProvider
-        return GoogleProvider(api_key=api_key)
+        return GoogleProvider(api_key=api_key, **cache_kwargs)
     elif provider_name == "openai":
         from sea_turtle.llm.openai import OpenAIProvider
-        return OpenAIProvider(api_key=api_key)
+        return OpenAIProvider(api_key=api_key, **cache_kwargs)
     elif provider_name == "anthropic":
         from sea_turtle.llm.anthropic import AnthropicProvider
         return AnthropicProvider(api_key=api_key)
     elif provider_name == "openrouter":
         from sea_turtle.llm.openrouter import OpenRouterProvider
-        return OpenRouterProvider(api_key=api_key)
+        return OpenRouterProvider(api_key=api_key, **cache_kwargs)
     elif provider_name == "xai":
         from sea_turtle.llm.xai import XAIProvider
-        return XAIProvider(api_key=api_key)
+        return XAIProvider(api_key=api_key, **cache_kwargs)
     elif provider_name == "codex":
         from sea_turtle.llm.codex import CodexProvider
         agent_codex_cfg = (agent_config or {}).get("codex", {})
@@ -439,7 +445,7 @@ def _map_agent_sandbox_to_codex(agent_sandbox: str | None) -> str | None:
 class AgentWorker:
     """Agent worker that runs the LLM conversation loop.
 
-    Communicates with the daemon via multiprocessing Queues.
+    Receives from the daemon on a multiprocessing Queue and replies on an Outbox pipe.
     """
 
     def __init__(
@@ -447,7 +453,7 @@ class AgentWorker:
         agent_id: str,
         config: dict,
         inbox: Queue,
-        outbox: Queue,
+        outbox: "Outbox",
     ):
         self.agent_id = agent_id
         self.config = config
@@ -471,6 +477,8 @@ class AgentWorker:
         self._total_processing_time_ms = 0
         self._last_processing_time_ms = 0
         self._active_request_context: dict[str, Any] = {}
+        # When the provider last finished a request; None until its first one.
+        self._llm_idle_since: float | None = None
 
     def _conversation_id(
         self,
@@ -954,14 +962,26 @@ class AgentWorker:
                 workspace=self.workspace,
                 agent_config=self.agent_config,
             )
+            self._llm_idle_since = None
 
         # Get context for this channel
         conversation_id, context = self._get_context(source, chat_id, user_id, guild_id)
 
-        # Build system prompt
-        rules_content = load_rules(self.workspace)
-        skills_content = load_skills(self.workspace, source)
-        memory_content = self.memory.read()
+        # Build system prompt; workspace files are read off the loop so a new
+        # or idle provider can open its connection in the meantime.
+        warm_up = None
+        if self._llm_idle_since is None or time.monotonic() - self._llm_idle_since > WARM_UP_IDLE_SECONDS:
+            warm_up = asyncio.create_task(self.llm.warm_up())
+        try:
+            rules_content, skills_content, memory_content = await asyncio.gather(
+                asyncio.to_thread(load_rules, self.workspace),
+                asyncio.to_thread(load_skills, self.workspace, source),
+                asyncio.to_thread(self.memory.read),
+            )
+        except BaseException:
+            if warm_up is not None:
+                warm_up.cancel()
+            raise
         system_prompt = build_system_prompt(
             agent_id=self.agent_id,
             agent_config=self.agent_config,
@@ -983,6 +1003,9 @@ class AgentWorker:
             if Path(path).suffix.lower() in IMAGE_ATTACHMENT_SUFFIXES
         ]
         context.add_message("user", user_content, attachments=attachments)
+        if warm_up is not None:
+            # Let the request reuse the warmed connection instead of racing it.
+            await warm_up
 
         # Check if compression needed
         if context.needs_compression():
@@ -1017,6 +1040,7 @@ class AgentWorker:
                         "image_paths": image_attachments,
                     },
                 )
+                self._llm_idle_since = time.monotonic()
 
                 # Record token usage
                 self.token_counter.record(self.model, response.input_tokens, response.output_tokens)
@@ -1271,6 +1295,7 @@ class AgentWorker:
                 self.logger.error(f"Agent worker error: {e}", exc_info=True)
 
         self._running = False
+        self.token_counter.close()
         self.logger.info(f"Agent worker '{self.agent_id}' stopped")
 
     def stop(self) -> None:
@@ -1278,7 +1303,7 @@ class AgentWorker:
         self._running = False
 
 
-def run_agent_worker(agent_id: str, config: dict, inbox: Queue, outbox: Queue) -> None:
+def run_agent_worker(agent_id: str, config: dict, inbox: Queue, outbox: "Outbox") -> None:
     """Entry point for agent child process.
 
     This function is called by multiprocessing.Process.
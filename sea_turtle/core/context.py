@@ -7,6 +7,12 @@ from typing import Any
 
 logger = logging.getLogger("sea_turtle.context")
 
+SUMMARY_PROMPT_HEADER = (
+    "Summarize the following conversation concisely, preserving key facts, "
+    "decisions, and context that would be needed to continue the conversation. "
+    "Focus on: user requests, important results, pending items, and any commitments made.\n\n"
+)
+
 
 class ContextManager:
     """Manage conversation history with automatic compression.
@@ -91,13 +97,9 @@ class ContextManager:
         old_messages = self.messages[:split_point]
         recent_messages = self.messages[split_point:]
 
-        summary_prompt = (
-            "Summarize the following conversation concisely, preserving key facts, "
-            "decisions, and context that would be needed to continue the conversation. "
-            "Focus on: user requests, important results, pending items, and any commitments made.\n\n"
-        )
-        for msg in old_messages:
-            summary_prompt += f"**{msg['role']}**: {msg['content'][:500]}\n\n"
+        parts = [SUMMARY_PROMPT_HEADER]
+        parts.extend(f"**{msg['role']}**: {msg['content'][:500]}\n\n" for msg in old_messages)
+        summary_prompt = "".join(parts)
 
         try:
             from sea_turtle.llm.base import LLMResponse
@@ -1,12 +1,91 @@
 """Scheduler tick loop for agent-scoped recurring jobs and heartbeat."""
 
 import asyncio
+import heapq
+import itertools
 import logging
+import time
 from typing import Callable, Awaitable
 
 logger = logging.getLogger("sea_turtle.heartbeat")
 
 
+class HeartbeatScheduler:
+    """Single timer loop shared by every heartbeat in the process.
+
+    Due checks are kept in a min-heap of ``(next_run_ts, seq, heartbeat)`` and
+    one task sleeps until the earliest entry is due, instead of each agent
+    owning its own always-sleeping task.
+    """
+
+    def __init__(self):
+        self._heap: list[tuple[float, int, "Heartbeat"]] = []
+        self._seq = itertools.count()
+        self._task: asyncio.Task | None = None
+        self._wakeup: asyncio.Event | None = None
+
+    def register(self, heartbeat: "Heartbeat", delay: float = 0.0) -> None:
+        """Schedule a heartbeat's first check ``delay`` seconds from now."""
+        self._push(heartbeat, time.monotonic() + delay)
+        self._ensure_loop()
+        self._wakeup.set()
+
+    def unregister(self, heartbeat: "Heartbeat") -> None:
+        """Drop a heartbeat; its pending heap entry is discarded lazily."""
+        heartbeat._due_at = None
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _push(self, heartbeat: "Heartbeat", due_at: float) -> None:
+        heartbeat._due_at = due_at
+        heapq.heappush(self._heap, (due_at, next(self._seq), heartbeat))
+
+    def _ensure_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._task is not None and not self._task.done() and self._task.get_loop() is loop:
+            return
+        self._wakeup = asyncio.Event()
+        self._task = loop.create_task(self._loop())
+
+    def _discard_stale(self) -> None:
+        while self._heap:
+            due_at, _, heartbeat = self._heap[0]
+            if heartbeat._due_at == due_at:
+                return
+            heapq.heappop(self._heap)
+
+    async def _loop(self) -> None:
+        """Sleep until the next due heartbeat, run it, and reschedule it."""
+        while True:
+            self._discard_stale()
+            if not self._heap:
+                break
+            due_at, _, heartbeat = self._heap[0]
+            delay = due_at - time.monotonic()
+            if delay > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(self._heap)
+            try:
+                await heartbeat._check()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Heartbeat error for agent '{heartbeat.agent_id}': {e}")
+
+            if heartbeat._due_at == due_at:
+                self._push(heartbeat, time.monotonic() + heartbeat.interval)
+        self._task = None
+
+
+_scheduler = HeartbeatScheduler()
+
+
 class Heartbeat:
     """Periodically check agent schedules and dispatch due jobs."""
 
@@ -31,43 +110,26 @@ class Heartbeat:
         self.interval = interval
         self.on_tasks_found = on_tasks_found
         self._running = False
-        self._task: asyncio.Task | None = None
+        self._due_at: float | None = None
 
-    async def start(self) -> None:
-        """Start the heartbeat loop."""
+    async def start(self, delay: float = 0.0) -> None:
+        """Register the heartbeat with the shared scheduler.
+
+        Args:
+            delay: Seconds to wait before the first check.
+        """
         if self._running:
             return
         self._running = True
-        self._task = asyncio.create_task(self._loop())
+        _scheduler.register(self, delay)
         logger.info(f"Heartbeat started for agent '{self.agent_id}' (interval: {self.interval}s)")
 
     async def stop(self) -> None:
-        """Stop the heartbeat loop."""
+        """Remove the heartbeat from the shared scheduler."""
         self._running = False
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
-            self._task = None
+        _scheduler.unregister(self)
         logger.info(f"Heartbeat stopped for agent '{self.agent_id}'")
 
-    async def _loop(self) -> None:
-        """Main heartbeat loop."""
-        while self._running:
-            try:
-                await self._check()
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Heartbeat error for agent '{self.agent_id}': {e}")
-
-            try:
-                await asyncio.sleep(self.interval)
-            except asyncio.CancelledError:
-                break
-
     async def _check(self) -> None:
         """Run one scheduler tick."""
         if self.on_tasks_found:
@@ -152,27 +152,21 @@ class ShellExecutor:
             Path(self.history_file).parent.mkdir(parents=True, exist_ok=True)
 
             timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
-            entry_lines = [f"[{timestamp}] $ {result.command}"]
-            entry_lines.append(f"exit_code: {result.exit_code}")
-
             if result.blocked:
-                entry_lines.append(f"blocked: {result.stderr}")
+                detail = f"blocked: {result.stderr}\n"
             elif result.needs_confirmation:
-                entry_lines.append("status: needs_confirmation")
+                detail = "status: needs_confirmation\n"
             elif self.history_record_output:
-                if result.stdout:
-                    truncated = result.stdout[:self.history_output_max]
-                    entry_lines.append(f"stdout: {truncated}")
-                if result.stderr:
-                    truncated = result.stderr[:self.history_output_max]
-                    entry_lines.append(f"stderr: {truncated}")
-
-            entry_lines.append("---")
-            entry = "\n".join(entry_lines) + "\n"
-
-            # Append to history file
-            with open(self.history_file, "a", encoding="utf-8") as f:
-                f.write(entry)
+                stdout = f"stdout: {result.stdout[:self.history_output_max]}\n" if result.stdout else ""
+                stderr = f"stderr: {result.stderr[:self.history_output_max]}\n" if result.stderr else ""
+                detail = stdout + stderr
+            else:
+                detail = ""
+            entry = f"[{timestamp}] $ {result.command}\nexit_code: {result.exit_code}\n{detail}---\n"
+
+            # Append to history file as one pre-encoded write
+            with open(self.history_file, "ab") as f:
+                f.write(entry.encode("utf-8"))
 
             # Truncate if file too large
             self._truncate_history_if_needed()
@@ -1,13 +1,105 @@
 """Token usage tracking and billing."""
 
+import atexit
+import copy
 import json
+import logging
+import mmap
 import os
+import threading
+import time
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 from sea_turtle.llm.registry import get_pricing
 
+logger = logging.getLogger("sea_turtle.token_counter")
+
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib encoder
+    orjson = None
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def entry_time(entry: dict[str, Any]) -> datetime | None:
+    """Return the UTC time of a usage log entry.
+
+    Entries store ``ts`` as integer nanoseconds since the epoch; older logs
+    carry an ISO-8601 ``timestamp`` string instead.
+    """
+    ts = entry.get("ts")
+    if isinstance(ts, int):
+        return datetime.fromtimestamp(ts / 1e9, tz=timezone.utc)
+    legacy = entry.get("timestamp")
+    if isinstance(legacy, str):
+        try:
+            return datetime.fromisoformat(legacy)
+        except ValueError:
+            return None
+    return None
+
+
+# Fixed-schema JSONL record; ``ts`` is time.time_ns(), string fields are
+# pre-encoded JSON literals (quotes included) and the cost uses repr() to keep
+# full float precision.
+LOG_ENTRY_FMT = (
+    b'{"ts":%d,"agent_id":%b,"model":%b,'
+    b'"input_tokens":%d,"output_tokens":%d,"cost_usd":%r}\n'
+)
+
+
+def _empty_totals() -> dict[str, Any]:
+    return {
+        "input_tokens": 0,
+        "output_tokens": 0,
+        "cost_usd": 0.0,
+        "requests": 0,
+        "by_model": {},
+    }
+
+
+def _accumulate(totals: dict[str, Any], entry: dict[str, Any]) -> None:
+    """Add one log entry to an aggregate totals dict."""
+    input_tokens = entry.get("input_tokens", 0)
+    output_tokens = entry.get("output_tokens", 0)
+    cost = entry.get("cost_usd", 0.0)
+    totals["input_tokens"] += input_tokens
+    totals["output_tokens"] += output_tokens
+    totals["cost_usd"] += cost
+    totals["requests"] += 1
+
+    model = entry.get("model", "unknown")
+    stats = totals["by_model"].get(model)
+    if stats is None:
+        stats = totals["by_model"][model] = {
+            "input_tokens": 0, "output_tokens": 0,
+            "cost_usd": 0.0, "requests": 0,
+        }
+    stats["input_tokens"] += input_tokens
+    stats["output_tokens"] += output_tokens
+    stats["cost_usd"] += cost
+    stats["requests"] += 1
+
+
+@dataclass(slots=True)
+class _Usage:
+    """Running usage totals for the current session."""
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: float = 0.0
+    requests: int = 0
+
 
 class TokenCounter:
     """Track token usage and calculate costs per agent."""
@@ -19,13 +111,22 @@ class TokenCounter:
         self.log_file = os.path.join(
             str(Path(data_dir).expanduser()), "agents", agent_id, "token_usage.json"
         )
+        self.totals_file = os.path.join(os.path.dirname(self.log_file), "token_usage.totals.json")
         self.agent_id = agent_id
-        self._session_usage: dict[str, Any] = {
-            "input_tokens": 0,
-            "output_tokens": 0,
-            "cost_usd": 0.0,
-            "requests": 0,
-        }
+        self._checkpoint: dict[str, Any] | None = None
+        self._pricing_cache: dict[str, tuple[float, float] | None] = {}
+        self._agent_id_json = json.dumps(agent_id).encode("utf-8")
+        self._model_json: dict[str, bytes] = {}
+        self._log_fd: int | None = None
+        self._lock = threading.Lock()
+        self._session_usage = _Usage()
+        self._log_ok = self.enabled
+        if self._log_ok:
+            try:
+                Path(self.log_file).parent.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                self._log_ok = False
+                logger.warning(f"Token usage log directory unavailable for '{agent_id}': {e}")
 
     def record(self, model: str, input_tokens: int, output_tokens: int) -> float:
         """Record token usage for a single API call.
@@ -42,63 +143,116 @@ class TokenCounter:
             return 0.0
 
         cost = 0.0
-        pricing = get_pricing(model)
+        if model in self._pricing_cache:
+            pricing = self._pricing_cache[model]
+        else:
+            pricing = self._pricing_cache[model] = get_pricing(model)
         if pricing:
             input_price, output_price = pricing
             cost = (input_tokens / 1_000_000 * input_price) + (output_tokens / 1_000_000 * output_price)
 
-        self._session_usage["input_tokens"] += input_tokens
-        self._session_usage["output_tokens"] += output_tokens
-        self._session_usage["cost_usd"] += cost
-        self._session_usage["requests"] += 1
+        usage = self._session_usage
+        usage.input_tokens += input_tokens
+        usage.output_tokens += output_tokens
+        usage.cost_usd += cost
+        usage.requests += 1
 
         self._append_to_log(model, input_tokens, output_tokens, cost)
         return cost
 
     def get_session_usage(self) -> dict[str, Any]:
         """Get usage stats for the current session."""
-        return dict(self._session_usage)
+        return asdict(self._session_usage)
 
     def get_total_usage(self) -> dict[str, Any]:
-        """Get total usage from the log file."""
-        totals = {
-            "input_tokens": 0,
-            "output_tokens": 0,
-            "cost_usd": 0.0,
-            "requests": 0,
-            "by_model": {},
-        }
+        """Get total usage from the log file.
 
+        Aggregates are checkpointed to ``totals_file`` together with the byte
+        offset they cover, so each call only parses entries appended since.
+        """
+        checkpoint = self._load_checkpoint()
         try:
-            if os.path.exists(self.log_file):
-                with open(self.log_file, "r", encoding="utf-8") as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        try:
-                            entry = json.loads(line)
-                            totals["input_tokens"] += entry.get("input_tokens", 0)
-                            totals["output_tokens"] += entry.get("output_tokens", 0)
-                            totals["cost_usd"] += entry.get("cost_usd", 0.0)
-                            totals["requests"] += 1
-
-                            model = entry.get("model", "unknown")
-                            if model not in totals["by_model"]:
-                                totals["by_model"][model] = {
-                                    "input_tokens": 0, "output_tokens": 0,
-                                    "cost_usd": 0.0, "requests": 0,
-                                }
-                            totals["by_model"][model]["input_tokens"] += entry.get("input_tokens", 0)
-                            totals["by_model"][model]["output_tokens"] += entry.get("output_tokens", 0)
-                            totals["by_model"][model]["cost_usd"] += entry.get("cost_usd", 0.0)
-                            totals["by_model"][model]["requests"] += 1
-                        except json.JSONDecodeError:
-                            continue
-        except Exception:
-            pass
-
-        return totals
+            size = os.path.getsize(self.log_file)
+        except OSError:
+            return _empty_totals()
+
+        if size < checkpoint["byte_offset"]:
+            # Log was truncated or replaced; start over.
+            checkpoint = {"byte_offset": 0, "totals": _empty_totals()}
+
+        if size > checkpoint["byte_offset"]:
+            try:
+                consumed = self._scan_log(checkpoint["totals"], checkpoint["byte_offset"], size)
+            except (OSError, ValueError):
+                consumed = 0
+            if consumed:
+                checkpoint["byte_offset"] += consumed
+                self._save_checkpoint(checkpoint)
+
+        self._checkpoint = checkpoint
+        return copy.deepcopy(checkpoint["totals"])
+
+    def _scan_log(self, totals: dict[str, Any], start: int, size: int) -> int:
+        """Accumulate log entries in ``[start, size)`` into ``totals``.
+
+        The log is memory-mapped so pages are loaded on demand. Only complete
+        lines are consumed; a partial trailing write is picked up next time.
+
+        Returns:
+            Number of bytes consumed.
+        """
+        fd = os.open(self.log_file, os.O_RDONLY)
+        try:
+            with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mm:
+                end = mm.rfind(b"\n", start, size) + 1
+                pos = start
+                while pos < end:
+                    nl = mm.find(b"\n", pos, end)
+                    line = mm[pos:nl].strip()
+                    pos = nl + 1
+                    if not line:
+                        continue
+                    try:
+                        _accumulate(totals, _loads(line))
+                    except (json.JSONDecodeError, AttributeError, TypeError):
+                        continue
+        finally:
+            os.close(fd)
+        return max(end - start, 0)
+
+    def _load_checkpoint(self) -> dict[str, Any]:
+        """Return the cached totals checkpoint, reading the sidecar file once."""
+        if self._checkpoint is not None:
+            return self._checkpoint
+        checkpoint = {"byte_offset": 0, "totals": _empty_totals()}
+        try:
+            with open(self.totals_file, "rb") as f:
+                raw = _loads(f.read())
+        except (OSError, json.JSONDecodeError):
+            raw = None
+        if (
+            isinstance(raw, dict)
+            and isinstance(raw.get("byte_offset"), int)
+            and raw["byte_offset"] >= 0
+            and isinstance(raw.get("totals"), dict)
+            and isinstance(raw["totals"].get("by_model"), dict)
+        ):
+            checkpoint = raw
+        self._checkpoint = checkpoint
+        return checkpoint
+
+    def _save_checkpoint(self, checkpoint: dict[str, Any]) -> None:
+        """Atomically persist the totals checkpoint next to the log."""
+        tmp_path = f"{self.totals_file}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(_dumps(checkpoint))
+            os.replace(tmp_path, self.totals_file)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
 
     def format_usage(self, usage: dict[str, Any]) -> str:
         """Format usage stats for display.
@@ -131,17 +285,47 @@ class TokenCounter:
 
     def _append_to_log(self, model: str, input_tokens: int, output_tokens: int, cost: float) -> None:
         """Append a usage entry to the JSONL log file."""
+        if not self._log_ok:
+            return
+        model_b = self._model_json.get(model)
+        if model_b is None:
+            model_b = self._model_json[model] = json.dumps(model).encode("utf-8")
+        line = LOG_ENTRY_FMT % (
+            time.time_ns(),
+            self._agent_id_json,
+            model_b,
+            input_tokens,
+            output_tokens,
+            cost,
+        )
         try:
-            Path(self.log_file).parent.mkdir(parents=True, exist_ok=True)
-            entry = {
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "agent_id": self.agent_id,
-                "model": model,
-                "input_tokens": input_tokens,
-                "output_tokens": output_tokens,
-                "cost_usd": cost,
-            }
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(entry) + "\n")
-        except Exception:
-            pass
+            # One write() per record on an O_APPEND descriptor lands each line
+            # whole, even with other processes appending to the same file.
+            os.write(self._open_log(), line)
+        except OSError as e:
+            # Stop logging for this session rather than failing every call.
+            self._log_ok = False
+            logger.warning(f"Disabling token usage log {self.log_file}: {e}")
+
+    def _open_log(self) -> int:
+        fd = self._log_fd
+        if fd is None:
+            with self._lock:
+                if self._log_fd is None:
+                    self._log_fd = os.open(
+                        self.log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+                    )
+                    atexit.register(self.close)
+                fd = self._log_fd
+        return fd
+
+    def close(self) -> None:
+        """Close the log file descriptor."""
+        with self._lock:
+            if self._log_fd is not None:
+                try:
+                    os.close(self._log_fd)
+                except OSError:
+                    pass
+                self._log_fd = None
+                atexit.unregister(self.close)
@@ -5,14 +5,18 @@ import json
 import logging
 import math
 import os
+import selectors
 import signal
 import sys
+import threading
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import cached_property
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 from sea_turtle.config.loader import load_config, get_agent_config, save_config
-from sea_turtle.core.agent import AgentManager
+from sea_turtle.core.agent import AgentHandle, AgentManager
 from sea_turtle.core.heartbeat import Heartbeat
 from sea_turtle.core.memory import MemoryManager
 from sea_turtle.core.jobs import (
@@ -78,6 +82,22 @@ def _format_ms(elapsed_ms: float | int | None) -> str:
     return f"{minutes}m {remaining:.1f}s"
 
 
+@dataclass(frozen=True)
+class CommandContext:
+    """Where a /command came from, plus its unparsed arguments."""
+    agent_id: str
+    source: str
+    chat_id: Any = None
+    user_id: Any = None
+    guild_id: Any = None
+    arg_text: str = ""
+
+    @cached_property
+    def args(self) -> list[str]:
+        """Whitespace-separated arguments, split on first use."""
+        return self.arg_text.split()
+
+
 class Daemon:
     """Main daemon process.
 
@@ -95,12 +115,35 @@ class Daemon:
         self.agent_manager = AgentManager(config)
         self.heartbeats: dict[str, Heartbeat] = {}
         self._running = False
+        self._stop_event = asyncio.Event()
         self._reply_task: asyncio.Task | None = None
+        self._reply_queue: asyncio.Queue | None = None
+        self._outbox_wakeup: tuple[int, int] | None = None
+        self._outbox_wakeup_lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
         self._health_task: asyncio.Task | None = None
         self._channel_tasks: list[asyncio.Task] = []
         self._telegram_channel = None
         self._discord_channel = None
         self._pending_requests: dict[str, asyncio.Future] = {}
+        self._token_counters: dict[str, TokenCounter] = {}
+        self._cmd_table: dict[str, Callable[[CommandContext], Awaitable[str]]] = {
+            "/start": self._cmd_start,
+            "/help": self._cmd_help,
+            "/reset": self._cmd_reset,
+            "/context": self._cmd_context,
+            "/prompt": self._cmd_prompt,
+            "/heartbeat": self._cmd_heartbeat,
+            "/job": self._cmd_job,
+            "/job_cancel": self._cmd_job_cancel,
+            "/tasks": self._cmd_schedules,
+            "/schedules": self._cmd_schedules,
+            "/restart": self._cmd_restart,
+            "/usage": self._cmd_usage,
+            "/status": self._cmd_status,
+            "/model": self._cmd_model,
+            "/effort": self._cmd_effort,
+        }
 
         global logger
         logger = get_daemon_logger(config)
@@ -114,6 +157,13 @@ class Daemon:
         owners = channel_cfg.get("owner_user_ids") or global_cfg.get("default_owner_ids", [])
         return int(user_id) in [int(owner) for owner in owners]
 
+    def _get_token_counter(self, agent_id: str) -> TokenCounter:
+        """Return the cached usage reader for an agent, creating it on first use."""
+        counter = self._token_counters.get(agent_id)
+        if counter is None:
+            counter = self._token_counters[agent_id] = TokenCounter(self.config, agent_id)
+        return counter
+
     def _build_current_system_prompt(self, agent_id: str, source: str) -> str:
         agent_cfg = get_agent_config(self.config, agent_id) or {}
         workspace = agent_cfg.get("workspace", f"~/.sea_turtle/agents/{agent_id}")
@@ -403,6 +453,14 @@ class Daemon:
         # Write PID file
         self._write_pid()
 
+        # Bridge agent outboxes into the event loop as agents start
+        self._loop = asyncio.get_running_loop()
+        self._reply_queue = asyncio.Queue()
+        self._outbox_wakeup = os.pipe()
+        os.set_blocking(self._outbox_wakeup[1], False)
+        threading.Thread(target=self._pump_outboxes, name="outbox-pump", daemon=True).start()
+        self.agent_manager.on_agent_started = self._watch_outbox
+
         # Start all configured agents
         self.agent_manager.start_all()
 
@@ -410,7 +468,11 @@ class Daemon:
         heartbeat_cfg = self.config.get("heartbeat", {})
         if heartbeat_cfg.get("enabled", True):
             scheduler_tick_seconds = min(int(heartbeat_cfg.get("interval_seconds", 300)), 30)
-            for agent_id, agent_cfg in self.config.get("agents", {}).items():
+            agents = self.config.get("agents", {})
+            # All heartbeats share one scheduler loop; stagger first ticks across
+            # one interval so agents don't all wake at the same instant.
+            stagger = scheduler_tick_seconds / max(len(agents), 1)
+            for index, (agent_id, agent_cfg) in enumerate(agents.items()):
                 workspace = str(Path(agent_cfg.get("workspace", f"~/.sea_turtle/agents/{agent_id}")).expanduser().resolve())
                 hb = Heartbeat(
                     agent_id=agent_id,
@@ -419,7 +481,7 @@ class Daemon:
                     on_tasks_found=self._on_tasks_found,
                 )
                 self.heartbeats[agent_id] = hb
-                await hb.start()
+                await hb.start(delay=index * stagger)
 
         # Start reply dispatcher
         self._reply_task = asyncio.create_task(self._dispatch_replies())
@@ -437,9 +499,8 @@ class Daemon:
         for sig in (signal.SIGINT, signal.SIGTERM):
             loop.add_signal_handler(sig, lambda: asyncio.create_task(self.stop()))
 
-        # Keep running
-        while self._running:
-            await asyncio.sleep(1)
+        # Keep running until stop() signals shutdown
+        await self._stop_event.wait()
 
     async def stop(self) -> None:
         """Stop the daemon gracefully."""
@@ -447,38 +508,42 @@ class Daemon:
             return
         self._running = False
         logger.info("Sea Turtle daemon stopping...")
+        try:
+            # Stop channels
+            if self._telegram_channel:
+                try:
+                    await self._telegram_channel.stop()
+                except Exception as e:
+                    logger.error(f"Error stopping Telegram channel: {e}")
+            if self._discord_channel:
+                try:
+                    await self._discord_channel.stop()
+                except Exception as e:
+                    logger.error(f"Error stopping Discord channel: {e}")
+            for task in self._channel_tasks:
+                task.cancel()
 
-        # Stop channels
-        if self._telegram_channel:
-            try:
-                await self._telegram_channel.stop()
-            except Exception as e:
-                logger.error(f"Error stopping Telegram channel: {e}")
-        if self._discord_channel:
-            try:
-                await self._discord_channel.stop()
-            except Exception as e:
-                logger.error(f"Error stopping Discord channel: {e}")
-        for task in self._channel_tasks:
-            task.cancel()
-
-        # Stop heartbeats
-        for hb in self.heartbeats.values():
-            await hb.stop()
+            # Stop heartbeats
+            for hb in self.heartbeats.values():
+                await hb.stop()
 
-        # Stop reply dispatcher
-        if self._reply_task:
-            self._reply_task.cancel()
-        if self._health_task:
-            self._health_task.cancel()
+            # Stop reply dispatcher
+            self._wake_outbox_pump()
+            if self._reply_task:
+                self._reply_task.cancel()
+            if self._health_task:
+                self._health_task.cancel()
 
-        # Stop all agents
-        self.agent_manager.stop_all()
+            # Stop all agents
+            self.agent_manager.stop_all()
 
-        # Remove PID file
-        self._remove_pid()
+            # Remove PID file
+            self._remove_pid()
 
-        logger.info("Sea Turtle daemon stopped")
+            logger.info("Sea Turtle daemon stopped")
+        finally:
+            # start() waits on this; never leave it unset.
+            self._stop_event.set()
 
     async def handle_system_command(
         self, command: str, agent_id: str, source: str = "telegram",
@@ -498,333 +563,359 @@ class Daemon:
         Returns:
             Response string.
         """
-        parts = command.strip().split()
-        cmd = parts[0].lower() if parts else ""
-
-        if cmd == "/start":
-            agent_cfg = get_agent_config(self.config, agent_id)
-            name = agent_cfg.get("name", "Turtle") if agent_cfg else "Turtle"
-            return f"🐢 Welcome! I'm {name}, your personal AI assistant.\nType /help for available commands."
-
-        elif cmd == "/help":
-            if source == "discord":
-                return (
-                    "🐢 Sea Turtle Discord Commands:\n"
-                    "/sys_help — Show available commands\n"
-                    "/sys_context — Show context stats\n"
-                    "/sys_prompt — Show current final system prompt (owner only)\n"
-                    "/sys_heartbeat — Show heartbeat status\n"
-                    "/sys_job — Show current background job status\n"
-                    "/sys_job_cancel — Cancel the current background job\n"
-                    "/sys_schedules — Show recent schedules\n"
-                    "/sys_usage — Show token usage & costs\n"
-                    "/sys_status — Show agent status\n"
-                    "/sys_model — List or switch models\n"
-                    "/effort list — List Codex reasoning efforts\n"
-                    "/effort [minimal|low|medium|high|xhigh] — Show or set Codex reasoning effort"
-                )
+        # Only the command name is split off here; handlers that take
+        # arguments parse them from the rest on demand (CommandContext.args).
+        head = command.split(maxsplit=1)
+        cmd = head[0].lower() if head else ""
+
+        handler = self._cmd_table.get(cmd)
+        if handler is None:
+            return f"Unknown command: {cmd}. Type /help for available commands."
+        return await handler(CommandContext(
+            agent_id=agent_id,
+            source=source,
+            chat_id=chat_id,
+            user_id=user_id,
+            guild_id=guild_id,
+            arg_text=head[1] if len(head) > 1 else "",
+        ))
+
+    async def _cmd_start(self, ctx: CommandContext) -> str:
+        """/start — greet the user."""
+        agent_cfg = get_agent_config(self.config, ctx.agent_id)
+        name = agent_cfg.get("name", "Turtle") if agent_cfg else "Turtle"
+        return f"🐢 Welcome! I'm {name}, your personal AI assistant.\nType /help for available commands."
+
+    async def _cmd_help(self, ctx: CommandContext) -> str:
+        """/help — list available commands."""
+        if ctx.source == "discord":
             return (
-                "🐢 Sea Turtle Commands:\n"
-                "/reset — Reset conversation context\n"
-                "/context — Show context stats\n"
-                "/prompt — Show current final system prompt (owner only)\n"
-                "/heartbeat — Show heartbeat status and latest result\n"
-                "/schedules — Show recent schedules\n"
-                "/tasks — Alias of /schedules\n"
-                "/restart — Restart agent process\n"
-                "/usage — Show token usage & costs\n"
-                "/status — Show agent status\n"
-                "/model list [provider] — List available models\n"
-                "/model <name> — Switch model\n"
+                "🐢 Sea Turtle Discord Commands:\n"
+                "/sys_help — Show available commands\n"
+                "/sys_context — Show context stats\n"
+                "/sys_prompt — Show current final system prompt (owner only)\n"
+                "/sys_heartbeat — Show heartbeat status\n"
+                "/sys_job — Show current background job status\n"
+                "/sys_job_cancel — Cancel the current background job\n"
+                "/sys_schedules — Show recent schedules\n"
+                "/sys_usage — Show token usage & costs\n"
+                "/sys_status — Show agent status\n"
+                "/sys_model — List or switch models\n"
                 "/effort list — List Codex reasoning efforts\n"
-                "/effort [minimal|low|medium|high|xhigh] — Show or set Codex reasoning effort\n"
-                "/help — Show this help"
-            )
-
-        elif cmd == "/reset":
-            handle = self.agent_manager.get_handle(agent_id)
-            if handle and handle.is_alive:
-                self.agent_manager.send_message(agent_id, {
-                    "type": "reset_context",
-                    "source": source,
-                    "chat_id": chat_id,
-                    "user_id": user_id,
-                    "guild_id": guild_id,
-                })
-                return f"✅ Context reset for {source}."
-            return "⚠️ Agent is not running."
-
-        elif cmd == "/context":
-            handle = self.agent_manager.get_handle(agent_id)
-            if handle and handle.is_alive:
-                import uuid
-                req_id = str(uuid.uuid4())
-                future = asyncio.get_event_loop().create_future()
-                self._pending_requests[req_id] = future
-                self.agent_manager.send_message(agent_id, {
-                    "type": "get_stats",
-                    "request_id": req_id,
-                    "source": source,
-                    "chat_id": chat_id,
-                    "user_id": user_id,
-                    "guild_id": guild_id,
-                })
-                try:
-                    resp = await asyncio.wait_for(future, timeout=10.0)
-                    data = resp["data"]
-                    ctx = data.get("context", {})
-                    agent_cfg = get_agent_config(self.config, agent_id) or {}
-                    provider = resolve_provider(
-                        data.get("model", agent_cfg.get("model", self.config.get("llm", {}).get("default_model", ""))),
-                        self.config.get("llm", {}).get("default_provider", "google"),
-                    )
-                    effort_line = ""
-                    if provider == "codex":
-                        effort = (
-                            agent_cfg.get("codex", {}).get("reasoning_effort")
-                            or self.config.get("llm", {}).get("providers", {}).get("codex", {}).get("reasoning_effort", "medium")
-                        )
-                        effort_line = f"\n  Reasoning Effort: {effort}"
-                    display_model = get_display_model_name(str(data.get("model", "?")))
-                    session_id = str(data.get("session_id") or "n/a")
-                    return (
-                        f"📊 Context Stats:\n"
-                        f"  Session ID: {session_id}\n"
-                        f"  Model: {display_model}\n"
-                        f"  Provider: {provider}{effort_line}\n"
-                        f"  Messages: {ctx.get('message_count', 0)}\n"
-                        f"  Requests: {ctx.get('request_count', 0)}\n"
-                        f"  Last Reply: {_format_ms(ctx.get('last_response_time_ms', 0))}\n"
-                        f"  Avg Reply: {_format_ms(ctx.get('avg_response_time_ms', 0))}\n"
-                        f"  System Prompt: ~{ctx.get('system_prompt_tokens', 0):,} tokens\n"
-                        f"  Conversation: ~{ctx.get('message_tokens', 0):,} tokens\n"
-                        f"  Total: ~{ctx.get('estimated_tokens', 0):,} / {ctx.get('max_tokens', 0):,} ({ctx.get('usage_ratio', 0):.1%})\n"
-                        f"  Compressions: {ctx.get('compression_count', 0)}"
-                    )
-                except asyncio.TimeoutError:
-                    return "⚠️ Timeout waiting for stats."
-                finally:
-                    self._pending_requests.pop(req_id, None)
-            return "⚠️ Agent is not running."
-
-        elif cmd == "/prompt":
-            if not self._is_owner_user(agent_id, source, user_id):
-                return "⛔ Owner permission required."
-            prompt = self._build_current_system_prompt(agent_id, source)
-            export_path = self._write_prompt_export(agent_id, source, prompt)
-            return (
-                f"📜 Final system prompt export for `{source}`.\n"
-                f"ATTACH: {export_path}"
+                "/effort [minimal|low|medium|high|xhigh] — Show or set Codex reasoning effort"
             )
+        return (
+            "🐢 Sea Turtle Commands:\n"
+            "/reset — Reset conversation context\n"
+            "/context — Show context stats\n"
+            "/prompt — Show current final system prompt (owner only)\n"
+            "/heartbeat — Show heartbeat status and latest result\n"
+            "/schedules — Show recent schedules\n"
+            "/tasks — Alias of /schedules\n"
+            "/restart — Restart agent process\n"
+            "/usage — Show token usage & costs\n"
+            "/status — Show agent status\n"
+            "/model list [provider] — List available models\n"
+            "/model <name> — Switch model\n"
+            "/effort list — List Codex reasoning efforts\n"
+            "/effort [minimal|low|medium|high|xhigh] — Show or set Codex reasoning effort\n"
+            "/help — Show this help"
+        )
 
-        elif cmd == "/heartbeat":
-            workspace = (get_agent_config(self.config, agent_id) or {}).get("workspace", f"~/.sea_turtle/agents/{agent_id}")
-            heartbeat = load_heartbeat_data(workspace)
-            last_run_at = (heartbeat.get("last_run_at") or "").replace("T", " ")
-            last_result = str(heartbeat.get("last_result") or "").strip()
-            lines = [
-                "🫀 Heartbeat:",
-                f"- Status: {'enabled' if heartbeat.get('enabled') else 'disabled'}",
-                f"- Interval: {heartbeat.get('interval_minutes', 60)} min",
-                f"- Running: {'yes' if heartbeat.get('is_running') else 'no'}",
-                f"- Run Count: {heartbeat.get('run_count', 0)}",
-            ]
-            if last_run_at:
-                lines.append(f"- Last Run: {last_run_at}")
-            if heartbeat.get("last_outcome"):
-                lines.append(f"- Last Outcome: {heartbeat.get('last_outcome')}")
-            if last_result:
-                lines.append(f"- Last Result: {last_result[:500]}")
-            return "\n".join(lines)
-
-        elif cmd == "/job":
-            if source != "discord":
-                return "🧩 后台任务入口仅在 Discord 提供。"
-            workspace = (get_agent_config(self.config, agent_id) or {}).get("workspace", f"~/.sea_turtle/agents/{agent_id}")
-            job = get_active_job(workspace)
-            if not job:
-                recent = list_recent_jobs(workspace, limit=1)
-                job = recent[0] if recent else None
-            return self._format_job_status(job or {})
-
-        elif cmd == "/job_cancel":
-            if source != "discord":
-                return "🧩 后台任务入口仅在 Discord 提供。"
-            workspace = (get_agent_config(self.config, agent_id) or {}).get("workspace", f"~/.sea_turtle/agents/{agent_id}")
-            job = get_active_job(workspace)
-            if not job:
-                return "🧩 当前没有可取消的后台任务。"
-            updated = request_job_cancel(workspace, str(job.get("id") or ""))
-            if not updated:
-                return "⚠️ 取消后台任务失败。"
-            if updated.get("status") == "cancelled":
-                return f"✅ 已取消后台任务 {updated.get('id')}。"
-            return f"⏸️ 已请求取消后台任务 {updated.get('id')}，会在当前步骤结束后停止。"
-
-        elif cmd in {"/tasks", "/schedules"}:
-            workspace = (get_agent_config(self.config, agent_id) or {}).get("workspace", f"~/.sea_turtle/agents/{agent_id}")
-            schedules = list_recent_schedules(workspace, limit=20)
-            if not schedules:
-                return "⏰ 最近没有定时作业。"
-            lines = ["⏰ Recent Schedules:"]
-            for schedule in schedules:
-                updated_at = (schedule.get("updated_at") or schedule.get("created_at") or "").replace("T", " ")
-                title = schedule.get("description", "").strip() or "(untitled)"
-                status = schedule.get("status", "enabled")
-                trigger = schedule.get("trigger", {})
-                trigger_text = (
-                    f"every {trigger.get('seconds')}s"
-                    if trigger.get("type") == "interval"
-                    else f"daily {trigger.get('time')} {trigger.get('timezone', 'UTC')}"
-                )
-                result = schedule.get("last_result", "").strip()
-                line = f"- [{status}] {schedule.get('id', '?')} {title} | {schedule.get('execution_type')} | {trigger_text}"
-                if updated_at:
-                    line += f" ({updated_at})"
-                lines.append(line)
-                if result:
-                    lines.append(f"  last: {result[:160]}")
-            return "\n".join(lines)
-
-        elif cmd == "/restart":
+    async def _cmd_reset(self, ctx: CommandContext) -> str:
+        """/reset — reset the conversation context."""
+        handle = self.agent_manager.get_handle(ctx.agent_id)
+        if handle and handle.is_alive:
+            self.agent_manager.send_message(ctx.agent_id, {
+                "type": "reset_context",
+                "source": ctx.source,
+                "chat_id": ctx.chat_id,
+                "user_id": ctx.user_id,
+                "guild_id": ctx.guild_id,
+            })
+            return f"✅ Context reset for {ctx.source}."
+        return "⚠️ Agent is not running."
+
+    async def _cmd_context(self, ctx: CommandContext) -> str:
+        """/context — show context stats from the agent."""
+        handle = self.agent_manager.get_handle(ctx.agent_id)
+        if handle and handle.is_alive:
+            import uuid
+            req_id = str(uuid.uuid4())
+            future = asyncio.get_event_loop().create_future()
+            self._pending_requests[req_id] = future
+            self.agent_manager.send_message(ctx.agent_id, {
+                "type": "get_stats",
+                "request_id": req_id,
+                "source": ctx.source,
+                "chat_id": ctx.chat_id,
+                "user_id": ctx.user_id,
+                "guild_id": ctx.guild_id,
+            })
             try:
-                self.agent_manager.restart_agent(agent_id)
-                return f"✅ Agent '{agent_id}' restarted."
-            except Exception as e:
-                return f"❌ Failed to restart: {e}"
-
-        elif cmd == "/usage":
-            counter = TokenCounter(self.config, agent_id)
-            total = counter.get_total_usage()
-            return counter.format_usage(total)
-
-        elif cmd == "/status":
-            handle = self.agent_manager.get_handle(agent_id)
-            if handle:
-                status = "🟢 Running" if handle.is_alive else "🔴 Stopped"
-                uptime_min = handle.uptime / 60
-                agent_cfg = get_agent_config(self.config, agent_id) or {}
-                workspace = agent_cfg.get("workspace", f"~/.sea_turtle/agents/{agent_id}")
-                heartbeat = load_heartbeat_data(workspace)
-                enabled_schedule_count = len(list_schedules(workspace, include_disabled=False))
-                active_job = get_active_job(workspace)
+                resp = await asyncio.wait_for(future, timeout=10.0)
+                data = resp["data"]
+                ctx = data.get("context", {})
+                agent_cfg = get_agent_config(self.config, ctx.agent_id) or {}
                 provider = resolve_provider(
-                    agent_cfg.get("model", self.config.get("llm", {}).get("default_model", "")),
+                    data.get("model", agent_cfg.get("model", self.config.get("llm", {}).get("default_model", ""))),
                     self.config.get("llm", {}).get("default_provider", "google"),
                 )
-                codex_cfg = agent_cfg.get("codex", {})
-                codex_lines = ""
+                effort_line = ""
                 if provider == "codex":
-                    codex_lines = (
-                        f"\n  Codex Sandbox: {codex_cfg.get('sandbox') or self.config.get('llm', {}).get('providers', {}).get('codex', {}).get('sandbox', 'workspace-write')}"
-                        f"\n  Reasoning Effort: {codex_cfg.get('reasoning_effort') or self.config.get('llm', {}).get('providers', {}).get('codex', {}).get('reasoning_effort', 'medium')}"
-                        f"\n  Timeout: {codex_cfg.get('timeout_seconds') or self.config.get('llm', {}).get('providers', {}).get('codex', {}).get('timeout_seconds', 600)}s"
+                    effort = (
+                        agent_cfg.get("codex", {}).get("reasoning_effort")
+                        or self.config.get("llm", {}).get("providers", {}).get("codex", {}).get("reasoning_effort", "medium")
                     )
-                runtime_lines = ""
-                if handle.is_alive:
-                    req_id = None
-                    try:
-                        import uuid
-                        req_id = str(uuid.uuid4())
-                        future = asyncio.get_event_loop().create_future()
-                        self._pending_requests[req_id] = future
-                        self.agent_manager.send_message(agent_id, {
-                            "type": "get_runtime_status",
-                            "request_id": req_id,
-                        })
-                        resp = await asyncio.wait_for(future, timeout=5.0)
-                        runtime = resp.get("data", {})
-                        runtime_lines = (
-                            f"\n  Requests: {runtime.get('request_count', 0)}"
-                            f"\n  Errors: {runtime.get('error_count', 0)}"
-                            f"\n  Last Reply: {_format_ms(runtime.get('last_processing_time_ms', 0))}"
-                            f"\n  Avg Reply: {_format_ms(runtime.get('avg_processing_time_ms', 0))}"
-                        )
-                    except asyncio.TimeoutError:
-                        runtime_lines = "\n  Timing: unavailable (status request timed out)"
-                    finally:
-                        if req_id:
-                            self._pending_requests.pop(req_id, None)
-                display_model = get_display_model_name(str(agent_cfg.get("model", "?")))
+                    effort_line = f"\n  Reasoning Effort: {effort}"
+                display_model = get_display_model_name(str(data.get("model", "?")))
+                session_id = str(data.get("session_id") or "n/a")
                 return (
-                    f"🐢 Agent: {agent_id}\n"
-                    f"  Status: {status}\n"
-                    f"  Name: {agent_cfg.get('name', 'Turtle')}\n"
-                    f"  Model: {display_model} ({provider})\n"
-                    f"  Sandbox: {agent_cfg.get('sandbox', 'confined')}\n"
-                    f"  Workspace: {workspace}"
-                    f"\n  Heartbeat: {'enabled' if heartbeat.get('enabled') else 'disabled'}"
-                    f"\n  Heartbeat Interval: {heartbeat.get('interval_minutes', 60)} min"
-                    f"\n  Enabled Schedules: {enabled_schedule_count}"
-                    f"\n  Active Job: {active_job.get('id') if active_job else 'none'}"
-                    f"{codex_lines}{runtime_lines}\n"
-                    f"  PID: {handle.pid or 'N/A'}\n"
-                    f"  Uptime: {uptime_min:.1f} min\n"
-                    f"  Restarts: {handle.restart_count}"
+                    f"📊 Context Stats:\n"
+                    f"  Session ID: {session_id}\n"
+                    f"  Model: {display_model}\n"
+                    f"  Provider: {provider}{effort_line}\n"
+                    f"  Messages: {ctx.get('message_count', 0)}\n"
+                    f"  Requests: {ctx.get('request_count', 0)}\n"
+                    f"  Last Reply: {_format_ms(ctx.get('last_response_time_ms', 0))}\n"
+                    f"  Avg Reply: {_format_ms(ctx.get('avg_response_time_ms', 0))}\n"
+                    f"  System Prompt: ~{ctx.get('system_prompt_tokens', 0):,} tokens\n"
+                    f"  Conversation: ~{ctx.get('message_tokens', 0):,} tokens\n"
+                    f"  Total: ~{ctx.get('estimated_tokens', 0):,} / {ctx.get('max_tokens', 0):,} ({ctx.get('usage_ratio', 0):.1%})\n"
+                    f"  Compressions: {ctx.get('compression_count', 0)}"
                 )
-            return f"⚠️ Agent '{agent_id}' not found."
-
-        elif cmd == "/model":
-            if len(parts) >= 2 and parts[1].lower() == "list":
-                provider = parts[2].lower() if len(parts) >= 3 else None
-                models = list_models(provider)
-                if not models:
-                    return f"No models found for provider '{provider}'." if provider else "No models found."
-                return format_model_list(models)
-            elif len(parts) >= 2:
-                new_model = parts[1]
-                handle = self.agent_manager.get_handle(agent_id)
-                if handle and handle.is_alive:
-                    self.agent_manager.send_message(agent_id, {"type": "set_model", "model": new_model})
-                    # Persist to config file
-                    if self.config_path and agent_id in self.config.get("agents", {}):
-                        self.config["agents"][agent_id]["model"] = new_model
-                        try:
-                            save_config(self.config, self.config_path)
-                            logger.info(f"Model for '{agent_id}' saved to config: {new_model}")
-                        except Exception as e:
-                            logger.error(f"Failed to save config: {e}")
-                    return f"✅ Model switched to: {new_model}"
-                return "⚠️ Agent is not running."
-            else:
-                return "Usage: /model list [provider] or /model <model_name>"
+            except asyncio.TimeoutError:
+                return "⚠️ Timeout waiting for stats."
+            finally:
+                self._pending_requests.pop(req_id, None)
+        return "⚠️ Agent is not running."
+
+    async def _cmd_prompt(self, ctx: CommandContext) -> str:
+        """/prompt — export the current final system prompt (owner only)."""
+        if not self._is_owner_user(ctx.agent_id, ctx.source, ctx.user_id):
+            return "⛔ Owner permission required."
+        prompt = self._build_current_system_prompt(ctx.agent_id, ctx.source)
+        export_path = self._write_prompt_export(ctx.agent_id, ctx.source, prompt)
+        return (
+            f"📜 Final system prompt export for `{ctx.source}`.\n"
+            f"ATTACH: {export_path}"
+        )
 
-        elif cmd == "/effort":
-            agent_cfg = get_agent_config(self.config, agent_id) or {}
-            codex_cfg = agent_cfg.setdefault("codex", {})
-            current_effort = codex_cfg.get("reasoning_effort") or self.config.get("llm", {}).get("providers", {}).get("codex", {}).get("reasoning_effort", "medium")
-            if len(parts) >= 2 and parts[1].lower() == "list":
-                return (
-                    "🧠 Available Codex reasoning efforts:\n"
-                    "- minimal\n- low\n- medium\n- high\n- xhigh\n"
-                    f"\nCurrent: {current_effort}"
+    async def _cmd_heartbeat(self, ctx: CommandContext) -> str:
+        """/heartbeat — show heartbeat status and latest result."""
+        workspace = (get_agent_config(self.config, ctx.agent_id) or {}).get("workspace", f"~/.sea_turtle/agents/{ctx.agent_id}")
+        heartbeat = load_heartbeat_data(workspace)
+        last_run_at = (heartbeat.get("last_run_at") or "").replace("T", " ")
+        last_result = str(heartbeat.get("last_result") or "").strip()
+        lines = [
+            "🫀 Heartbeat:",
+            f"- Status: {'enabled' if heartbeat.get('enabled') else 'disabled'}",
+            f"- Interval: {heartbeat.get('interval_minutes', 60)} min",
+            f"- Running: {'yes' if heartbeat.get('is_running') else 'no'}",
+            f"- Run Count: {heartbeat.get('run_count', 0)}",
+        ]
+        if last_run_at:
+            lines.append(f"- Last Run: {last_run_at}")
+        if heartbeat.get("last_outcome"):
+            lines.append(f"- Last Outcome: {heartbeat.get('last_outcome')}")
+        if last_result:
+            lines.append(f"- Last Result: {last_result[:500]}")
+        return "\n".join(lines)
+
+    async def _cmd_job(self, ctx: CommandContext) -> str:
+        """/job — show the current background job (Discord only)."""
+        if ctx.source != "discord":
+            return "🧩 后台任务入口仅在 Discord 提供。"
+        workspace = (get_agent_config(self.config, ctx.agent_id) or {}).get("workspace", f"~/.sea_turtle/agents/{ctx.agent_id}")
+        job = get_active_job(workspace)
+        if not job:
+            recent = list_recent_jobs(workspace, limit=1)
+            job = recent[0] if recent else None
+        return self._format_job_status(job or {})
+
+    async def _cmd_job_cancel(self, ctx: CommandContext) -> str:
+        """/job_cancel — cancel the current background job (Discord only)."""
+        if ctx.source != "discord":
+            return "🧩 后台任务入口仅在 Discord 提供。"
+        workspace = (get_agent_config(self.config, ctx.agent_id) or {}).get("workspace", f"~/.sea_turtle/agents/{ctx.agent_id}")
+        job = get_active_job(workspace)
+        if not job:
+            return "🧩 当前没有可取消的后台任务。"
+        updated = request_job_cancel(workspace, str(job.get("id") or ""))
+        if not updated:
+            return "⚠️ 取消后台任务失败。"
+        if updated.get("status") == "cancelled":
+            return f"✅ 已取消后台任务 {updated.get('id')}。"
+        return f"⏸️ 已请求取消后台任务 {updated.get('id')}，会在当前步骤结束后停止。"
+
+    async def _cmd_schedules(self, ctx: CommandContext) -> str:
+        """/schedules (alias /tasks) — show recent schedules."""
+        workspace = (get_agent_config(self.config, ctx.agent_id) or {}).get("workspace", f"~/.sea_turtle/agents/{ctx.agent_id}")
+        schedules = list_recent_schedules(workspace, limit=20)
+        if not schedules:
+            return "⏰ 最近没有定时作业。"
+        lines = ["⏰ Recent Schedules:"]
+        for schedule in schedules:
+            updated_at = (schedule.get("updated_at") or schedule.get("created_at") or "").replace("T", " ")
+            title = schedule.get("description", "").strip() or "(untitled)"
+            status = schedule.get("status", "enabled")
+            trigger = schedule.get("trigger", {})
+            trigger_text = (
+                f"every {trigger.get('seconds')}s"
+                if trigger.get("type") == "interval"
+                else f"daily {trigger.get('time')} {trigger.get('timezone', 'UTC')}"
+            )
+            result = schedule.get("last_result", "").strip()
+            line = f"- [{status}] {schedule.get('id', '?')} {title} | {schedule.get('execution_type')} | {trigger_text}"
+            if updated_at:
+                line += f" ({updated_at})"
+            lines.append(line)
+            if result:
+                lines.append(f"  last: {result[:160]}")
+        return "\n".join(lines)
+
+    async def _cmd_restart(self, ctx: CommandContext) -> str:
+        """/restart — restart the agent process."""
+        try:
+            self.agent_manager.restart_agent(ctx.agent_id)
+            return f"✅ Agent '{ctx.agent_id}' restarted."
+        except Exception as e:
+            return f"❌ Failed to restart: {e}"
+
+    async def _cmd_usage(self, ctx: CommandContext) -> str:
+        """/usage — show token usage and costs."""
+        counter = self._get_token_counter(ctx.agent_id)
+        total = counter.get_total_usage()
+        return counter.format_usage(total)
+
+    async def _cmd_status(self, ctx: CommandContext) -> str:
+        """/status — show agent status."""
+        handle = self.agent_manager.get_handle(ctx.agent_id)
+        if handle:
+            status = "🟢 Running" if handle.is_alive else "🔴 Stopped"
+            uptime_min = handle.uptime / 60
+            agent_cfg = get_agent_config(self.config, ctx.agent_id) or {}
+            workspace = agent_cfg.get("workspace", f"~/.sea_turtle/agents/{ctx.agent_id}")
+            heartbeat = load_heartbeat_data(workspace)
+            enabled_schedule_count = len(list_schedules(workspace, include_disabled=False))
+            active_job = get_active_job(workspace)
+            provider = resolve_provider(
+                agent_cfg.get("model", self.config.get("llm", {}).get("default_model", "")),
+                self.config.get("llm", {}).get("default_provider", "google"),
+            )
+            codex_cfg = agent_cfg.get("codex", {})
+            codex_lines = ""
+            if provider == "codex":
+                codex_lines = (
+                    f"\n  Codex Sandbox: {codex_cfg.get('sandbox') or self.config.get('llm', {}).get('providers', {}).get('codex', {}).get('sandbox', 'workspace-write')}"
+                    f"\n  Reasoning Effort: {codex_cfg.get('reasoning_effort') or self.config.get('llm', {}).get('providers', {}).get('codex', {}).get('reasoning_effort', 'medium')}"
+                    f"\n  Timeout: {codex_cfg.get('timeout_seconds') or self.config.get('llm', {}).get('providers', {}).get('codex', {}).get('timeout_seconds', 600)}s"
                 )
-            if len(parts) == 1:
-                provider = resolve_provider(agent_cfg.get("model", self.config.get("llm", {}).get("default_model", "")), self.config.get("llm", {}).get("default_provider", "google"))
-                note = "" if provider == "codex" else "\n⚠️ 当前模型不是 Codex，修改后要切回 Codex 模型才会生效。"
-                return f"🧠 Current Codex reasoning effort: {current_effort}{note}"
-
-            new_effort = parts[1].lower()
-            if new_effort not in {"minimal", "low", "medium", "high", "xhigh"}:
-                return "Usage: /effort [minimal|low|medium|high|xhigh]"
-
-            codex_cfg["reasoning_effort"] = new_effort
-            if self.config_path and agent_id in self.config.get("agents", {}):
-                self.config["agents"][agent_id].setdefault("codex", {})["reasoning_effort"] = new_effort
+            runtime_lines = ""
+            if handle.is_alive:
+                req_id = None
                 try:
-                    save_config(self.config, self.config_path)
-                except Exception as e:
-                    logger.error(f"Failed to save config: {e}")
-
-            handle = self.agent_manager.get_handle(agent_id)
+                    import uuid
+                    req_id = str(uuid.uuid4())
+                    future = asyncio.get_event_loop().create_future()
+                    self._pending_requests[req_id] = future
+                    self.agent_manager.send_message(ctx.agent_id, {
+                        "type": "get_runtime_status",
+                        "request_id": req_id,
+                    })
+                    resp = await asyncio.wait_for(future, timeout=5.0)
+                    runtime = resp.get("data", {})
+                    runtime_lines = (
+                        f"\n  Requests: {runtime.get('request_count', 0)}"
+                        f"\n  Errors: {runtime.get('error_count', 0)}"
+                        f"\n  Last Reply: {_format_ms(runtime.get('last_processing_time_ms', 0))}"
+                        f"\n  Avg Reply: {_format_ms(runtime.get('avg_processing_time_ms', 0))}"
+                    )
+                except asyncio.TimeoutError:
+                    runtime_lines = "\n  Timing: unavailable (status request timed out)"
+                finally:
+                    if req_id:
+                        self._pending_requests.pop(req_id, None)
+            display_model = get_display_model_name(str(agent_cfg.get("model", "?")))
+            return (
+                f"🐢 Agent: {ctx.agent_id}\n"
+                f"  Status: {status}\n"
+                f"  Name: {agent_cfg.get('name', 'Turtle')}\n"
+                f"  Model: {display_model} ({provider})\n"
+                f"  Sandbox: {agent_cfg.get('sandbox', 'confined')}\n"
+                f"  Workspace: {workspace}"
+                f"\n  Heartbeat: {'enabled' if heartbeat.get('enabled') else 'disabled'}"
+                f"\n  Heartbeat Interval: {heartbeat.get('interval_minutes', 60)} min"
+                f"\n  Enabled Schedules: {enabled_schedule_count}"
+                f"\n  Active Job: {active_job.get('id') if active_job else 'none'}"
+                f"{codex_lines}{runtime_lines}\n"
+                f"  PID: {handle.pid or 'N/A'}\n"
+                f"  Uptime: {uptime_min:.1f} min\n"
+                f"  Restarts: {handle.restart_count}"
+            )
+        return f"⚠️ Agent '{ctx.agent_id}' not found."
+
+    async def _cmd_model(self, ctx: CommandContext) -> str:
+        """/model — list models or switch the agent model."""
+        if ctx.args and ctx.args[0].lower() == "list":
+            provider = ctx.args[1].lower() if len(ctx.args) >= 2 else None
+            models = list_models(provider)
+            if not models:
+                return f"No models found for provider '{provider}'." if provider else "No models found."
+            return format_model_list(models)
+        elif ctx.args:
+            new_model = ctx.args[0]
+            handle = self.agent_manager.get_handle(ctx.agent_id)
             if handle and handle.is_alive:
-                self.agent_manager.send_message(agent_id, {"type": "set_effort", "effort": new_effort})
-
+                self.agent_manager.send_message(ctx.agent_id, {"type": "set_model", "model": new_model})
+                # Persist to config file
+                if self.config_path and ctx.agent_id in self.config.get("agents", {}):
+                    self.config["agents"][ctx.agent_id]["model"] = new_model
+                    try:
+                        save_config(self.config, self.config_path)
+                        logger.info(f"Model for '{ctx.agent_id}' saved to config: {new_model}")
+                    except Exception as e:
+                        logger.error(f"Failed to save config: {e}")
+                return f"✅ Model switched to: {new_model}"
+            return "⚠️ Agent is not running."
+        else:
+            return "Usage: /model list [provider] or /model <model_name>"
+
+    async def _cmd_effort(self, ctx: CommandContext) -> str:
+        """/effort — show, list, or set the Codex reasoning effort."""
+        agent_cfg = get_agent_config(self.config, ctx.agent_id) or {}
+        codex_cfg = agent_cfg.setdefault("codex", {})
+        current_effort = codex_cfg.get("reasoning_effort") or self.config.get("llm", {}).get("providers", {}).get("codex", {}).get("reasoning_effort", "medium")
+        if ctx.args and ctx.args[0].lower() == "list":
+            return (
+                "🧠 Available Codex reasoning efforts:\n"
+                "- minimal\n- low\n- medium\n- high\n- xhigh\n"
+                f"\nCurrent: {current_effort}"
+            )
+        if not ctx.args:
             provider = resolve_provider(agent_cfg.get("model", self.config.get("llm", {}).get("default_model", "")), self.config.get("llm", {}).get("default_provider", "google"))
-            note = "" if provider == "codex" else "\n⚠️ 当前模型不是 Codex，已保存，但只有切回 Codex 模型后才会生效。"
-            return f"✅ Codex reasoning effort set to: {new_effort}{note}"
+            note = "" if provider == "codex" else "\n⚠️ 当前模型不是 Codex，修改后要切回 Codex 模型才会生效。"
+            return f"🧠 Current Codex reasoning effort: {current_effort}{note}"
 
-        return f"Unknown command: {cmd}. Type /help for available commands."
+        new_effort = ctx.args[0].lower()
+        if new_effort not in {"minimal", "low", "medium", "high", "xhigh"}:
+            return "Usage: /effort [minimal|low|medium|high|xhigh]"
+
+        codex_cfg["reasoning_effort"] = new_effort
+        if self.config_path and ctx.agent_id in self.config.get("agents", {}):
+            self.config["agents"][ctx.agent_id].setdefault("codex", {})["reasoning_effort"] = new_effort
+            try:
+                save_config(self.config, self.config_path)
+            except Exception as e:
+                logger.error(f"Failed to save config: {e}")
+
+        handle = self.agent_manager.get_handle(ctx.agent_id)
+        if handle and handle.is_alive:
+            self.agent_manager.send_message(ctx.agent_id, {"type": "set_effort", "effort": new_effort})
+
+        provider = resolve_provider(agent_cfg.get("model", self.config.get("llm", {}).get("default_model", "")), self.config.get("llm", {}).get("default_provider", "google"))
+        note = "" if provider == "codex" else "\n⚠️ 当前模型不是 Codex，已保存，但只有切回 Codex 模型后才会生效。"
+        return f"✅ Codex reasoning effort set to: {new_effort}{note}"
 
     def route_message(
         self,
@@ -884,56 +975,123 @@ class Daemon:
         })
 
     async def _handle_and_reply_command(self, command, agent_id, source, chat_id, user_id):
-        """Handle system command and put reply in outbox."""
+        """Handle system command and queue its reply for dispatch."""
         reply = await self.handle_system_command(command, agent_id, source, chat_id, user_id)
         handle = self.agent_manager.get_handle(agent_id)
         if handle:
-            handle.outbox.put({
+            # Already on the event loop: skip the agent's outbox pipe, whose
+            # write lock is shared with the agent process.
+            self._reply_queue.put_nowait((agent_id, {
                 "type": "reply",
                 "agent_id": agent_id,
                 "content": reply,
                 "source": source,
                 "chat_id": chat_id,
                 "user_id": user_id,
-            })
+            }))
+
+    def _watch_outbox(self, handle: AgentHandle) -> None:
+        """Wake the outbox pump so it starts watching a newly started agent."""
+        self._wake_outbox_pump()
+
+    def _wake_outbox_pump(self) -> None:
+        # Under the lock so the pump thread cannot close (and the OS reuse)
+        # the fd between the check and the write.
+        with self._outbox_wakeup_lock:
+            wakeup = self._outbox_wakeup
+            if wakeup is None:
+                return
+            try:
+                os.write(wakeup[1], b"\0")
+            except OSError:
+                pass  # pipe full: a wakeup is already pending
+
+    def _pump_outboxes(self) -> None:
+        """Wait on all agent outbox pipes at once and forward messages into the event loop.
+
+        Runs in a dedicated thread. The selector also watches a wakeup pipe that
+        is written whenever an agent (re)starts or the daemon stops, so the
+        thread sleeps in the kernel until there is something to do.
+        """
+        import queue as _queue
+        wake_r = self._outbox_wakeup[0]
+        selector = selectors.DefaultSelector()
+        selector.register(wake_r, selectors.EVENT_READ, None)
+        watched: dict[str, AgentHandle] = {}
+        try:
+            while self._running:
+                current = dict(self.agent_manager.agents)
+                for agent_id, handle in list(watched.items()):
+                    if current.get(agent_id) is not handle:
+                        try:
+                            selector.unregister(handle.outbox)
+                        except (KeyError, ValueError):
+                            pass  # already dropped after a read error
+                        del watched[agent_id]
+                for agent_id, handle in current.items():
+                    if agent_id not in watched:
+                        try:
+                            selector.register(handle.outbox, selectors.EVENT_READ, handle)
+                        except (OSError, ValueError) as e:
+                            logger.error(f"Cannot watch outbox for '{agent_id}': {e}")
+                            continue
+                        watched[agent_id] = handle
+
+                for key, _ in selector.select():
+                    handle = key.data
+                    if handle is None:
+                        os.read(wake_r, 4096)
+                        continue
+                    while True:
+                        try:
+                            msg = handle.outbox.get_nowait()
+                        except _queue.Empty:
+                            break
+                        except Exception as e:
+                            if self._running:
+                                logger.error(f"Error reading outbox for '{handle.agent_id}': {e}")
+                            selector.unregister(handle.outbox)
+                            break
+                        if not msg:
+                            continue
+                        try:
+                            self._loop.call_soon_threadsafe(self._reply_queue.put_nowait, (handle.agent_id, msg))
+                        except RuntimeError:
+                            return  # event loop closed
+        finally:
+            selector.close()
+            with self._outbox_wakeup_lock:
+                wakeup, self._outbox_wakeup = self._outbox_wakeup, None
+                if wakeup:
+                    for fd in wakeup:
+                        os.close(fd)
 
     async def _dispatch_replies(self) -> None:
         """Dispatch replies from agent outboxes to the appropriate channels."""
-        import queue as _queue
         while self._running:
-            for agent_id, handle in self.agent_manager.agents.items():
-                try:
-                    msg = handle.outbox.get_nowait()
-                except _queue.Empty:
+            agent_id, msg = await self._reply_queue.get()
+            try:
+                # Route stats responses to pending futures
+                req_id = msg.get("request_id")
+                if req_id and req_id in self._pending_requests:
+                    future = self._pending_requests[req_id]
+                    if not future.done():
+                        future.set_result(msg)
                     continue
-                except Exception as e:
-                    logger.error(f"Error reading outbox for '{agent_id}': {e}")
+                if msg.get("type") == "job_result":
+                    await self._handle_job_result(msg)
                     continue
-                if not msg:
+                if msg.get("type") == "heartbeat_result":
+                    await self._handle_heartbeat_result(msg)
                     continue
-                try:
-                    # Route stats responses to pending futures
-                    req_id = msg.get("request_id")
-                    if req_id and req_id in self._pending_requests:
-                        future = self._pending_requests[req_id]
-                        if not future.done():
-                            future.set_result(msg)
-                        continue
-                    if msg.get("type") == "job_result":
-                        await self._handle_job_result(msg)
-                        continue
-                    if msg.get("type") == "heartbeat_result":
-                        await self._handle_heartbeat_result(msg)
-                        continue
-                    if msg.get("type") == "schedule_result":
-                        await self._handle_schedule_result(msg)
-                        continue
-                    # Regular replies go to channels
-                    logger.debug(f"Dispatching reply from '{agent_id}' to {msg.get('source')}:{msg.get('chat_id')}")
-                    await self._send_reply(msg)
-                except Exception as e:
-                    logger.error(f"Error dispatching reply: {e}", exc_info=True)
-            await asyncio.sleep(0.1)
+                if msg.get("type") == "schedule_result":
+                    await self._handle_schedule_result(msg)
+                    continue
+                # Regular replies go to channels
+                logger.debug(f"Dispatching reply from '{agent_id}' to {msg.get('source')}:{msg.get('chat_id')}")
+                await self._send_reply(msg)
+            except Exception as e:
+                logger.error(f"Error dispatching reply: {e}", exc_info=True)
 
     async def _handle_schedule_result(self, msg: dict) -> None:
         """Persist one scheduled run result and notify owners."""
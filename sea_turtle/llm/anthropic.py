@@ -1,11 +1,44 @@
 """Anthropic Claude LLM provider implementation."""
 
+import importlib.util
 import json
 from typing import Any
 
-from anthropic import AsyncAnthropic
+import httpx
+from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
 
-from sea_turtle.llm.base import BaseLLMProvider, LLMResponse, ToolDefinition
+from sea_turtle.llm.base import (
+    BaseLLMProvider,
+    LLMResponse,
+    ToolDefinition,
+    ToolSchemaCache,
+    warm_up_connection,
+)
+
+# Pooled HTTP client shared by every AnthropicProvider in the process, so
+# provider re-creation (model/effort switches) keeps warm TLS connections.
+_shared_http_client: httpx.AsyncClient | None = None
+
+
+def _get_shared_http_client() -> httpx.AsyncClient:
+    global _shared_http_client
+    if _shared_http_client is None:
+        _shared_http_client = DefaultAsyncHttpxClient(
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            http2=importlib.util.find_spec("h2") is not None,
+        )
+    return _shared_http_client
+
+
+def _convert_tools(tools: list[ToolDefinition]) -> list[dict]:
+    return [
+        {
+            "name": t.name,
+            "description": t.description,
+            "input_schema": t.parameters,
+        }
+        for t in tools
+    ]
 
 
 class AnthropicProvider(BaseLLMProvider):
@@ -13,20 +46,17 @@ class AnthropicProvider(BaseLLMProvider):
 
     def __init__(self, api_key: str, **kwargs):
         super().__init__(api_key, **kwargs)
-        self.client = AsyncAnthropic(api_key=api_key)
+        self.client = AsyncAnthropic(api_key=api_key, http_client=_get_shared_http_client())
+        self._tools_cache = ToolSchemaCache(_convert_tools)
+
+    async def warm_up(self) -> None:
+        await warm_up_connection(_get_shared_http_client(), str(self.client.base_url))
 
     def _build_tools(self, tools: list[ToolDefinition] | None) -> list[dict] | None:
         """Convert ToolDefinition list to Anthropic's tool format."""
         if not tools:
             return None
-        return [
-            {
-                "name": t.name,
-                "description": t.description,
-                "input_schema": t.parameters,
-            }
-            for t in tools
-        ]
+        return self._tools_cache.get(tools)
 
     def _extract_messages(self, messages: list[dict[str, Any]]) -> tuple[str, list[dict]]:
         """Separate system message from conversation messages.
@@ -36,6 +66,7 @@ class AnthropicProvider(BaseLLMProvider):
         """
         system_prompt = ""
         conversation = []
+        tool_results: list[dict] | None = None
 
         for msg in messages:
             if msg["role"] == "system":
@@ -43,16 +74,17 @@ class AnthropicProvider(BaseLLMProvider):
             else:
                 role = msg["role"]
                 if role == "tool":
-                    conversation.append({
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "tool_result",
-                                "tool_use_id": msg.get("tool_call_id", ""),
-                                "content": msg["content"],
-                            }
-                        ],
-                    })
+                    block = {
+                        "type": "tool_result",
+                        "tool_use_id": msg.get("tool_call_id", ""),
+                        "content": msg["content"],
+                    }
+                    # Consecutive tool results belong in a single user turn.
+                    if tool_results is not None and conversation and conversation[-1]["content"] is tool_results:
+                        tool_results.append(block)
+                    else:
+                        tool_results = [block]
+                        conversation.append({"role": "user", "content": tool_results})
                 elif role == "assistant" and msg.get("tool_calls"):
                     content_blocks = []
                     if msg.get("content"):
@@ -70,17 +102,21 @@ class AnthropicProvider(BaseLLMProvider):
 
         return system_prompt, conversation
 
-    def _extract_tool_calls(self, response) -> list[dict[str, Any]]:
-        """Extract tool calls from Anthropic response."""
+    def _parse_content(self, response) -> tuple[str, list[dict[str, Any]]]:
+        """Collect text and tool calls from an Anthropic response in one pass."""
+        parts = []
         tool_calls = []
         for block in response.content:
-            if block.type == "tool_use":
+            block_type = block.type
+            if block_type == "text":
+                parts.append(block.text)
+            elif block_type == "tool_use":
                 tool_calls.append({
                     "id": block.id,
                     "name": block.name,
                     "arguments": block.input if isinstance(block.input, dict) else {},
                 })
-        return tool_calls
+        return "".join(parts), tool_calls
 
     async def chat(
         self,
@@ -115,12 +151,7 @@ class AnthropicProvider(BaseLLMProvider):
 
         response = await self.client.messages.create(**kwargs)
 
-        content = ""
-        for block in response.content:
-            if hasattr(block, "text"):
-                content += block.text
-
-        tool_calls = self._extract_tool_calls(response)
+        content, tool_calls = self._parse_content(response)
 
         return LLMResponse(
             content=content,
@@ -129,7 +160,7 @@ class AnthropicProvider(BaseLLMProvider):
             output_tokens=response.usage.output_tokens,
             model=model,
             finish_reason=response.stop_reason or "",
-            raw_response=response,
+            raw_response=response if self.keep_raw_response else None,
         )
 
     async def chat_stream(
@@ -152,5 +183,6 @@ class AnthropicProvider(BaseLLMProvider):
             kwargs["system"] = system_prompt
 
         async with self.client.messages.stream(**kwargs) as stream:
-            async for text in stream.text_stream:
-                yield text
+            async for event in stream:
+                if event.type == "content_block_delta" and event.delta.type == "text_delta":
+                    yield event.delta.text
@@ -1,11 +1,27 @@
 """Abstract base class for LLM providers."""
 
 import abc
+import asyncio
+import random
+import sys
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, AsyncIterator, Awaitable, Callable, TypeVar
 
+T = TypeVar("T")
 
-@dataclass
+DEFAULT_MAX_CONCURRENT = 8
+RETRY_ATTEMPTS = 5
+RETRY_MAX_DELAY = 30.0
+TOOLS_CACHE_SIZE = 4
+STREAM_COALESCE_CHARS = 16
+STREAM_COALESCE_SECONDS = 0.025
+# httpx drops idle pooled connections after 5 s (its default keepalive_expiry).
+WARM_UP_IDLE_SECONDS = 5.0
+
+
+@dataclass(slots=True)
 class LLMResponse:
     """Standardized response from any LLM provider."""
     content: str = ""
@@ -17,8 +33,15 @@ class LLMResponse:
     raw_response: Any = None
     attachments: list[str] = field(default_factory=list)
 
+    def __post_init__(self):
+        # Few distinct values across many turns; share one string object each.
+        if type(self.model) is str:
+            self.model = sys.intern(self.model)
+        if type(self.finish_reason) is str:
+            self.finish_reason = sys.intern(self.finish_reason)
 
-@dataclass
+
+@dataclass(slots=True)
 class ToolDefinition:
     """Definition of a tool/function that the LLM can call."""
     name: str
@@ -26,6 +49,147 @@ class ToolDefinition:
     parameters: dict[str, Any]
 
 
+class ToolSchemaCache:
+    """Memoize a provider's tool-list conversion for the most recent lists.
+
+    AgentWorker builds a new list for every message, but its entries are the
+    same module-level ToolDefinition objects, so entries are keyed by the ids
+    of the definitions. The definitions are kept alongside the result so
+    their ids stay unique while cached.
+    """
+
+    def __init__(self, convert: Callable[[list[ToolDefinition]], T], size: int = TOOLS_CACHE_SIZE):
+        self._convert = convert
+        self._size = size
+        self._entries: OrderedDict[tuple[int, ...], tuple[tuple[ToolDefinition, ...], Any]] = OrderedDict()
+
+    def get(self, tools: list[ToolDefinition]) -> Any:
+        key = tuple(map(id, tools))
+        cached = self._entries.get(key)
+        if cached is not None and all(a is b for a, b in zip(cached[0], tools)):
+            self._entries.move_to_end(key)
+            return cached[1]
+        result = self._convert(tools)
+        self._entries[key] = (tuple(tools), result)
+        while len(self._entries) > self._size:
+            self._entries.popitem(last=False)
+        return result
+
+
+def _retry_after(exc: BaseException) -> float | None:
+    """Read a Retry-After header (seconds) from an SDK error, if any."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+async def call_with_retry(
+    call: Callable[[], Awaitable[T]],
+    semaphore: asyncio.Semaphore,
+    is_retryable: Callable[[BaseException], bool],
+    attempts: int = RETRY_ATTEMPTS,
+) -> T:
+    """Run an API call under a concurrency limit, retrying rate limits/timeouts.
+
+    Backoff is exponential with jitter, capped at RETRY_MAX_DELAY, and honors
+    the server's Retry-After header when present. The semaphore is released
+    while waiting so other requests can proceed.
+    """
+    attempt = 0
+    while True:
+        try:
+            async with semaphore:
+                return await call()
+        except Exception as e:
+            attempt += 1
+            if attempt >= attempts or not is_retryable(e):
+                raise
+            delay = _retry_after(e)
+            if delay is None:
+                delay = 2 ** (attempt - 1) + random.uniform(0, 1)
+            await asyncio.sleep(min(delay, RETRY_MAX_DELAY))
+
+
+async def coalesce_chunks(
+    chunks: AsyncIterator[str],
+    min_chars: int = STREAM_COALESCE_CHARS,
+    max_delay: float = STREAM_COALESCE_SECONDS,
+) -> AsyncIterator[str]:
+    """Merge small stream deltas before yielding them.
+
+    The first chunk is yielded as soon as it arrives so time-to-first-token is
+    unchanged; later deltas are buffered until ``min_chars`` characters or
+    ``max_delay`` seconds have passed, and the remainder is flushed at the
+    end of the stream. The delay is a timer, so buffered text is not held
+    back while the model pauses between deltas.
+    """
+    buf: list[str] = []
+    size = 0
+    first = True
+    deadline: float | None = None
+    iterator = aiter(chunks)
+    # Kept across timeouts: cancelling a pending __anext__ would tear down
+    # the upstream generator.
+    pending: asyncio.Future | None = None
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(anext(iterator))
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+            done, _ = await asyncio.wait((pending,), timeout=timeout)
+            if not done:
+                # The model paused with text buffered; flush it now.
+                yield "".join(buf)
+                buf.clear()
+                size = 0
+                deadline = None
+                continue
+            task, pending = pending, None
+            try:
+                text = task.result()
+            except StopAsyncIteration:
+                break
+            if first:
+                first = False
+                yield text
+                continue
+            if not buf:
+                deadline = time.monotonic() + max_delay
+            buf.append(text)
+            size += len(text)
+            if size >= min_chars or time.monotonic() >= deadline:
+                yield "".join(buf)
+                buf.clear()
+                size = 0
+                deadline = None
+        if buf:
+            yield "".join(buf)
+    finally:
+        if pending is not None:
+            pending.cancel()
+            # aclose() fails while the generator is still inside __anext__.
+            await asyncio.wait((pending,))
+        # Release the provider stream (and its HTTP response) now, not at GC.
+        if hasattr(iterator, "aclose"):
+            await iterator.aclose()
+
+
+async def warm_up_connection(http_client: Any, url: str) -> None:
+    """Leave a pooled connection to ``url`` open; best effort.
+
+    An unauthenticated HEAD is enough: the response status does not matter,
+    only the TCP/TLS handshake it pays for.
+    """
+    try:
+        await http_client.head(url)
+    except Exception:
+        pass
+
+
 class BaseLLMProvider(abc.ABC):
     """Abstract base class for LLM provider implementations.
 
@@ -37,9 +201,20 @@ class BaseLLMProvider(abc.ABC):
 
         Args:
             api_key: API key for the provider.
-            **kwargs: Additional provider-specific options.
+            **kwargs: Additional provider-specific options. ``keep_raw_response``
+                keeps the SDK response object on ``LLMResponse.raw_response``
+                (off by default so turns do not pin whole SDK responses).
         """
         self.api_key = api_key
+        self.keep_raw_response = bool(kwargs.get("keep_raw_response", False))
+
+    async def warm_up(self) -> None:
+        """Open a connection to the API ahead of the next request.
+
+        Called while the caller is still assembling the prompt so the TCP/TLS
+        handshake overlaps with that work. Best effort; the default is a no-op.
+        """
+        return None
 
     @abc.abstractmethod
     async def chat(
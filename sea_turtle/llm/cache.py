@@ -0,0 +1,253 @@
+"""In-memory response cache shared by LLM providers."""
+
+import hashlib
+import json
+import math
+import re
+import string
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Awaitable, Callable
+
+from sea_turtle.llm.base import LLMResponse, ToolDefinition
+
+CACHE_TTL_SECONDS = 3600.0
+CACHE_MAX_SIZE = 1000
+SIMILARITY_THRESHOLD = 0.92
+SEMANTIC_ENTRIES_PER_SCOPE = 64
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_PUNCTUATION_TABLE = str.maketrans("", "", string.punctuation)
+
+Embedder = Callable[[str], Awaitable[list[float]]]
+
+
+def should_cache(temperature: float, use_cache: bool | None) -> bool:
+    """Decide whether a chat call may be served from / stored in the cache.
+
+    Sampled output (temperature > 0) is not reproducible, so it is only cached
+    when the caller opts in explicitly.
+    """
+    if use_cache is not None:
+        return use_cache
+    return temperature <= 0
+
+
+def make_key(
+    provider: str,
+    model: str,
+    messages: list[dict[str, Any]],
+    temperature: float,
+    max_output_tokens: int,
+    tools: list[ToolDefinition] | None = None,
+    tool_choice: str = "auto",
+) -> str:
+    """Build a SHA-256 cache key from the canonical JSON of a chat request."""
+    payload = json.dumps(
+        {
+            "provider": provider,
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_output_tokens": max_output_tokens,
+            "tools": [
+                {"name": t.name, "description": t.description, "parameters": t.parameters}
+                for t in tools or ()
+            ],
+            "tool_choice": tool_choice,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Exact-match LRU cache of LLMResponses with a per-entry TTL."""
+
+    def __init__(self, max_size: int = CACHE_MAX_SIZE, ttl: float = CACHE_TTL_SECONDS):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, LLMResponse]] = OrderedDict()
+
+    def get(self, key: str) -> LLMResponse | None:
+        """Return a copy of the cached response, or None on miss/expiry.
+
+        Token counts on a hit are zeroed since no API call was billed.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, response = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        hit = _copy_response(response)
+        hit.input_tokens = 0
+        hit.output_tokens = 0
+        return hit
+
+    def put(self, key: str, response: LLMResponse) -> None:
+        """Store a response, evicting the least recently used entries."""
+        self._entries[key] = (time.monotonic(), _copy_response(response))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _copy_response(response: LLMResponse) -> LLMResponse:
+    # Callers append to these lists, so never hand out the cached ones.
+    return replace(
+        response,
+        tool_calls=[dict(tc) for tc in response.tool_calls],
+        attachments=list(response.attachments),
+    )
+
+
+def normalize_prompt(text: str) -> str:
+    """Lowercase, strip punctuation and collapse whitespace."""
+    return _WHITESPACE_RE.sub(" ", text.lower().translate(_PUNCTUATION_TABLE)).strip()
+
+
+def _cosine(a: list[float], b: list[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+class SemanticCache:
+    """Near-duplicate lookup on the last user message of a request.
+
+    Entries are grouped by a scope key covering everything except the last
+    user message, so only the final prompt may differ. Prompts match when
+    their normalized text is equal or, if an ``embed`` coroutine is given,
+    when the cosine similarity of their embeddings reaches ``threshold``.
+    """
+
+    def __init__(
+        self,
+        embed: Embedder | None = None,
+        threshold: float = SIMILARITY_THRESHOLD,
+        max_scopes: int = CACHE_MAX_SIZE,
+        ttl: float = CACHE_TTL_SECONDS,
+    ):
+        self.embed = embed
+        self.threshold = threshold
+        self.max_scopes = max_scopes
+        self.ttl = ttl
+        # scope -> [(stored_at, normalized prompt, embedding, response)]
+        self._scopes: OrderedDict[str, list[tuple[float, str, list[float] | None, LLMResponse]]] = OrderedDict()
+
+    @staticmethod
+    def last_user_prompt(messages: list[dict[str, Any]]) -> str | None:
+        """Return the trailing user message text, if the request ends with one."""
+        if not messages or messages[-1].get("role") != "user":
+            return None
+        content = messages[-1].get("content")
+        return content if isinstance(content, str) and content else None
+
+    async def _embed(self, text: str) -> list[float] | None:
+        if self.embed is None:
+            return None
+        try:
+            return await self.embed(text)
+        except Exception:
+            # Embedding is best-effort; fall back to normalized-text matching.
+            return None
+
+    async def get(self, scope: str, prompt: str) -> tuple[LLMResponse | None, list[float] | None]:
+        """Look up a prompt; returns (response or None, prompt embedding)."""
+        normalized = normalize_prompt(prompt)
+        entries = self._scopes.get(scope)
+        if entries:
+            now = time.monotonic()
+            entries[:] = [e for e in entries if now - e[0] <= self.ttl]
+            for _, text, _, response in entries:
+                if text == normalized:
+                    return self._hit(scope, response), None
+        vector = await self._embed(normalized)
+        if entries and vector is not None:
+            best, best_score = None, self.threshold
+            for _, _, other, response in entries:
+                if other is not None:
+                    score = _cosine(vector, other)
+                    if score >= best_score:
+                        best, best_score = response, score
+            if best is not None:
+                return self._hit(scope, best), vector
+        return None, vector
+
+    def put(self, scope: str, prompt: str, response: LLMResponse, vector: list[float] | None = None) -> None:
+        """Store a response for a prompt within a scope."""
+        entries = self._scopes.setdefault(scope, [])
+        entries.append((time.monotonic(), normalize_prompt(prompt), vector, _copy_response(response)))
+        del entries[:-SEMANTIC_ENTRIES_PER_SCOPE]
+        self._scopes.move_to_end(scope)
+        while len(self._scopes) > self.max_scopes:
+            self._scopes.popitem(last=False)
+
+    def _hit(self, scope: str, response: LLMResponse) -> LLMResponse:
+        self._scopes.move_to_end(scope)
+        hit = _copy_response(response)
+        hit.input_tokens = 0
+        hit.output_tokens = 0
+        return hit
+
+
+response_cache = ResponseCache()
+
+
+@dataclass(slots=True)
+class CacheLookup:
+    """Outcome of lookup_response; on a miss, pass the response to store()."""
+
+    hit: LLMResponse | None = None
+    key: str | None = None
+    semantic_cache: SemanticCache | None = None
+    scope: str | None = None
+    prompt: str | None = None
+    vector: list[float] | None = None
+
+    def store(self, response: LLMResponse) -> None:
+        if self.key is None:
+            return
+        response_cache.put(self.key, response)
+        if self.scope is not None:
+            self.semantic_cache.put(self.scope, self.prompt, response, self.vector)
+
+
+async def lookup_response(
+    namespace: str,
+    semantic_cache: SemanticCache | None,
+    model: str,
+    messages: list[dict[str, Any]],
+    temperature: float,
+    max_output_tokens: int,
+    tools: list[ToolDefinition] | None,
+    tool_choice: str,
+    use_cache: bool | None,
+) -> CacheLookup:
+    """Check the exact-match cache, then the semantic cache, for a chat request."""
+    if not should_cache(temperature, use_cache):
+        return CacheLookup()
+    lookup = CacheLookup(key=make_key(namespace, model, messages, temperature, max_output_tokens, tools, tool_choice))
+    lookup.hit = response_cache.get(lookup.key)
+    if lookup.hit is not None or semantic_cache is None:
+        return lookup
+    prompt = SemanticCache.last_user_prompt(messages)
+    if prompt is not None:
+        lookup.semantic_cache = semantic_cache
+        lookup.prompt = prompt
+        lookup.scope = make_key(namespace, model, messages[:-1], temperature, max_output_tokens, tools, tool_choice)
+        lookup.hit, lookup.vector = await semantic_cache.get(lookup.scope, prompt)
+    return lookup
+
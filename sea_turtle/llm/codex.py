@@ -163,7 +163,7 @@ class CodexProvider(BaseLLMProvider):
             output_tokens=output_tokens,
             model=model,
             finish_reason="stop",
-            raw_response={"stdout": stdout_text, "stderr": stderr_text},
+            raw_response={"stdout": stdout_text, "stderr": stderr_text} if self.keep_raw_response else None,
         )
 
     async def _run_codex_command(
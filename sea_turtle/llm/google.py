@@ -1,12 +1,96 @@
 """Google Gemini LLM provider implementation."""
 
+import asyncio
 import json
-from typing import Any
+from typing import Any, Callable
 
 from google import genai
-from google.genai import types
+from google.genai import errors, types
 
-from sea_turtle.llm.base import BaseLLMProvider, LLMResponse, ToolDefinition
+from sea_turtle.llm.base import (
+    DEFAULT_MAX_CONCURRENT,
+    BaseLLMProvider,
+    LLMResponse,
+    ToolDefinition,
+    ToolSchemaCache,
+    call_with_retry,
+    coalesce_chunks,
+)
+from sea_turtle.llm.cache import SemanticCache, lookup_response
+
+EMBEDDING_MODEL = "text-embedding-004"
+
+RETRYABLE_STATUS_CODES = frozenset({429, 503, 504})
+
+# One client per API key, shared by every GoogleProvider in the process so
+# provider re-creation (model switches) reuses its connections.
+_clients: dict[str, genai.Client] = {}
+
+
+def _get_client(api_key: str) -> genai.Client:
+    client = _clients.get(api_key)
+    if client is None:
+        client = _clients[api_key] = genai.Client(api_key=api_key)
+    return client
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    return isinstance(exc, errors.APIError) and exc.code in RETRYABLE_STATUS_CODES
+
+
+def _convert_tools(tools: list[ToolDefinition]) -> list[types.Tool]:
+    function_declarations = [
+        types.FunctionDeclaration(
+            name=tool.name,
+            description=tool.description,
+            parameters=tool.parameters,
+        )
+        for tool in tools
+    ]
+    return [types.Tool(function_declarations=function_declarations)]
+
+
+async def _stream_text(stream):
+    async for chunk in stream:
+        if chunk.text:
+            yield chunk.text
+
+
+def _user_content(msg: dict[str, Any]) -> types.Content:
+    return types.Content(role="user", parts=[types.Part.from_text(text=msg["content"])])
+
+
+def _model_content(msg: dict[str, Any]) -> types.Content | None:
+    parts = []
+    if msg["content"]:
+        parts.append(types.Part.from_text(text=msg["content"]))
+    from_function_call = types.Part.from_function_call
+    for tool_call in msg.get("tool_calls", []):
+        parts.append(from_function_call(
+            name=tool_call["name"],
+            args=tool_call.get("arguments", {}),
+        ))
+    if not parts:
+        return None
+    return types.Content(role="model", parts=parts)
+
+
+def _tool_content(msg: dict[str, Any]) -> types.Content:
+    # Tool results go back to the model as a user turn.
+    return types.Content(
+        role="user",
+        parts=[types.Part.from_function_response(
+            name=msg.get("name", "tool"),
+            response={"result": msg["content"]},
+        )],
+    )
+
+
+_ROLE_CONVERTERS: dict[str, Callable[[dict[str, Any]], types.Content | None]] = {
+    "user": _user_content,
+    "assistant": _model_content,
+    "tool": _tool_content,
+}
 
 
 class GoogleProvider(BaseLLMProvider):
@@ -14,23 +98,22 @@ class GoogleProvider(BaseLLMProvider):
 
     def __init__(self, api_key: str, **kwargs):
         super().__init__(api_key, **kwargs)
-        self.client = genai.Client(api_key=api_key)
+        self.client = _get_client(api_key)
+        self._sem = asyncio.Semaphore(kwargs.get("max_concurrent", DEFAULT_MAX_CONCURRENT))
+        self._tools_cache = ToolSchemaCache(_convert_tools)
+        self._cache_namespace = type(self).__name__
+        self.embedding_model = kwargs.get("embedding_model") or EMBEDDING_MODEL
+        self.semantic_cache = SemanticCache(self._embed) if kwargs.get("semantic_cache") else None
+
+    async def _embed(self, text: str) -> list[float]:
+        response = await self.client.aio.models.embed_content(model=self.embedding_model, contents=text)
+        return list(response.embeddings[0].values)
 
     def _build_tools(self, tools: list[ToolDefinition] | None) -> list[types.Tool] | None:
         """Convert ToolDefinition list to Google's tool format."""
         if not tools:
             return None
-
-        function_declarations = []
-        for tool in tools:
-            func_decl = types.FunctionDeclaration(
-                name=tool.name,
-                description=tool.description,
-                parameters=tool.parameters,
-            )
-            function_declarations.append(func_decl)
-
-        return [types.Tool(function_declarations=function_declarations)]
+        return self._tools_cache.get(tools)
 
     def _convert_messages(self, messages: list[dict[str, Any]]) -> tuple[str | None, list[types.Content]]:
         """Convert standard messages to Google format.
@@ -40,35 +123,19 @@ class GoogleProvider(BaseLLMProvider):
         """
         system_instruction = None
         contents = []
+        append = contents.append
+        converters = _ROLE_CONVERTERS
 
         for msg in messages:
             role = msg["role"]
-            content = msg["content"]
-
             if role == "system":
-                system_instruction = content
-            elif role == "user":
-                contents.append(types.Content(role="user", parts=[types.Part.from_text(text=content)]))
-            elif role == "assistant":
-                parts = []
-                if content:
-                    parts.append(types.Part.from_text(text=content))
-                for tool_call in msg.get("tool_calls", []):
-                    parts.append(types.Part.from_function_call(
-                        name=tool_call["name"],
-                        args=tool_call.get("arguments", {}),
-                    ))
-                if parts:
-                    contents.append(types.Content(role="model", parts=parts))
-            elif role == "tool":
-                # Tool result message
-                contents.append(types.Content(
-                    role="user",
-                    parts=[types.Part.from_function_response(
-                        name=msg.get("name", "tool"),
-                        response={"result": content},
-                    )],
-                ))
+                system_instruction = msg["content"]
+                continue
+            convert = converters.get(role)
+            if convert is not None:
+                converted = convert(msg)
+                if converted is not None:
+                    append(converted)
 
         return system_instruction, contents
 
@@ -94,7 +161,21 @@ class GoogleProvider(BaseLLMProvider):
         tools: list[ToolDefinition] | None = None,
         tool_choice: str = "auto",
         metadata: dict[str, Any] | None = None,
+        use_cache: bool | None = None,
     ) -> LLMResponse:
+        """Send a chat request, serving identical deterministic requests from cache.
+
+        Responses are cached only when ``temperature <= 0`` unless ``use_cache``
+        is passed explicitly. With ``semantic_cache`` enabled, a request that
+        differs only in a near-duplicate final user prompt is also a hit.
+        """
+        cache = await lookup_response(
+            self._cache_namespace, self.semantic_cache, model, messages,
+            temperature, max_output_tokens, tools, tool_choice, use_cache,
+        )
+        if cache.hit is not None:
+            return cache.hit
+
         system_instruction, contents = self._convert_messages(messages)
         google_tools = self._build_tools(tools)
 
@@ -107,10 +188,14 @@ class GoogleProvider(BaseLLMProvider):
         if google_tools:
             config.tools = google_tools
 
-        response = await self.client.aio.models.generate_content(
-            model=model,
-            contents=contents,
-            config=config,
+        response = await call_with_retry(
+            lambda: self.client.aio.models.generate_content(
+                model=model,
+                contents=contents,
+                config=config,
+            ),
+            self._sem,
+            _is_retryable,
         )
 
         content = ""
@@ -129,15 +214,17 @@ class GoogleProvider(BaseLLMProvider):
         if response.candidates and response.candidates[0].finish_reason:
             finish_reason = str(response.candidates[0].finish_reason)
 
-        return LLMResponse(
+        result = LLMResponse(
             content=content,
             tool_calls=tool_calls,
             input_tokens=input_tokens,
             output_tokens=output_tokens,
             model=model,
             finish_reason=finish_reason,
-            raw_response=response,
+            raw_response=response if self.keep_raw_response else None,
         )
+        cache.store(result)
+        return result
 
     async def chat_stream(
         self,
@@ -156,10 +243,56 @@ class GoogleProvider(BaseLLMProvider):
         if system_instruction:
             config.system_instruction = system_instruction
 
+        stream = self.client.aio.models.generate_content_stream(
+            model=model,
+            contents=contents,
+            config=config,
+        )
+        async for text in coalesce_chunks(_stream_text(stream)):
+            yield text
+
+    async def chat_stream_events(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float = 0.7,
+        max_output_tokens: int = 8192,
+        tools: list[ToolDefinition] | None = None,
+        metadata: dict[str, Any] | None = None,
+    ):
+        """Stream typed events, including tool calls, as parts arrive.
+
+        Unlike ``chat_stream`` (text only), this passes ``tools`` to the model
+        and yields ``{"type": "text", "data": str}`` and
+        ``{"type": "tool_call", "data": {"name": ..., "arguments": {...}}}``
+        so a caller can start a tool while the rest of the reply streams.
+        Gemini emits each function call whole within one chunk.
+        """
+        system_instruction, contents = self._convert_messages(messages)
+
+        config = types.GenerateContentConfig(
+            temperature=temperature,
+            max_output_tokens=max_output_tokens,
+        )
+        if system_instruction:
+            config.system_instruction = system_instruction
+        google_tools = self._build_tools(tools)
+        if google_tools:
+            config.tools = google_tools
+
         async for chunk in self.client.aio.models.generate_content_stream(
             model=model,
             contents=contents,
             config=config,
         ):
-            if chunk.text:
-                yield chunk.text
+            if not chunk.candidates or not chunk.candidates[0].content:
+                continue
+            for part in chunk.candidates[0].content.parts or ():
+                if part.function_call:
+                    fc = part.function_call
+                    yield {
+                        "type": "tool_call",
+                        "data": {"name": fc.name, "arguments": dict(fc.args) if fc.args else {}},
+                    }
+                elif part.text and not getattr(part, "thought", False):
+                    yield {"type": "text", "data": part.text}
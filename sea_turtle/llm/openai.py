@@ -1,11 +1,81 @@
 """OpenAI LLM provider implementation."""
 
+import asyncio
+import importlib.util
 import json
 from typing import Any
 
-from openai import AsyncOpenAI
+import httpx
+import openai
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
-from sea_turtle.llm.base import BaseLLMProvider, LLMResponse, ToolDefinition
+from sea_turtle.llm.base import (
+    DEFAULT_MAX_CONCURRENT,
+    BaseLLMProvider,
+    LLMResponse,
+    ToolDefinition,
+    ToolSchemaCache,
+    call_with_retry,
+    coalesce_chunks,
+    warm_up_connection,
+)
+from sea_turtle.llm.cache import SemanticCache, lookup_response
+
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib decoder
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_POLL_INITIAL_SECONDS = 5.0
+BATCH_POLL_MAX_SECONDS = 60.0
+BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+# Pooled HTTP client shared by every OpenAI-compatible provider in the process
+# (OpenAI, OpenRouter, xAI); connections are keyed per host by httpx.
+_shared_http_client: httpx.AsyncClient | None = None
+
+
+def _get_shared_http_client() -> httpx.AsyncClient:
+    global _shared_http_client
+    if _shared_http_client is None:
+        _shared_http_client = DefaultAsyncHttpxClient(
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+            http2=importlib.util.find_spec("h2") is not None,
+        )
+    return _shared_http_client
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    # Same policy as the SDK's built-in retries: connection errors and
+    # timeouts, 408, 409 (lock conflict), 429 and 5xx.
+    if isinstance(exc, (openai.APIConnectionError, openai.RateLimitError, openai.InternalServerError)):
+        return True
+    return isinstance(exc, openai.APIStatusError) and exc.status_code in (408, 409)
+
+
+def _convert_tools(tools: list[ToolDefinition]) -> list[dict]:
+    return [
+        {
+            "type": "function",
+            "function": {
+                "name": t.name,
+                "description": t.description,
+                "parameters": t.parameters,
+            },
+        }
+        for t in tools
+    ]
+
+
+async def _stream_text(stream):
+    async for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
 
 
 class OpenAIProvider(BaseLLMProvider):
@@ -13,23 +83,40 @@ class OpenAIProvider(BaseLLMProvider):
 
     def __init__(self, api_key: str, base_url: str | None = None, **kwargs):
         super().__init__(api_key, **kwargs)
-        self.client = AsyncOpenAI(api_key=api_key, base_url=base_url)
+        # Retries are handled by _call so they share the semaphore.
+        self.client = AsyncOpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            http_client=_get_shared_http_client(),
+            max_retries=0,
+        )
+        self._sem = asyncio.Semaphore(kwargs.get("max_concurrent", DEFAULT_MAX_CONCURRENT))
+        self._tools_cache = ToolSchemaCache(_convert_tools)
+        self._cache_namespace = f"{type(self).__name__}:{base_url or ''}"
+        # OpenAI-compatible endpoints (OpenRouter, xAI) do not serve OpenAI's
+        # embedding models; without an explicit model they match on
+        # normalized prompt text only.
+        self.embedding_model = kwargs.get("embedding_model") or (EMBEDDING_MODEL if base_url is None else None)
+        self.semantic_cache = None
+        if kwargs.get("semantic_cache"):
+            self.semantic_cache = SemanticCache(self._embed if self.embedding_model else None)
+
+    async def _call(self, call):
+        """Run an SDK request under the concurrency limit with retries."""
+        return await call_with_retry(call, self._sem, _is_retryable)
+
+    async def _embed(self, text: str) -> list[float]:
+        response = await self._call(lambda: self.client.embeddings.create(model=self.embedding_model, input=text))
+        return response.data[0].embedding
+
+    async def warm_up(self) -> None:
+        await warm_up_connection(_get_shared_http_client(), str(self.client.base_url))
 
     def _build_tools(self, tools: list[ToolDefinition] | None) -> list[dict] | None:
         """Convert ToolDefinition list to OpenAI's tool format."""
         if not tools:
             return None
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": t.name,
-                    "description": t.description,
-                    "parameters": t.parameters,
-                },
-            }
-            for t in tools
-        ]
+        return self._tools_cache.get(tools)
 
     def _extract_tool_calls(self, message) -> list[dict[str, Any]]:
         """Extract tool calls from OpenAI response message."""
@@ -39,8 +126,8 @@ class OpenAIProvider(BaseLLMProvider):
                 args = {}
                 if tc.function.arguments:
                     try:
-                        args = json.loads(tc.function.arguments)
-                    except json.JSONDecodeError:
+                        args = _loads(tc.function.arguments)
+                    except ValueError:  # json/orjson JSONDecodeError
                         args = {"raw": tc.function.arguments}
                 tool_calls.append({
                     "id": tc.id,
@@ -82,16 +169,16 @@ class OpenAIProvider(BaseLLMProvider):
                 converted.append({"role": role, "content": content})
         return converted
 
-    async def chat(
+    def _build_request(
         self,
-        messages: list[dict[str, str]],
+        messages: list[dict[str, Any]],
         model: str,
-        temperature: float = 0.7,
-        max_output_tokens: int = 8192,
-        tools: list[ToolDefinition] | None = None,
-        tool_choice: str = "auto",
-        metadata: dict[str, Any] | None = None,
-    ) -> LLMResponse:
+        temperature: float,
+        max_output_tokens: int,
+        tools: list[ToolDefinition] | None,
+        tool_choice: str,
+    ) -> dict[str, Any]:
+        """Build chat-completions request parameters."""
         kwargs: dict[str, Any] = {
             "model": model,
             "messages": self._convert_messages(messages),
@@ -103,9 +190,10 @@ class OpenAIProvider(BaseLLMProvider):
         if openai_tools:
             kwargs["tools"] = openai_tools
             kwargs["tool_choice"] = tool_choice
+        return kwargs
 
-        response = await self.client.chat.completions.create(**kwargs)
-
+    def _to_llm_response(self, response, model: str) -> LLMResponse:
+        """Convert a ChatCompletion into an LLMResponse."""
         message = response.choices[0].message
         content = message.content or ""
         tool_calls = self._extract_tool_calls(message)
@@ -120,9 +208,135 @@ class OpenAIProvider(BaseLLMProvider):
             output_tokens=output_tokens,
             model=model,
             finish_reason=response.choices[0].finish_reason or "",
-            raw_response=response,
+            raw_response=response if self.keep_raw_response else None,
         )
 
+    async def chat(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float = 0.7,
+        max_output_tokens: int = 8192,
+        tools: list[ToolDefinition] | None = None,
+        tool_choice: str = "auto",
+        metadata: dict[str, Any] | None = None,
+        use_cache: bool | None = None,
+    ) -> LLMResponse:
+        """Send a chat request, serving identical deterministic requests from cache.
+
+        Responses are cached only when ``temperature <= 0`` unless ``use_cache``
+        is passed explicitly. With ``semantic_cache`` enabled, a request that
+        differs only in a near-duplicate final user prompt is also a hit.
+        """
+        cache = await lookup_response(
+            self._cache_namespace, self.semantic_cache, model, messages,
+            temperature, max_output_tokens, tools, tool_choice, use_cache,
+        )
+        if cache.hit is not None:
+            return cache.hit
+
+        kwargs = self._build_request(
+            messages, model, temperature, max_output_tokens, tools, tool_choice
+        )
+        response = await self._call(lambda: self.client.chat.completions.create(**kwargs))
+
+        result = self._to_llm_response(response, model)
+        cache.store(result)
+        return result
+
+    async def batch_chat(
+        self,
+        requests: list[dict[str, Any]],
+        completion_window: str = "24h",
+    ) -> list[LLMResponse]:
+        """Run many chat requests through the OpenAI Batch API.
+
+        Batches are billed at a discount but complete asynchronously (up to
+        ``completion_window``), so this is for offline work such as bulk
+        summarization or evals, not interactive turns.
+
+        Args:
+            requests: One dict per request with ``chat()`` keyword arguments
+                (``messages``, ``model`` and optionally ``temperature``,
+                ``max_output_tokens``, ``tools``, ``tool_choice``).
+            completion_window: Batch completion window.
+
+        Returns:
+            LLMResponses in request order. Requests that failed inside the
+            batch get ``finish_reason="error"`` with the error in ``content``.
+
+        Raises:
+            RuntimeError: If the batch itself fails, expires or is cancelled.
+        """
+        if not requests:
+            return []
+        from openai.types.chat import ChatCompletion
+
+        lines = []
+        for index, request in enumerate(requests):
+            body = self._build_request(
+                request["messages"],
+                request["model"],
+                request.get("temperature", 0.7),
+                request.get("max_output_tokens", 8192),
+                request.get("tools"),
+                request.get("tool_choice", "auto"),
+            )
+            lines.append(json.dumps({
+                "custom_id": str(index),
+                "method": "POST",
+                "url": BATCH_ENDPOINT,
+                "body": body,
+            }, ensure_ascii=False))
+
+        input_file = await self._call(lambda: self.client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        ))
+        batch = await self._call(lambda: self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=completion_window,
+        ))
+
+        delay = BATCH_POLL_INITIAL_SECONDS
+        while batch.status not in BATCH_TERMINAL_STATUSES:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, BATCH_POLL_MAX_SECONDS)
+            batch_id = batch.id
+            batch = await self._call(lambda: self.client.batches.retrieve(batch_id))
+
+        if batch.status != "completed":
+            raise RuntimeError(f"OpenAI batch {batch.id} ended with status '{batch.status}'")
+
+        results = [
+            LLMResponse(model=request["model"], finish_reason="error", content="missing from batch output")
+            for request in requests
+        ]
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            output = await self._call(lambda: self.client.files.content(file_id))
+            for line in output.text.splitlines():
+                if not line.strip():
+                    continue
+                record = _loads(line)
+                index = int(record["custom_id"])
+                model = requests[index]["model"]
+                response = record.get("response") or {}
+                if response.get("status_code") == 200:
+                    completion = ChatCompletion.model_validate(response["body"])
+                    results[index] = self._to_llm_response(completion, model)
+                else:
+                    error = record.get("error") or response.get("body", {}).get("error") or {}
+                    results[index] = LLMResponse(
+                        content=str(error.get("message", error)),
+                        model=model,
+                        finish_reason="error",
+                        raw_response=record if self.keep_raw_response else None,
+                    )
+        return results
+
     async def chat_stream(
         self,
         messages: list[dict[str, str]],
@@ -131,13 +345,13 @@ class OpenAIProvider(BaseLLMProvider):
         max_output_tokens: int = 8192,
         metadata: dict[str, Any] | None = None,
     ):
-        stream = await self.client.chat.completions.create(
+        # Only opening the stream is retried; a broken stream is not replayed.
+        stream = await self._call(lambda: self.client.chat.completions.create(
             model=model,
             messages=self._convert_messages(messages),
             temperature=temperature,
             max_tokens=max_output_tokens,
             stream=True,
-        )
-        async for chunk in stream:
-            if chunk.choices and chunk.choices[0].delta.content:
-                yield chunk.choices[0].delta.content
+        ))
+        async for text in coalesce_chunks(_stream_text(stream)):
+            yield text
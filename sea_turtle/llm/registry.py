@@ -1,10 +1,12 @@
 """Model registry with preset model lists and pricing for all supported providers."""
 
-from dataclasses import dataclass, field
-from typing import ClassVar
+import io
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from types import MappingProxyType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModelInfo:
     """Information about a single LLM model."""
     name: str
@@ -17,17 +19,17 @@ class ModelInfo:
 
 
 # --- Google Gemini ---
-GOOGLE_MODELS: list[ModelInfo] = [
+GOOGLE_MODELS: tuple[ModelInfo, ...] = (
     ModelInfo("gemini-2.5-pro", "google", 1_000_000, 1.25, 10.0, "Most capable reasoning model"),
     ModelInfo("gemini-2.5-flash", "google", 1_000_000, 0.15, 0.60, "Best price-performance (default)"),
     ModelInfo("gemini-2.0-flash", "google", 1_000_000, 0.10, 0.40, "Fast responses"),
     ModelInfo("gemini-2.0-flash-lite", "google", 1_000_000, 0.075, 0.30, "Lowest cost"),
     ModelInfo("gemini-1.5-pro", "google", 2_000_000, 1.25, 5.00, "Long context"),
     ModelInfo("gemini-1.5-flash", "google", 1_000_000, 0.075, 0.30, "Lightweight fast"),
-]
+)
 
 # --- OpenAI ---
-OPENAI_MODELS: list[ModelInfo] = [
+OPENAI_MODELS: tuple[ModelInfo, ...] = (
     ModelInfo("gpt-4o", "openai", 128_000, 2.50, 10.00, "Flagship multimodal"),
     ModelInfo("gpt-4o-mini", "openai", 128_000, 0.15, 0.60, "Small and fast"),
     ModelInfo("gpt-4.1", "openai", 1_000_000, 2.00, 8.00, "Latest flagship"),
@@ -36,37 +38,41 @@ OPENAI_MODELS: list[ModelInfo] = [
     ModelInfo("o3", "openai", 200_000, 10.00, 40.00, "Advanced reasoning"),
     ModelInfo("o3-mini", "openai", 200_000, 1.10, 4.40, "Efficient reasoning"),
     ModelInfo("o4-mini", "openai", 200_000, 1.10, 4.40, "Latest reasoning"),
-]
+)
 
 # --- Anthropic (Claude) ---
-ANTHROPIC_MODELS: list[ModelInfo] = [
+ANTHROPIC_MODELS: tuple[ModelInfo, ...] = (
     ModelInfo("claude-sonnet-4-20250514", "anthropic", 200_000, 3.00, 15.00, "Latest Sonnet"),
     ModelInfo("claude-3.5-sonnet-20241022", "anthropic", 200_000, 3.00, 15.00, "Sonnet 3.5"),
     ModelInfo("claude-3.5-haiku-20241022", "anthropic", 200_000, 0.80, 4.00, "Fast and affordable"),
-]
+)
 
 # --- xAI (Grok) ---
-XAI_MODELS: list[ModelInfo] = [
+XAI_MODELS: tuple[ModelInfo, ...] = (
     ModelInfo("grok-3", "xai", 131_072, 3.00, 15.00, "Flagship Grok"),
     ModelInfo("grok-3-mini", "xai", 131_072, 0.30, 0.50, "Fast Grok"),
-]
+)
 
 # --- Local / Codex CLI ---
-CODEX_MODELS: list[ModelInfo] = [
+CODEX_MODELS: tuple[ModelInfo, ...] = (
     ModelInfo("codex-oss", "codex", 0, 0.0, 0.0, "Local Codex CLI with OSS provider", supports_tools=False),
     ModelInfo("codex-cloud", "codex", 0, 0.0, 0.0, "Codex CLI with logged-in cloud account", supports_tools=False),
     ModelInfo("codex-5.4", "codex", 0, 0.0, 0.0, "Codex CLI pinned to gpt-5.4", supports_tools=False),
     ModelInfo("codex-spark", "codex", 0, 0.0, 0.0, "Codex CLI pinned to spark tier", supports_tools=False),
-]
+)
 
 # --- All preset models ---
-ALL_MODELS: list[ModelInfo] = GOOGLE_MODELS + OPENAI_MODELS + ANTHROPIC_MODELS + XAI_MODELS + CODEX_MODELS
-
-# --- Lookup maps ---
-MODEL_BY_NAME: dict[str, ModelInfo] = {m.name: m for m in ALL_MODELS}
-MODELS_BY_PROVIDER: dict[str, list[ModelInfo]] = {}
-for _m in ALL_MODELS:
-    MODELS_BY_PROVIDER.setdefault(_m.provider, []).append(_m)
+ALL_MODELS: tuple[ModelInfo, ...] = GOOGLE_MODELS + OPENAI_MODELS + ANTHROPIC_MODELS + XAI_MODELS + CODEX_MODELS
+
+# --- Lookup maps (read-only) ---
+MODEL_BY_NAME: Mapping[str, ModelInfo] = MappingProxyType({m.name: m for m in ALL_MODELS})
+MODELS_BY_PROVIDER: Mapping[str, tuple[ModelInfo, ...]] = MappingProxyType({
+    "google": GOOGLE_MODELS,
+    "openai": OPENAI_MODELS,
+    "anthropic": ANTHROPIC_MODELS,
+    "xai": XAI_MODELS,
+    "codex": CODEX_MODELS,
+})
 
 SUPPORTED_PROVIDERS = ["google", "openai", "anthropic", "openrouter", "xai", "codex"]
 
@@ -75,23 +81,35 @@ DISPLAY_MODEL_ALIASES: dict[str, str] = {
     "codex-spark": "gpt-5.3-codex-spark",
 }
 
+# Name prefixes used to guess the provider of models missing from the registry.
+_PROVIDER_PREFIXES: tuple[tuple[str, str], ...] = (
+    ("gemini", "google"),
+    ("gpt", "openai"),
+    ("o3", "openai"),
+    ("o4", "openai"),
+    ("claude", "anthropic"),
+    ("grok", "xai"),
+    ("codex", "codex"),
+)
+_PROVIDER_PREFIX_KEYS = tuple(prefix for prefix, _ in _PROVIDER_PREFIXES)
+
 
 def get_model_info(model_name: str) -> ModelInfo | None:
     """Look up a model by name. Returns None if not found in registry."""
     return MODEL_BY_NAME.get(model_name)
 
 
-def list_models(provider: str | None = None) -> list[ModelInfo]:
+def list_models(provider: str | None = None) -> tuple[ModelInfo, ...]:
     """List available models, optionally filtered by provider.
 
     Args:
         provider: Filter by provider name. None returns all models.
 
     Returns:
-        List of ModelInfo objects.
+        Tuple of ModelInfo objects.
     """
     if provider:
-        return MODELS_BY_PROVIDER.get(provider, [])
+        return MODELS_BY_PROVIDER.get(provider, ())
     return ALL_MODELS
 
 
@@ -130,42 +148,55 @@ def resolve_provider(model_name: str, default_provider: str = "google") -> str:
         return info.provider
 
     # Heuristic: detect provider from model name prefix
-    if model_name.startswith("gemini"):
-        return "google"
-    elif model_name.startswith("gpt") or model_name.startswith("o3") or model_name.startswith("o4"):
-        return "openai"
-    elif model_name.startswith("claude"):
-        return "anthropic"
-    elif model_name.startswith("grok"):
-        return "xai"
-    elif model_name.startswith("codex"):
-        return "codex"
-    elif "/" in model_name:
+    if model_name.startswith(_PROVIDER_PREFIX_KEYS):
+        for prefix, provider in _PROVIDER_PREFIXES:
+            if model_name.startswith(prefix):
+                return provider
+    if "/" in model_name:
         return "openrouter"
 
     return default_provider
 
 
-def format_model_list(models: list[ModelInfo]) -> str:
+_HEADER_ROW = f"{'Model':<35} {'Context':>10} {'Input $/1M':>12} {'Output $/1M':>12}\n" + "-" * 72 + "\n"
+_ROW_FMT = "{:<35} {:>10} {:>12} {:>12}\n".format
+
+
+def format_model_list(models: Sequence[ModelInfo]) -> str:
     """Format a list of models for display.
 
     Returns:
         Formatted string table.
     """
+    for preset, text in _FORMATTED_PRESETS:
+        if models is preset:
+            return text
+    return _format_models(models)
+
+
+def _format_models(models: Sequence[ModelInfo]) -> str:
     if not models:
         return "No models found."
 
-    lines = []
+    buf = io.StringIO()
+    write = buf.write
     current_provider = ""
     for m in models:
         if m.provider != current_provider:
             if current_provider:
-                lines.append("")
-            lines.append(f"📦 {m.provider.upper()}")
-            lines.append(f"{'Model':<35} {'Context':>10} {'Input $/1M':>12} {'Output $/1M':>12}")
-            lines.append("-" * 72)
+                write("\n")
+            write(f"📦 {m.provider.upper()}\n")
+            write(_HEADER_ROW)
             current_provider = m.provider
         ctx = f"{m.context_window // 1000}K" if m.context_window < 1_000_000 else f"{m.context_window // 1_000_000}M"
-        lines.append(f"{m.name:<35} {ctx:>10} {f'${m.input_price_per_1m:.3f}':>12} {f'${m.output_price_per_1m:.3f}':>12}")
+        write(_ROW_FMT(m.name, ctx, f"${m.input_price_per_1m:.3f}", f"${m.output_price_per_1m:.3f}"))
+
+    # Rows end in a newline; the table itself does not.
+    return buf.getvalue()[:-1]
+
 
-    return "\n".join(lines)
+# The preset tables never change, so list_models() results are formatted once.
+_FORMATTED_PRESETS: tuple[tuple[tuple[ModelInfo, ...], str], ...] = (
+    (ALL_MODELS, _format_models(ALL_MODELS)),
+    *((models, _format_models(models)) for models in MODELS_BY_PROVIDER.values()),
+)
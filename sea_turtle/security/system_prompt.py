@@ -4,8 +4,10 @@ These prompts are hardcoded and cannot be overridden by user rules.md.
 The system safety prompt is always prepended to the system prompt.
 """
 
+import functools
 import platform
 import os
+import re
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -100,16 +102,62 @@ TOOL_GUIDANCE_SECTION = """\
 - Ask for confirmation before any destructive or privilege-changing command.
 """
 
+@functools.lru_cache(maxsize=1)
 def get_os_info() -> dict[str, str]:
-    """Get current OS information."""
+    """Get current OS information.
+
+    The result is fixed for the life of the process and shared between
+    callers, so treat it as read-only.
+    """
+    uname = platform.uname()
     return {
-        "os_name": platform.system(),
-        "os_arch": platform.machine(),
-        "os_info": f"{platform.system()} {platform.release()} ({platform.machine()})",
+        "os_name": uname.system,
+        "os_arch": uname.machine,
+        "os_info": f"{uname.system} {uname.release} ({uname.machine})",
         "shell_name": os.environ.get("SHELL", "/bin/sh").split("/")[-1],
     }
 
 
+# Rendered templates are cached: the inputs repeat on nearly every turn, so
+# the large .format() calls only run when the environment or config changes.
+@functools.lru_cache(maxsize=32)
+def _render_safety(os_name: str, os_arch: str, shell_name: str, timeout: int, sandbox_mode: str) -> str:
+    return SYSTEM_SAFETY_PROMPT.format(
+        os_name=os_name,
+        os_arch=os_arch,
+        shell_name=shell_name,
+        timeout=timeout,
+        sandbox_mode=sandbox_mode,
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _render_agent_context(
+    agent_id: str,
+    agent_name: str,
+    human_name: str,
+    workspace_path: str,
+    model_name: str,
+    sandbox_mode: str,
+    channel_name: str,
+    tools_list: str,
+    os_info: str,
+    current_date: str,
+) -> str:
+    return AGENT_CONTEXT_PROMPT.format(
+        agent_id=agent_id,
+        agent_name=agent_name,
+        human_name=human_name,
+        workspace_path=workspace_path,
+        model_name=model_name,
+        sandbox_mode=sandbox_mode,
+        channel_name=channel_name,
+        tools_list=tools_list,
+        os_info=os_info,
+        current_date=current_date,
+    )
+
+
 def build_system_prompt(
     agent_id: str,
     agent_config: dict,
@@ -145,30 +193,29 @@ def build_system_prompt(
     parts = []
 
     # 1. System safety prompt (immutable)
-    safety = SYSTEM_SAFETY_PROMPT.format(
-        os_name=os_info["os_name"],
-        os_arch=os_info["os_arch"],
-        shell_name=os_info["shell_name"],
-        timeout=shell_config.get("timeout_seconds", 30),
-        sandbox_mode=agent_config.get("sandbox", "confined"),
-    )
-    parts.append(safety)
+    sandbox_mode = agent_config.get("sandbox", "confined")
+    parts.append(_render_safety(
+        os_info["os_name"],
+        os_info["os_arch"],
+        os_info["shell_name"],
+        shell_config.get("timeout_seconds", 30),
+        sandbox_mode,
+    ))
 
     # 2. Agent context
     tools = agent_config.get("tools", [])
-    context = AGENT_CONTEXT_PROMPT.format(
-        agent_id=agent_id,
-        agent_name=agent_config.get("name", "Turtle"),
-        human_name=agent_config.get("human_name", "Human"),
-        workspace_path=agent_config.get("workspace", "./agents/default"),
-        model_name=get_display_model_name(agent_config.get("model", "gemini-2.5-flash")),
-        sandbox_mode=agent_config.get("sandbox", "confined"),
-        channel_name=channel_name,
-        tools_list=", ".join(tools) if tools else "none",
-        os_info=os_info["os_info"],
-        current_date=datetime.now(timezone.utc).strftime("%Y-%m-%d UTC"),
-    )
-    parts.append(context)
+    parts.append(_render_agent_context(
+        agent_id,
+        agent_config.get("name", "Turtle"),
+        agent_config.get("human_name", "Human"),
+        agent_config.get("workspace", "./agents/default"),
+        get_display_model_name(agent_config.get("model", "gemini-2.5-flash")),
+        sandbox_mode,
+        channel_name,
+        ", ".join(tools) if tools else "none",
+        os_info["os_info"],
+        datetime.now(timezone.utc).strftime("%Y-%m-%d UTC"),
+    ))
 
     discord_meta = _build_discord_untrusted_context(discord_context)
     if discord_meta:
@@ -311,10 +358,13 @@ def _build_discord_untrusted_context(discord_context: dict | None) -> str:
     )
 
 
+# Every boundary str.splitlines() splits on, not just "\n", so a bare "\r"
+# (or "\f", "\u2028", ...) starts a new line here too.
+_LINE_BREAKS = r"\n\r\v\f\x1c-\x1e\x85\u2028\u2029"
+# First line whose first non-blank character does not open a header or comment.
+_SKILLS_CONTENT_RE = re.compile(rf"(?:^|[{_LINE_BREAKS}])[^\S{_LINE_BREAKS}]*(?!#|<!--)\S")
+
+
 def _is_empty_skills(content: str) -> bool:
     """Check if skills content is effectively empty (only comments/headers)."""
-    for line in content.splitlines():
-        stripped = line.strip()
-        if stripped and not stripped.startswith("#") and not stripped.startswith("<!--"):
-            return False
-    return True
+    return _SKILLS_CONTENT_RE.search(content) is None
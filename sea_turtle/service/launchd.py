@@ -68,15 +68,39 @@ def _generate_plist() -> str:
     )
 
 
+def _is_installed(plist_content: str) -> bool:
+    """Return True if the installed plist already matches ``plist_content``."""
+    try:
+        return PLIST_PATH.read_bytes() == plist_content.encode("utf-8")
+    except OSError:
+        return False
+
+
+def _is_loaded() -> bool:
+    """Return True if launchd currently has the service loaded."""
+    try:
+        result = subprocess.run(["launchctl", "list", SERVICE_LABEL], capture_output=True)
+    except OSError:
+        return False
+    return result.returncode == 0
+
+
 def install_launchd_service() -> None:
     """Install Sea Turtle as a launchd service (macOS)."""
     plist_content = _generate_plist()
+    plist_current = _is_installed(plist_content)
+    if plist_current and _is_loaded():
+        print(f"Launchd service {SERVICE_LABEL} is already installed and up to date.")
+        return
 
     print(f"Installing launchd service: {SERVICE_LABEL}")
     print(f"Plist file: {PLIST_PATH}")
     print()
-    print("Plist content:")
-    print(plist_content)
+    if plist_current:
+        print("Plist is up to date; the service will be loaded.")
+    else:
+        print("Plist content:")
+        print(plist_content)
 
     confirm = input("Proceed? [y/N]: ").strip().lower()
     if confirm != "y":
@@ -89,7 +113,8 @@ def install_launchd_service() -> None:
     log_dir.mkdir(parents=True, exist_ok=True)
 
     try:
-        PLIST_PATH.write_text(plist_content)
+        if not plist_current:
+            PLIST_PATH.write_text(plist_content)
         subprocess.run(["launchctl", "load", str(PLIST_PATH)], check=True)
         print(f"\n✅ Service installed and loaded.")
         print(f"  Start: launchctl start {SERVICE_LABEL}")
@@ -1,6 +1,7 @@
 """systemd service management for Linux."""
 
 import os
+import shlex
 import shutil
 import subprocess
 import sys
@@ -55,15 +56,39 @@ def _generate_unit() -> str:
     )
 
 
+def _is_installed(unit_content: str) -> bool:
+    """Return True if the installed unit file already matches ``unit_content``."""
+    try:
+        return Path(SERVICE_FILE).read_bytes() == unit_content.encode("utf-8")
+    except OSError:
+        return False
+
+
+def _is_enabled() -> bool:
+    """Return True if systemd reports the service as enabled."""
+    try:
+        result = subprocess.run(["systemctl", "is-enabled", "--quiet", SERVICE_NAME])
+    except OSError:
+        return False
+    return result.returncode == 0
+
+
 def install_systemd_service() -> None:
     """Install Sea Turtle as a systemd service."""
     unit_content = _generate_unit()
+    unit_current = _is_installed(unit_content)
+    if unit_current and _is_enabled():
+        print(f"Systemd service {SERVICE_NAME} is already installed and up to date.")
+        return
 
     print(f"Installing systemd service: {SERVICE_NAME}")
     print(f"Service file: {SERVICE_FILE}")
     print()
-    print("Unit file content:")
-    print(unit_content)
+    if unit_current:
+        print("Unit file is up to date; the service will be re-enabled.")
+    else:
+        print("Unit file content:")
+        print(unit_content)
 
     confirm = input("Proceed? (requires sudo) [y/N]: ").strip().lower()
     if confirm != "y":
@@ -72,12 +97,15 @@ def install_systemd_service() -> None:
 
     # Write unit file
     tmp_file = Path("/tmp/sea-turtle.service")
-    tmp_file.write_text(unit_content)
+    if not unit_current:
+        tmp_file.write_text(unit_content)
 
     try:
-        subprocess.run(["sudo", "cp", str(tmp_file), SERVICE_FILE], check=True)
-        subprocess.run(["sudo", "systemctl", "daemon-reload"], check=True)
-        subprocess.run(["sudo", "systemctl", "enable", SERVICE_NAME], check=True)
+        # One sudo invocation for the whole sequence (single auth prompt).
+        script = f"systemctl daemon-reload && systemctl enable {shlex.quote(SERVICE_NAME)}"
+        if not unit_current:
+            script = f"cp {shlex.quote(str(tmp_file))} {shlex.quote(SERVICE_FILE)} && {script}"
+        subprocess.run(["sudo", "sh", "-c", script], check=True)
         print(f"\n✅ Service installed and enabled.")
         print(f"  Start: sudo systemctl start {SERVICE_NAME}")
         print(f"  Status: sudo systemctl status {SERVICE_NAME}")
@@ -98,11 +126,13 @@ def uninstall_systemd_service() -> None:
         return
 
     try:
-        subprocess.run(["sudo", "systemctl", "stop", SERVICE_NAME], check=False)
-        subprocess.run(["sudo", "systemctl", "disable", SERVICE_NAME], check=False)
-        if Path(SERVICE_FILE).exists():
-            subprocess.run(["sudo", "rm", SERVICE_FILE], check=True)
-        subprocess.run(["sudo", "systemctl", "daemon-reload"], check=True)
+        # stop/disable may fail if the unit is not loaded; that is fine.
+        name = shlex.quote(SERVICE_NAME)
+        script = (
+            f"systemctl stop {name}; systemctl disable {name};"
+            f" rm -f {shlex.quote(SERVICE_FILE)} && systemctl daemon-reload"
+        )
+        subprocess.run(["sudo", "sh", "-c", script], check=True)
         print("✅ Service removed.")
     except subprocess.CalledProcessError as e:
         print(f"❌ Failed: {e}")
@@ -1,39 +1,197 @@
 """GitHub-based auto-update module for Sea Turtle."""
 
-import json
+import contextlib
+import functools
+import io
 import logging
-import subprocess
+import os
+import re
 import sys
-import urllib.request
-import urllib.error
-from typing import Any
+import threading
+import time
+import urllib.parse
+from pathlib import Path
+from typing import Any, TYPE_CHECKING
 
 from sea_turtle import __version__, __github__
 
+try:
+    from packaging.version import InvalidVersion, Version
+except ImportError:  # packaging is optional; compare_versions falls back
+    InvalidVersion = ValueError
+    Version = None
+
+# http.client (which pulls in ssl and email), subprocess and json are
+# imported where used: most CLI invocations never check for or install an
+# update.
+if TYPE_CHECKING:
+    import http.client
+
 logger = logging.getLogger("sea_turtle.updater")
 
 GITHUB_API_URL = "https://api.github.com/repos/haklhl/turtle/releases/latest"
 PYPI_PACKAGE = "sea-turtle"
+UPDATE_CACHE_FILE_NAME = "update_cache.json"
+# Explicit cache path; when None the file lives in the configured data_dir.
+UPDATE_CACHE_FILE: Path | None = None
+UPDATE_CACHE_TTL_SECONDS = 6 * 3600
+HTTP_TIMEOUT_SECONDS = 10
+# tag_name sits near the top of the release JSON; the asset list and notes
+# that follow it can run to hundreds of KiB.
+RELEASE_READ_LIMIT = 8192
+
+_VERSION_RE = re.compile(r"^v?(\d+(?:\.\d+)*)")
+_TAG_NAME_RE = re.compile(rb'"tag_name"\s*:\s*"([^"\\]*)"')
+
+_api_url = urllib.parse.urlsplit(GITHUB_API_URL)
+# Kept-alive connection to the GitHub API, reused across checks.
+_connection: "http.client.HTTPSConnection | None" = None
+_connection_lock = threading.Lock()
+# Background release lookup used by get_update_info (stale-while-revalidate).
+# A daemon thread, so a slow GitHub request never delays interpreter exit.
+_pending: threading.Thread | None = None
+_pending_result: str | None = None
+_pending_lock = threading.Lock()
+# data_dir from the config the caller loaded; see set_data_dir.
+_data_dir: str | None = None
+
+
+def _github_get(headers: dict[str, str]) -> tuple[int, "http.client.HTTPMessage", bytes]:
+    """GET GITHUB_API_URL over the shared connection.
+
+    Only the first RELEASE_READ_LIMIT bytes of the body are kept. The rest is
+    drained in bounded reads and discarded so the connection can be reused.
+
+    Returns:
+        Tuple of (status, headers, body).
+    """
+    import http.client
+
+    global _connection
+    with _connection_lock:
+        while True:
+            reused = _connection is not None
+            if _connection is None:
+                _connection = http.client.HTTPSConnection(_api_url.netloc, timeout=HTTP_TIMEOUT_SECONDS)
+            try:
+                _connection.request("GET", _api_url.path, headers=headers)
+                resp = _connection.getresponse()
+                body = resp.read(RELEASE_READ_LIMIT)
+                while resp.read(RELEASE_READ_LIMIT):
+                    pass
+                return resp.status, resp.headers, body
+            except (http.client.HTTPException, OSError):
+                _connection.close()
+                _connection = None
+                # A kept-alive connection may have been closed by the server
+                # while idle; retry once on a fresh one.
+                if not reused:
+                    raise
+
+
+def set_data_dir(data_dir: str) -> None:
+    """Keep the update cache under ``data_dir`` (the ``global.data_dir`` setting)."""
+    global _data_dir
+    _data_dir = data_dir
+
+
+def _update_cache_file() -> Path:
+    """Path of the release lookup cache."""
+    if UPDATE_CACHE_FILE is not None:
+        return UPDATE_CACHE_FILE
+    data_dir = _data_dir
+    if data_dir is None:
+        from sea_turtle.config.loader import load_config
+
+        try:
+            data_dir = load_config().get("global", {}).get("data_dir", "~/.sea_turtle")
+        except (OSError, ValueError):
+            data_dir = "~/.sea_turtle"
+        set_data_dir(data_dir)
+    return Path(data_dir).expanduser() / UPDATE_CACHE_FILE_NAME
+
+
+def _load_update_cache() -> dict[str, Any]:
+    """Load the last release lookup (version plus ETag/Last-Modified validators)."""
+    import json
+
+    try:
+        with open(_update_cache_file(), "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_update_cache(cache: dict[str, Any]) -> None:
+    """Atomically persist the release lookup cache."""
+    import json
+
+    cache_file = _update_cache_file()
+    tmp_path = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(cache), encoding="utf-8")
+        os.replace(tmp_path, cache_file)
+    except OSError as e:
+        logger.debug(f"Could not write update cache {cache_file}: {e}")
 
 
-def check_update() -> str | None:
+def _is_fresh(cache: dict[str, Any]) -> bool:
+    """Whether a cached release lookup is within UPDATE_CACHE_TTL_SECONDS."""
+    fetched_at = cache.get("fetched_at")
+    return bool(
+        cache.get("version")
+        and isinstance(fetched_at, (int, float))
+        and 0 <= time.time() - fetched_at < UPDATE_CACHE_TTL_SECONDS
+    )
+
+
+def check_update(force: bool = False) -> str | None:
     """Check GitHub for the latest release version.
 
+    A result fetched within UPDATE_CACHE_TTL_SECONDS is returned without any
+    network call unless ``force`` is set.
+
     Returns:
         Latest version string (e.g., '0.2.0'), or None if check failed.
     """
+    import http.client
+
+    cache = _load_update_cache()
+    if not force and _is_fresh(cache):
+        return cache["version"]
+
+    headers = {"Accept": "application/vnd.github.v3+json", "User-Agent": "sea-turtle-updater"}
+    if cache.get("version"):
+        # Conditional request: GitHub answers 304 with no body if unchanged.
+        if cache.get("etag"):
+            headers["If-None-Match"] = cache["etag"]
+        if cache.get("last_modified"):
+            headers["If-Modified-Since"] = cache["last_modified"]
+
     try:
-        req = urllib.request.Request(
-            GITHUB_API_URL,
-            headers={"Accept": "application/vnd.github.v3+json", "User-Agent": "sea-turtle-updater"},
-        )
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-            tag = data.get("tag_name", "")
-            # Strip leading 'v' if present
-            version = tag.lstrip("v")
-            return version if version else None
-    except urllib.error.URLError as e:
+        status, resp_headers, body = _github_get(headers)
+        if status == 304 and cache.get("version"):
+            cache["fetched_at"] = time.time()
+            _save_update_cache(cache)
+            return cache["version"]
+        if status != 200:
+            logger.warning(f"Failed to check for updates: HTTP {status}")
+            return None
+        tag = _parse_tag_name(body)
+        # Drop one leading 'v'; any pre-release suffix is kept for compare_versions.
+        match = _VERSION_RE.match(tag)
+        version = tag[match.start(1):] if match else ""
+        if version:
+            _save_update_cache({
+                "etag": resp_headers.get("ETag"),
+                "last_modified": resp_headers.get("Last-Modified"),
+                "version": version,
+                "fetched_at": time.time(),
+            })
+        return version if version else None
+    except (http.client.HTTPException, OSError) as e:
         logger.warning(f"Failed to check for updates: {e}")
         return None
     except Exception as e:
@@ -41,69 +199,219 @@ def check_update() -> str | None:
         return None
 
 
+def _parse_tag_name(body: bytes) -> str:
+    """Extract tag_name from a possibly truncated release payload."""
+    import json
+
+    try:
+        return json.loads(body).get("tag_name", "")
+    except ValueError:
+        match = _TAG_NAME_RE.search(body)
+        return match.group(1).decode("utf-8") if match else ""
+
+
 def compare_versions(current: str, latest: str) -> int:
     """Compare two version strings.
 
+    Uses PEP 440 ordering (pre-releases, local versions) when ``packaging``
+    is installed, falling back to a numeric dotted comparison.
+
     Returns:
         -1 if current < latest, 0 if equal, 1 if current > latest.
     """
-    def parse(v: str) -> tuple[int, ...]:
-        parts = []
-        for p in v.split("."):
-            try:
-                parts.append(int(p))
-            except ValueError:
-                parts.append(0)
-        return tuple(parts)
+    if Version is not None:
+        try:
+            c, l = _pep440_version(current), _pep440_version(latest)
+            return (c > l) - (c < l)
+        except InvalidVersion:
+            pass
 
-    c = parse(current)
-    l = parse(latest)
+    c, l = _numeric_version(current), _numeric_version(latest)
+    return (c > l) - (c < l)
 
-    if c < l:
-        return -1
-    elif c > l:
-        return 1
-    return 0
 
+@functools.lru_cache(maxsize=16)
+def _pep440_version(v: str) -> "Version":
+    return Version(v)
 
+
+def _numeric_version(v: str) -> tuple[int, ...]:
+    match = _VERSION_RE.match(v)
+    if not match:
+        return ()
+    parts = [int(p) for p in match.group(1).split(".")]
+    # Trailing zeros do not change the version: 1.2 == 1.2.0.
+    while parts and parts[-1] == 0:
+        parts.pop()
+    return tuple(parts)
+
+
+@functools.lru_cache(maxsize=1)
 def _find_project_root() -> str | None:
-    """Find the project root by looking for pyproject.toml or .git."""
-    import pathlib
+    """Find the project root by looking for pyproject.toml or .git.
+
+    The install location does not change at runtime, so the walk happens once.
+    """
     # Start from the package directory and walk up
-    current = pathlib.Path(__file__).resolve().parent
+    current = Path(__file__).resolve().parent
     for _ in range(10):
-        if (current / ".git").exists() or (current / "pyproject.toml").exists():
-            return str(current)
+        try:
+            with os.scandir(current) as entries:
+                if any(e.name in (".git", "pyproject.toml") for e in entries):
+                    return str(current)
+        except OSError:
+            pass
         current = current.parent
     return None
 
 
-def install_update() -> bool:
-    """Update by running git pull + pip install -e . in the project root.
+def _run_bounded(cmd: list[str], timeout: float, cwd: str | None = None, label: str = "") -> int:
+    """Run a command, logging its output as it arrives, and return its exit code.
+
+    stdout and stderr are merged and forwarded line by line to the updater
+    logger. If the command exceeds ``timeout`` its whole process group gets
+    SIGTERM, then SIGKILL after a 5 s grace period.
+
+    Raises:
+        subprocess.TimeoutExpired: after the process group has been terminated.
+    """
+    import signal
+    import subprocess
+
+    with subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1,
+        cwd=cwd, start_new_session=True,
+    ) as proc:
+        timed_out = threading.Event()
+
+        def expire() -> None:
+            timed_out.set()
+            _killpg(proc.pid, signal.SIGTERM)
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                _killpg(proc.pid, signal.SIGKILL)
+
+        timer = threading.Timer(timeout, expire)
+        timer.daemon = True
+        timer.start()
+        try:
+            for line in proc.stdout:
+                logger.info(f"{label or cmd[0]}: {line.rstrip()}")
+            proc.wait()
+        finally:
+            timer.cancel()
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return proc.returncode
+
+
+class _LogWriter(io.TextIOBase):
+    """Text stream that forwards complete lines to the updater logger."""
+
+    def __init__(self, label: str):
+        self.label = label
+        self._buffer = ""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        *lines, self._buffer = (self._buffer + s).split("\n")
+        for line in lines:
+            logger.info(f"{self.label}: {line.rstrip()}")
+        return len(s)
+
+    def flush(self) -> None:
+        if self._buffer:
+            logger.info(f"{self.label}: {self._buffer.rstrip()}")
+            self._buffer = ""
+
+
+def _pip_install(args: list[str], timeout: float, in_process: bool = False) -> int:
+    """Run ``pip install <args>`` and return its exit code.
+
+    By default pip runs as a ``python -m pip`` subprocess bounded by
+    ``timeout``. ``in_process`` opts into pip's unsupported programmatic
+    entry point, which skips an interpreter start-up but cannot be timed
+    out; it falls back to the subprocess if pip's internals are missing.
+    """
+    pip_main = None
+    if in_process:
+        try:
+            from pip._internal.cli.main import main as pip_main
+        except ImportError:
+            pass
+    if pip_main is None:
+        return _run_bounded([sys.executable, "-m", "pip", "install", *args], timeout=timeout, label="pip")
+
+    writer = _LogWriter("pip")
+    try:
+        with contextlib.redirect_stdout(writer), contextlib.redirect_stderr(writer):
+            return pip_main(["install", *args])
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else 1
+    finally:
+        writer.flush()
+
+
+def _killpg(pgid: int, sig: int) -> None:
+    try:
+        os.killpg(pgid, sig)
+    except ProcessLookupError:
+        pass
+
+
+def install_update(strategy: str = "auto", in_process_pip: bool = False) -> bool:
+    """Install the latest version.
+
+    Args:
+        strategy: ``"git"`` runs git pull + pip install -e . in the project
+            checkout, ``"pip"`` upgrades the PyPI package, and ``"auto"``
+            uses git when running from a git checkout and pip otherwise.
+        in_process_pip: Run pip inside this process instead of a bounded
+            subprocess (faster, but without a timeout).
 
     Returns:
         True if update was successful.
     """
-    project_root = _find_project_root()
-    if not project_root:
+    if strategy not in ("auto", "git", "pip"):
+        raise ValueError(f"Unknown update strategy: {strategy}")
+
+    project_root = _find_project_root() if strategy != "pip" else None
+    if strategy == "auto" and project_root and not os.path.isdir(os.path.join(project_root, ".git")):
+        project_root = None
+    if project_root:
+        return _install_from_git(project_root, in_process_pip)
+    if strategy == "git":
         logger.error("Cannot find project root (no .git or pyproject.toml found)")
         return False
+    return _install_from_pypi(in_process_pip)
+
+
+@functools.lru_cache(maxsize=1)
+def _git_executable() -> str | None:
+    """Absolute path of git, looked up on PATH once per process."""
+    import shutil
+
+    return shutil.which("git")
+
+
+def _install_from_git(project_root: str, in_process_pip: bool = False) -> bool:
+    """Update by running git pull + pip install -e . in the project root."""
+    import subprocess
 
     # Step 1: git pull
+    git = _git_executable()
+    if not git:
+        logger.error("git is not installed")
+        return False
     try:
         logger.info(f"Running git pull in {project_root}...")
-        result = subprocess.run(
-            ["git", "pull", "--ff-only"],
-            capture_output=True, text=True, timeout=60,
-            cwd=project_root,
-        )
-        if result.returncode != 0:
-            logger.error(f"git pull failed: {result.stderr}")
+        returncode = _run_bounded([git, "pull", "--ff-only"], timeout=60, cwd=project_root, label="git pull")
+        if returncode != 0:
+            logger.error(f"git pull failed (exit code {returncode})")
             return False
-        logger.info(f"git pull: {result.stdout.strip()}")
-    except FileNotFoundError:
-        logger.error("git is not installed")
-        return False
     except subprocess.TimeoutExpired:
         logger.error("git pull timed out")
         return False
@@ -111,16 +419,33 @@ def install_update() -> bool:
     # Step 2: pip install -e .
     try:
         logger.info("Running pip install -e . ...")
-        result = subprocess.run(
-            [sys.executable, "-m", "pip", "install", "-e", "."],
-            capture_output=True, text=True, timeout=120,
-            cwd=project_root,
-        )
-        if result.returncode == 0:
+        returncode = _pip_install(["-e", project_root], timeout=120, in_process=in_process_pip)
+        if returncode == 0:
+            logger.info("Update installed successfully.")
+            return True
+        else:
+            logger.error(f"pip install failed (exit code {returncode})")
+            return False
+    except subprocess.TimeoutExpired:
+        logger.error("pip install timed out")
+        return False
+    except Exception as e:
+        logger.error(f"Update failed: {e}")
+        return False
+
+
+def _install_from_pypi(in_process_pip: bool = False) -> bool:
+    """Update by upgrading the installed package from PyPI."""
+    import subprocess
+
+    try:
+        logger.info(f"Running pip install --upgrade {PYPI_PACKAGE} ...")
+        returncode = _pip_install(["--upgrade", PYPI_PACKAGE], timeout=120, in_process=in_process_pip)
+        if returncode == 0:
             logger.info("Update installed successfully.")
             return True
         else:
-            logger.error(f"pip install failed: {result.stderr}")
+            logger.error(f"pip install failed (exit code {returncode})")
             return False
     except subprocess.TimeoutExpired:
         logger.error("pip install timed out")
@@ -130,13 +455,42 @@ def install_update() -> bool:
         return False
 
 
+def _latest_version_nowait() -> str | None:
+    """Return the latest known version without waiting on the network.
+
+    A stale or missing cache schedules check_update on a background thread
+    and returns the cached version (possibly None) immediately; a later call
+    picks up the refreshed result.
+    """
+    global _pending
+    cache = _load_update_cache()
+    if _is_fresh(cache):
+        return cache["version"]
+    with _pending_lock:
+        if _pending is not None and not _pending.is_alive():
+            _pending = None
+            return _pending_result or cache.get("version")
+        if _pending is None:
+            _pending = threading.Thread(target=_refresh_in_background, name="sea-turtle-update", daemon=True)
+            _pending.start()
+    return cache.get("version")
+
+
+def _refresh_in_background() -> None:
+    global _pending_result
+    _pending_result = check_update()
+
+
 def get_update_info() -> dict[str, Any]:
     """Get update status information.
 
+    Never blocks on the network: when the cached release lookup is stale it
+    is refreshed in the background and the previous result is reported.
+
     Returns:
         Dict with current_version, latest_version, update_available.
     """
-    latest = check_update()
+    latest = _latest_version_nowait()
     info = {
         "current_version": __version__,
         "latest_version": latest,
@@ -1,10 +1,102 @@
 """Lightweight logging setup for Sea Turtle."""
 
+import atexit
+import functools
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from multiprocessing import util as mp_util
 from pathlib import Path
 
+# Records from every logger are queued here and written by one background
+# thread, so logging calls never block on console or disk I/O.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_listener: "_RoutingQueueListener | None" = None
+_listener_lock = threading.Lock()
+
+DEFAULT_FORMAT = "[{asctime}] [{levelname}] [{name}] {message}"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "warn": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+    "fatal": logging.CRITICAL,
+}
+
+# agent_id -> logger, so repeat lookups skip path and handler setup.
+_AGENT_LOGGERS: dict[str, logging.Logger] = {}
+# Log directories already created by this process.
+_ENSURED_DIRS: set[str] = set()
+# data_dir setting -> user-expanded path.
+_DATA_DIR_CACHE: dict[str, str] = {}
+
+
+class _RoutingQueueHandler(QueueHandler):
+    """Enqueue records together with the handlers that should emit them."""
+
+    def __init__(self, targets: list[logging.Handler]):
+        super().__init__(_log_queue)
+        self.targets = tuple(targets)
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        # Always the current module queue: it is replaced in forked children.
+        _ensure_listener()
+        _log_queue.put_nowait((self.targets, record))
+
+
+class _RoutingQueueListener(QueueListener):
+    """Dispatch each queued record to the handlers it was enqueued with."""
+
+    def handle(self, item: tuple[tuple[logging.Handler, ...], logging.LogRecord]) -> None:
+        targets, record = item
+        record = self.prepare(record)
+        for handler in targets:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def stop(self) -> None:
+        # Registered with both atexit and multiprocessing; only drain once.
+        if self._thread is not None:
+            super().stop()
+
+
+def _ensure_listener() -> None:
+    global _listener
+    if _listener is not None:
+        return
+    with _listener_lock:
+        if _listener is None:
+            _listener = _RoutingQueueListener(_log_queue)
+            _listener.start()
+            # Registered after logging's own shutdown hook, so it runs first
+            # and drains the queue before the handlers are flushed and closed.
+            atexit.register(_listener.stop)
+            # multiprocessing children leave via os._exit and skip atexit.
+            mp_util.Finalize(None, _listener.stop, exitpriority=0)
+
+
+def _reset_after_fork() -> None:
+    """Give a forked child its own queue; the listener thread does not survive fork."""
+    global _log_queue, _listener, _listener_lock
+    _log_queue = queue.SimpleQueue()
+    _listener = None
+    _listener_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+@functools.lru_cache(maxsize=16)
+def _formatter(fmt: str, datefmt: str = DATE_FORMAT) -> logging.Formatter:
+    return logging.Formatter(fmt, style="{", datefmt=datefmt)
+
 
 def setup_logger(
     name: str,
@@ -12,10 +104,13 @@ def setup_logger(
     level: str = "info",
     max_bytes: int = 10 * 1024 * 1024,
     backup_count: int = 3,
-    fmt: str = "[{asctime}] [{levelname}] [{name}] {message}",
+    fmt: str = DEFAULT_FORMAT,
 ) -> logging.Logger:
     """Create and configure a logger with optional file rotation.
 
+    The logger only enqueues records; formatting and writing happen on a
+    shared background thread.
+
     Args:
         name: Logger name.
         log_file: Path to log file. If None, logs to stderr only.
@@ -28,64 +123,87 @@ def setup_logger(
         Configured logger instance.
     """
     logger = logging.getLogger(name)
-    log_level = getattr(logging, level.upper(), logging.INFO)
-    logger.setLevel(log_level)
+    logger.setLevel(_LEVELS.get(level.lower(), logging.INFO))
 
     if logger.handlers:
         return logger
 
-    formatter = logging.Formatter(fmt, style="{", datefmt="%Y-%m-%d %H:%M:%S")
+    formatter = _formatter(fmt)
 
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers: list[logging.Handler] = [console_handler]
 
     if log_file:
         log_path = Path(log_file).expanduser()
-        log_path.parent.mkdir(parents=True, exist_ok=True)
+        log_dir = str(log_path.parent)
+        if log_dir not in _ENSURED_DIRS:
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            _ENSURED_DIRS.add(log_dir)
         file_handler = RotatingFileHandler(
             str(log_path),
             maxBytes=max_bytes,
             backupCount=backup_count,
             encoding="utf-8",
+            delay=True,
         )
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
 
+    _ensure_listener()
+    logger.addHandler(_RoutingQueueHandler(handlers))
     return logger
 
 
+def _resolve_data_dir(data_dir: str) -> str:
+    """Expand ``~`` in a data_dir setting once per distinct value."""
+    resolved = _DATA_DIR_CACHE.get(data_dir)
+    if resolved is None:
+        resolved = _DATA_DIR_CACHE[data_dir] = os.path.expanduser(data_dir)
+    return resolved
+
+
+def _logger_options(config: dict) -> dict:
+    """Translate the ``logging`` config section into setup_logger kwargs."""
+    log_cfg = config.get("logging", {})
+    return {
+        "level": log_cfg.get("level", "info"),
+        "max_bytes": log_cfg.get("max_file_size_mb", 10) * 1024 * 1024,
+        "backup_count": log_cfg.get("backup_count", 3),
+        "fmt": log_cfg.get("format", DEFAULT_FORMAT),
+    }
+
+
 def get_daemon_logger(config: dict | None = None) -> logging.Logger:
     """Get the daemon (main process) logger."""
     if config:
-        log_cfg = config.get("logging", {})
         global_cfg = config.get("global", {})
         return setup_logger(
             name="daemon",
             log_file=global_cfg.get("log_file", "~/.sea_turtle/logs/daemon.log"),
-            level=log_cfg.get("level", "info"),
-            max_bytes=log_cfg.get("max_file_size_mb", 10) * 1024 * 1024,
-            backup_count=log_cfg.get("backup_count", 3),
-            fmt=log_cfg.get("format", "[{asctime}] [{levelname}] [{name}] {message}"),
+            **_logger_options(config),
         )
     return setup_logger(name="daemon")
 
 
 def get_agent_logger(agent_id: str, config: dict | None = None) -> logging.Logger:
     """Get an agent-specific logger."""
+    logger = _AGENT_LOGGERS.get(agent_id)
+    if logger is not None:
+        # Handlers are fixed on first setup, but a reloaded config may change the level.
+        if config:
+            level = config.get("logging", {}).get("level", "info")
+            logger.setLevel(_LEVELS.get(level.lower(), logging.INFO))
+        return logger
+
     data_dir = "~/.sea_turtle"
     if config:
         data_dir = config.get("global", {}).get("data_dir", data_dir)
-    log_file = os.path.join(data_dir, "logs", "agents", agent_id, "agent.log")
+    log_file = os.path.join(_resolve_data_dir(data_dir), "logs", "agents", agent_id, "agent.log")
 
     if config:
-        log_cfg = config.get("logging", {})
-        return setup_logger(
-            name=f"agent.{agent_id}",
-            log_file=log_file,
-            level=log_cfg.get("level", "info"),
-            max_bytes=log_cfg.get("max_file_size_mb", 10) * 1024 * 1024,
-            backup_count=log_cfg.get("backup_count", 3),
-            fmt=log_cfg.get("format", "[{asctime}] [{levelname}] [{name}] {message}"),
-        )
-    return setup_logger(name=f"agent.{agent_id}", log_file=log_file)
+        logger = setup_logger(name=f"agent.{agent_id}", log_file=log_file, **_logger_options(config))
+    else:
+        logger = setup_logger(name=f"agent.{agent_id}", log_file=log_file)
+    _AGENT_LOGGERS[agent_id] = logger
+    return logger
@@ -0,0 +1,43 @@
+import multiprocessing
+import queue
+import selectors
+import sys
+import unittest
+
+from sea_turtle.core.agent import Outbox
+
+
+def _reply_from_child(outbox: Outbox) -> None:
+    outbox.put({"type": "reply", "content": "x" * 200_000})
+    outbox.put({"type": "reply", "content": "done"})
+
+
+class OutboxTests(unittest.TestCase):
+    def test_empty_outbox_raises_queue_empty(self):
+        with self.assertRaises(queue.Empty):
+            Outbox().get_nowait()
+
+    @unittest.skipUnless(sys.platform != "win32", "requires fork")
+    def test_selector_wakes_for_items_put_by_a_child(self):
+        outbox = Outbox()
+        child = multiprocessing.get_context("fork").Process(target=_reply_from_child, args=(outbox,))
+        child.start()
+        self.addCleanup(child.join, 10)
+
+        received = []
+        with selectors.DefaultSelector() as selector:
+            selector.register(outbox, selectors.EVENT_READ)
+            while len(received) < 2:
+                self.assertTrue(selector.select(timeout=10), "outbox never became readable")
+                while True:
+                    try:
+                        received.append(outbox.get_nowait()["content"])
+                    except queue.Empty:
+                        break
+
+        self.assertEqual(len(received[0]), 200_000)
+        self.assertEqual(received[1], "done")
+
+
+if __name__ == "__main__":
+    unittest.main()
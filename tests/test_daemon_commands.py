@@ -0,0 +1,29 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from sea_turtle.daemon import CommandContext, Daemon
+
+
+class SystemCommandTests(unittest.TestCase):
+    def setUp(self):
+        config = {"agents": {"default": {"name": "Shelly", "codex": {}}}, "llm": {}}
+        with mock.patch("sea_turtle.daemon.get_daemon_logger"):
+            self.daemon = Daemon(config)
+
+    def _run(self, command: str) -> str:
+        return asyncio.run(self.daemon.handle_system_command(command, "default"))
+
+    def test_dispatches_on_the_command_name_only(self):
+        self.assertIn("Shelly", self._run("  /START  "))
+        self.assertIn("Current: medium", self._run("/effort\tlist"))
+        self.assertTrue(self._run("/nope a b").startswith("Unknown command: /nope."))
+
+    def test_arguments_are_split_on_first_use(self):
+        ctx = CommandContext(agent_id="default", source="telegram", arg_text=" list  google ")
+        self.assertNotIn("args", vars(ctx))
+        self.assertEqual(ctx.args, ["list", "google"])
+
+
+if __name__ == "__main__":
+    unittest.main()
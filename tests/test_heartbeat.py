@@ -0,0 +1,50 @@
+import asyncio
+import unittest
+
+from sea_turtle.core.heartbeat import Heartbeat
+
+
+class HeartbeatSchedulerTests(unittest.TestCase):
+    def test_shared_scheduler_runs_each_heartbeat_on_its_interval(self):
+        calls: list[str] = []
+
+        async def on_tick(agent_id: str) -> None:
+            calls.append(agent_id)
+
+        async def scenario():
+            fast = Heartbeat("fast", "/tmp/fast", interval=0.02, on_tasks_found=on_tick)
+            slow = Heartbeat("slow", "/tmp/slow", interval=10, on_tasks_found=on_tick)
+            await fast.start()
+            await slow.start()
+            await asyncio.sleep(0.09)
+            await fast.stop()
+            await slow.stop()
+            count = len(calls)
+            await asyncio.sleep(0.05)
+            self.assertEqual(len(calls), count)
+
+        asyncio.run(scenario())
+        self.assertEqual(calls.count("slow"), 1)
+        self.assertGreaterEqual(calls.count("fast"), 3)
+
+    def test_stopped_heartbeat_can_be_restarted(self):
+        calls: list[str] = []
+
+        async def on_tick(agent_id: str) -> None:
+            calls.append(agent_id)
+
+        async def scenario():
+            hb = Heartbeat("a", "/tmp/a", interval=10, on_tasks_found=on_tick)
+            await hb.start()
+            await asyncio.sleep(0.01)
+            await hb.stop()
+            await hb.start()
+            await asyncio.sleep(0.01)
+            await hb.stop()
+
+        asyncio.run(scenario())
+        self.assertEqual(calls, ["a", "a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
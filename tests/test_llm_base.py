@@ -0,0 +1,115 @@
+import asyncio
+import types
+import unittest
+from unittest import mock
+
+from sea_turtle.llm.base import call_with_retry, coalesce_chunks
+
+
+class RateLimited(Exception):
+    def __init__(self, retry_after=None):
+        super().__init__("429")
+        headers = {"retry-after": retry_after} if retry_after is not None else {}
+        self.response = types.SimpleNamespace(headers=headers)
+
+
+class CallWithRetryTests(unittest.TestCase):
+    def _run(self, call, is_retryable, **kwargs):
+        sleeps: list[float] = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        async def scenario():
+            with mock.patch("sea_turtle.llm.base.asyncio.sleep", fake_sleep):
+                return await call_with_retry(call, asyncio.Semaphore(1), is_retryable, **kwargs)
+
+        return asyncio.run(scenario()), sleeps
+
+    def test_retries_rate_limits_honoring_retry_after(self):
+        outcomes = [RateLimited("2"), RateLimited(), "ok"]
+
+        async def call():
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        result, sleeps = self._run(call, lambda e: isinstance(e, RateLimited))
+        self.assertEqual(result, "ok")
+        self.assertEqual(sleeps[0], 2.0)
+        self.assertTrue(2.0 <= sleeps[1] <= 3.0)
+
+    def test_non_retryable_errors_and_exhausted_attempts_raise(self):
+        calls = 0
+
+        async def call():
+            nonlocal calls
+            calls += 1
+            raise RateLimited()
+
+        with self.assertRaises(RateLimited):
+            self._run(call, lambda e: False)
+        self.assertEqual(calls, 1)
+
+        calls = 0
+        with self.assertRaises(RateLimited):
+            self._run(call, lambda e: True, attempts=3)
+        self.assertEqual(calls, 3)
+
+
+class CoalesceChunksTests(unittest.TestCase):
+    def test_first_chunk_is_immediate_and_later_deltas_are_merged(self):
+        async def deltas():
+            for text in ["Hi", " a", "b", "c", "defghijklmnopqrstu", "v", "w"]:
+                yield text
+
+        async def collect():
+            return [text async for text in coalesce_chunks(deltas(), min_chars=8, max_delay=60)]
+
+        chunks = asyncio.run(collect())
+        self.assertEqual(chunks, ["Hi", " abcdefghijklmnopqrstu", "vw"])
+
+    def test_buffered_text_is_flushed_when_max_delay_expires(self):
+        flushed_before_last = []
+
+        async def deltas():
+            yield "Hi"
+            yield " a"
+            await asyncio.sleep(0.3)
+            flushed_before_last.append(list(received))
+            yield "b"
+
+        received = []
+
+        async def collect():
+            async for text in coalesce_chunks(deltas(), min_chars=100, max_delay=0.05):
+                received.append(text)
+
+        asyncio.run(collect())
+        self.assertEqual(flushed_before_last, [["Hi", " a"]])
+        self.assertEqual(received, ["Hi", " a", "b"])
+
+    def test_early_exit_closes_the_upstream_stream(self):
+        closed = []
+
+        async def deltas():
+            try:
+                yield "Hi"
+                await asyncio.sleep(10)
+                yield "never"
+            finally:
+                closed.append(True)
+
+        async def first_only():
+            stream = coalesce_chunks(deltas())
+            async for text in stream:
+                break
+            await stream.aclose()
+            return text, list(closed)
+
+        self.assertEqual(asyncio.run(first_only()), ("Hi", [True]))
+
+
+if __name__ == "__main__":
+    unittest.main()
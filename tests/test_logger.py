@@ -0,0 +1,85 @@
+import logging
+import multiprocessing
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from sea_turtle.utils.logger import get_agent_logger, setup_logger
+
+
+def _log_from_child(path: str) -> None:
+    logger = setup_logger("test.logger.child", log_file=path)
+    logger.propagate = False
+    logger.info("hello from child")
+
+
+class SetupLoggerTests(unittest.TestCase):
+    def _wait_for(self, path: Path, text: str) -> str:
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            if path.exists() and text in path.read_text(encoding="utf-8"):
+                break
+            time.sleep(0.01)
+        return path.read_text(encoding="utf-8") if path.exists() else ""
+
+    def test_records_reach_only_their_own_log_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            a_path = Path(tmp) / "a" / "agent.log"
+            b_path = Path(tmp) / "b" / "agent.log"
+            a = setup_logger("test.logger.a", log_file=str(a_path))
+            b = setup_logger("test.logger.b", log_file=str(b_path), level="warning")
+            for logger in (a, b):
+                logger.propagate = False
+                for handler in logger.handlers:
+                    for target in handler.targets:
+                        self.addCleanup(target.close)
+
+            self.assertFalse(a_path.exists())
+            a.info("hello from a")
+            b.info("filtered")
+            b.warning("hello from b")
+
+            self.assertIn("hello from a", self._wait_for(a_path, "hello from a"))
+            b_text = self._wait_for(b_path, "hello from b")
+            self.assertIn("[WARNING] [test.logger.b] hello from b", b_text)
+            self.assertNotIn("filtered", b_text)
+            self.assertNotIn("hello from a", b_text)
+
+    def test_agent_logger_is_reused_and_follows_the_configured_level(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            config = {"global": {"data_dir": tmp}, "logging": {"level": "info"}}
+            logger = get_agent_logger("test-level", config)
+            for handler in logger.handlers:
+                for target in handler.targets:
+                    self.addCleanup(target.close)
+            self.assertEqual(logger.level, logging.INFO)
+
+            reloaded = {"global": {"data_dir": tmp}, "logging": {"level": "debug"}}
+            self.assertIs(get_agent_logger("test-level", reloaded), logger)
+            self.assertEqual(logger.level, logging.DEBUG)
+            self.assertEqual(len(logger.handlers), 1)
+
+    @unittest.skipUnless(sys.platform != "win32", "requires fork")
+    def test_forked_child_starts_its_own_listener(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            parent = setup_logger("test.logger.parent", log_file=str(Path(tmp) / "parent.log"))
+            parent.propagate = False
+            parent.info("parent listener running")
+            self._wait_for(Path(tmp) / "parent.log", "parent listener running")
+
+            child_path = Path(tmp) / "child" / "agent.log"
+            child = multiprocessing.get_context("fork").Process(target=_log_from_child, args=(str(child_path),))
+            child.start()
+            child.join(10)
+
+            self.assertEqual(child.exitcode, 0)
+            self.assertIn("hello from child", child_path.read_text(encoding="utf-8"))
+            for handler in parent.handlers:
+                for target in handler.targets:
+                    target.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
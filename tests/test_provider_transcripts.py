@@ -1,7 +1,9 @@
+import asyncio
 import json
 import sys
 import types
 import unittest
+from unittest import mock
 
 
 class ProviderTranscriptTests(unittest.TestCase):
@@ -23,8 +25,14 @@ class ProviderTranscriptTests(unittest.TestCase):
             def __init__(self, *args, **kwargs):
                 pass
 
+        class DefaultAsyncHttpxClient:
+            def __init__(self, *args, **kwargs):
+                pass
+
         module.AsyncOpenAI = AsyncOpenAI
+        module.DefaultAsyncHttpxClient = DefaultAsyncHttpxClient
         self._register_module("openai", module)
+        self._install_httpx_stub()
 
     def _install_anthropic_stub(self):
         module = types.ModuleType("anthropic")
@@ -33,13 +41,42 @@ class ProviderTranscriptTests(unittest.TestCase):
             def __init__(self, *args, **kwargs):
                 pass
 
+        class DefaultAsyncHttpxClient:
+            def __init__(self, *args, **kwargs):
+                pass
+
         module.AsyncAnthropic = AsyncAnthropic
+        module.DefaultAsyncHttpxClient = DefaultAsyncHttpxClient
         self._register_module("anthropic", module)
+        self._install_httpx_stub()
+
+    def _install_httpx_stub(self):
+        if "httpx" in sys.modules:
+            return
+        module = types.ModuleType("httpx")
+
+        class AsyncClient:
+            def __init__(self, *args, **kwargs):
+                pass
+
+        class Limits:
+            def __init__(self, *args, **kwargs):
+                pass
+
+        module.AsyncClient = AsyncClient
+        module.Limits = Limits
+        self._register_module("httpx", module)
 
     def _install_google_stub(self):
         google_module = types.ModuleType("google")
         genai_module = types.ModuleType("google.genai")
         types_module = types.ModuleType("google.genai.types")
+        errors_module = types.ModuleType("google.genai.errors")
+
+        class APIError(Exception):
+            code = 0
+
+        errors_module.APIError = APIError
 
         class Client:
             def __init__(self, *args, **kwargs):
@@ -87,11 +124,13 @@ class ProviderTranscriptTests(unittest.TestCase):
         types_module.GenerateContentConfig = GenerateContentConfig
         types_module.Part = Part
         genai_module.types = types_module
+        genai_module.errors = errors_module
 
         google_module.genai = genai_module
         self._register_module("google", google_module)
         self._register_module("google.genai", genai_module)
         self._register_module("google.genai.types", types_module)
+        self._register_module("google.genai.errors", errors_module)
 
     def test_openai_transcript_keeps_tool_call_ids(self):
         self._install_openai_stub()
@@ -111,6 +150,139 @@ class ProviderTranscriptTests(unittest.TestCase):
         self.assertEqual(converted[1]["tool_calls"][0]["id"], "call-1")
         self.assertEqual(converted[2]["tool_call_id"], "call-1")
 
+    def test_openai_tool_schemas_are_reused_for_the_same_tools(self):
+        self._install_openai_stub()
+        from sea_turtle.llm.base import ToolDefinition
+        from sea_turtle.llm.openai import OpenAIProvider
+
+        provider = OpenAIProvider(api_key="x")
+        tools = [ToolDefinition(name="t", description="d", parameters={"type": "object"})]
+        first = provider._build_tools(tools)
+        self.assertIs(provider._build_tools(tools), first)
+        self.assertEqual(first[0]["function"]["name"], "t")
+        self.assertIs(provider._build_tools(list(tools)), first)
+        other = [ToolDefinition(name="t", description="d", parameters={"type": "object"})]
+        self.assertIsNot(provider._build_tools(other), first)
+
+    def test_openai_compatible_providers_skip_openai_embeddings(self):
+        self._install_openai_stub()
+        from sea_turtle.llm.openai import OpenAIProvider
+        from sea_turtle.llm.openrouter import OpenRouterProvider
+
+        self.assertIsNotNone(OpenAIProvider(api_key="x", semantic_cache=True).semantic_cache.embed)
+        self.assertIsNone(OpenRouterProvider(api_key="x", semantic_cache=True).semantic_cache.embed)
+        configured = OpenRouterProvider(api_key="x", semantic_cache=True, embedding_model="openai/text-embedding-3-small")
+        self.assertIsNotNone(configured.semantic_cache.embed)
+
+    def test_openai_tool_call_arguments_are_decoded(self):
+        self._install_openai_stub()
+        from sea_turtle.llm.openai import OpenAIProvider
+
+        def call(call_id, arguments):
+            return types.SimpleNamespace(
+                id=call_id, function=types.SimpleNamespace(name="execute_shell", arguments=arguments)
+            )
+
+        message = types.SimpleNamespace(tool_calls=[call("a", '{"command": "pwd"}'), call("b", "{not json")])
+        calls = OpenAIProvider(api_key="x")._extract_tool_calls(message)
+
+        self.assertEqual(calls[0]["arguments"], {"command": "pwd"})
+        self.assertEqual(calls[1]["arguments"], {"raw": "{not json"})
+
+    def test_openai_batch_chat_returns_responses_in_request_order(self):
+        self._install_openai_stub()
+        chat_types = types.ModuleType("openai.types.chat")
+
+        class ChatCompletion:
+            @staticmethod
+            def model_validate(body):
+                return types.SimpleNamespace(
+                    choices=[types.SimpleNamespace(
+                        message=types.SimpleNamespace(content=body["text"], tool_calls=None),
+                        finish_reason="stop",
+                    )],
+                    usage=types.SimpleNamespace(prompt_tokens=3, completion_tokens=1),
+                )
+
+        chat_types.ChatCompletion = ChatCompletion
+        self._register_module("openai.types.chat", chat_types)
+        from sea_turtle.llm.openai import OpenAIProvider
+
+        uploaded = {}
+        output = "\n".join([
+            json.dumps({"custom_id": "1", "response": {"status_code": 200, "body": {"text": "second"}}}),
+            json.dumps({"custom_id": "0", "response": {"status_code": 400, "body": {"error": {"message": "bad"}}}}),
+        ])
+
+        async def create_file(file, purpose):
+            uploaded["lines"] = [json.loads(line) for line in file[1].decode().splitlines()]
+            return types.SimpleNamespace(id="file-in")
+
+        async def create_batch(**kwargs):
+            return types.SimpleNamespace(id="batch", status="in_progress")
+
+        async def retrieve_batch(batch_id):
+            return types.SimpleNamespace(
+                id=batch_id, status="completed", output_file_id="file-out", error_file_id=None
+            )
+
+        async def file_content(file_id):
+            return types.SimpleNamespace(text=output)
+
+        provider = OpenAIProvider(api_key="x")
+        provider.client = types.SimpleNamespace(
+            files=types.SimpleNamespace(create=create_file, content=file_content),
+            batches=types.SimpleNamespace(create=create_batch, retrieve=retrieve_batch),
+        )
+        requests = [
+            {"messages": [{"role": "user", "content": "a"}], "model": "gpt-4o-mini"},
+            {"messages": [{"role": "user", "content": "b"}], "model": "gpt-4o-mini"},
+        ]
+        with mock.patch("sea_turtle.llm.openai.BATCH_POLL_INITIAL_SECONDS", 0):
+            results = asyncio.run(provider.batch_chat(requests))
+
+        self.assertEqual([line["custom_id"] for line in uploaded["lines"]], ["0", "1"])
+        self.assertEqual(results[0].finish_reason, "error")
+        self.assertEqual(results[0].content, "bad")
+        self.assertIsNone(results[0].raw_response)
+        self.assertEqual(results[1].content, "second")
+        self.assertEqual(results[1].input_tokens, 3)
+
+    def test_openai_retries_transient_errors(self):
+        self._install_openai_stub()
+        from sea_turtle.llm import openai as openai_provider
+
+        class APIError(Exception):
+            pass
+
+        class APIConnectionError(APIError):
+            pass
+
+        class APIStatusError(APIError):
+            def __init__(self, status_code):
+                self.status_code = status_code
+
+        class RateLimitError(APIStatusError):
+            pass
+
+        class InternalServerError(APIStatusError):
+            pass
+
+        sdk = types.SimpleNamespace(
+            APIConnectionError=APIConnectionError,
+            APIStatusError=APIStatusError,
+            RateLimitError=RateLimitError,
+            InternalServerError=InternalServerError,
+        )
+        with mock.patch.object(openai_provider, "openai", sdk):
+            retryable = openai_provider._is_retryable
+            self.assertTrue(retryable(APIConnectionError()))
+            self.assertTrue(retryable(RateLimitError(429)))
+            self.assertTrue(retryable(InternalServerError(502)))
+            self.assertTrue(retryable(APIStatusError(409)))
+            self.assertFalse(retryable(APIStatusError(400)))
+            self.assertFalse(retryable(ValueError()))
+
     def test_anthropic_transcript_keeps_tool_call_ids(self):
         self._install_anthropic_stub()
         from sea_turtle.llm.anthropic import AnthropicProvider
@@ -130,6 +302,32 @@ class ProviderTranscriptTests(unittest.TestCase):
         self.assertEqual(conversation[0]["content"][0]["id"], "call-2")
         self.assertEqual(conversation[1]["content"][0]["tool_use_id"], "call-2")
 
+    def test_anthropic_transcript_batches_consecutive_tool_results(self):
+        self._install_anthropic_stub()
+        from sea_turtle.llm.anthropic import AnthropicProvider
+
+        provider = AnthropicProvider(api_key="x")
+        _, conversation = provider._extract_messages([
+            {
+                "role": "assistant",
+                "content": "",
+                "tool_calls": [
+                    {"id": "call-1", "name": "read_tasks", "arguments": {}},
+                    {"id": "call-2", "name": "read_memory", "arguments": {}},
+                ],
+            },
+            {"role": "tool", "content": "(no tasks)", "name": "read_tasks", "tool_call_id": "call-1"},
+            {"role": "tool", "content": "(empty)", "name": "read_memory", "tool_call_id": "call-2"},
+            {"role": "user", "content": "thanks"},
+        ])
+
+        self.assertEqual([item["role"] for item in conversation], ["assistant", "user", "user"])
+        self.assertEqual(
+            [block["tool_use_id"] for block in conversation[1]["content"]],
+            ["call-1", "call-2"],
+        )
+        self.assertEqual(conversation[2]["content"], "thanks")
+
     def test_google_transcript_keeps_function_call_history(self):
         self._install_google_stub()
         from sea_turtle.llm.google import GoogleProvider
@@ -148,6 +346,43 @@ class ProviderTranscriptTests(unittest.TestCase):
         self.assertEqual(contents[0].parts[0]["kind"], "function_call")
         self.assertEqual(contents[1].parts[0]["kind"], "function_response")
 
+    def test_google_stream_events_include_tool_calls(self):
+        self._install_google_stub()
+        from sea_turtle.llm.google import GoogleProvider
+
+        def chunk(*parts):
+            return types.SimpleNamespace(candidates=[
+                types.SimpleNamespace(content=types.SimpleNamespace(parts=list(parts)))
+            ])
+
+        def part(text=None, function_call=None, thought=False):
+            return types.SimpleNamespace(text=text, function_call=function_call, thought=thought)
+
+        call = types.SimpleNamespace(name="execute_shell", args={"command": "pwd"})
+
+        async def generate_content_stream(**kwargs):
+            yield chunk(part(text="thinking", thought=True))
+            yield chunk(part(text="Let me check."))
+            yield chunk(part(function_call=call))
+
+        provider = GoogleProvider(api_key="x")
+        provider.client = types.SimpleNamespace(aio=types.SimpleNamespace(
+            models=types.SimpleNamespace(generate_content_stream=generate_content_stream)
+        ))
+
+        async def collect():
+            return [
+                event async for event in provider.chat_stream_events(
+                    [{"role": "user", "content": "where am I?"}], model="gemini-2.5-flash"
+                )
+            ]
+
+        events = asyncio.run(collect())
+        self.assertEqual(events, [
+            {"type": "text", "data": "Let me check."},
+            {"type": "tool_call", "data": {"name": "execute_shell", "arguments": {"command": "pwd"}}},
+        ])
+
 
 if __name__ == "__main__":
     unittest.main()
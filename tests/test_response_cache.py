@@ -0,0 +1,120 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from sea_turtle.llm.base import LLMResponse, ToolDefinition
+from sea_turtle.llm import cache as cache_module
+from sea_turtle.llm.cache import (
+    ResponseCache,
+    SemanticCache,
+    lookup_response,
+    make_key,
+    normalize_prompt,
+    should_cache,
+)
+
+
+class ResponseCacheTests(unittest.TestCase):
+    def test_key_is_stable_and_covers_tools(self):
+        messages = [{"role": "user", "content": "hi"}]
+        tool = ToolDefinition(name="t", description="d", parameters={"type": "object"})
+        base = make_key("p", "m", messages, 0.0, 100)
+        self.assertEqual(base, make_key("p", "m", [{"content": "hi", "role": "user"}], 0.0, 100))
+        self.assertNotEqual(base, make_key("p", "m", messages, 0.0, 100, [tool]))
+        self.assertNotEqual(base, make_key("other", "m", messages, 0.0, 100))
+
+    def test_only_deterministic_requests_are_cached_by_default(self):
+        self.assertTrue(should_cache(0.0, None))
+        self.assertFalse(should_cache(0.7, None))
+        self.assertTrue(should_cache(0.7, True))
+        self.assertFalse(should_cache(0.0, False))
+
+    def test_hit_returns_copy_without_billing(self):
+        cache = ResponseCache()
+        cache.put("k", LLMResponse(content="ok", tool_calls=[{"name": "t"}], input_tokens=5, output_tokens=2))
+        hit = cache.get("k")
+        self.assertEqual(hit.content, "ok")
+        self.assertEqual((hit.input_tokens, hit.output_tokens), (0, 0))
+        hit.tool_calls.append({"name": "x"})
+        self.assertEqual(len(cache.get("k").tool_calls), 1)
+
+    def test_evicts_least_recently_used_and_expired_entries(self):
+        cache = ResponseCache(max_size=2, ttl=10)
+        cache.put("a", LLMResponse(content="a"))
+        cache.put("b", LLMResponse(content="b"))
+        cache.get("a")
+        cache.put("c", LLMResponse(content="c"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+
+        with mock.patch("sea_turtle.llm.cache.time.monotonic", return_value=1e12):
+            self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 1)
+
+    def test_semantic_cache_matches_normalized_prompts(self):
+        self.assertEqual(normalize_prompt("  Classify THIS ticket!! "), "classify this ticket")
+        cache = SemanticCache()
+        cache.put("scope", "Classify this ticket.", LLMResponse(content="bug", input_tokens=3))
+
+        async def scenario():
+            hit, _ = await cache.get("scope", "classify   this ticket")
+            miss, _ = await cache.get("other", "classify this ticket")
+            return hit, miss
+
+        hit, miss = asyncio.run(scenario())
+        self.assertEqual(hit.content, "bug")
+        self.assertEqual(hit.input_tokens, 0)
+        self.assertIsNone(miss)
+
+    def test_semantic_cache_uses_embedding_similarity(self):
+        vectors = {"categorize this ticket": [1.0, 0.1], "classify this ticket": [1.0, 0.0], "write a poem": [0.0, 1.0]}
+
+        async def embed(text):
+            return vectors[text]
+
+        cache = SemanticCache(embed)
+
+        async def scenario():
+            _, vector = await cache.get("scope", "classify this ticket")
+            cache.put("scope", "classify this ticket", LLMResponse(content="bug"), vector)
+            hit, _ = await cache.get("scope", "Categorize this ticket")
+            miss, _ = await cache.get("scope", "write a poem")
+            return hit, miss
+
+        hit, miss = asyncio.run(scenario())
+        self.assertEqual(hit.content, "bug")
+        self.assertIsNone(miss)
+
+
+    def test_lookup_response_stores_in_exact_and_semantic_caches(self):
+        semantic = SemanticCache()
+        history = [{"role": "system", "content": "sys"}]
+
+        async def lookup(prompt, use_cache=None):
+            return await lookup_response(
+                "ns", semantic, "m", history + [{"role": "user", "content": prompt}],
+                0.0, 100, None, "auto", use_cache,
+            )
+
+        async def scenario():
+            miss = await lookup("Classify this ticket.")
+            miss.store(LLMResponse(content="bug"))
+            return (
+                miss.hit,
+                await lookup("Classify this ticket."),
+                await lookup("classify this ticket"),
+                await lookup("Classify this ticket.", use_cache=False),
+            )
+
+        with mock.patch.object(cache_module, "response_cache", ResponseCache()):
+            miss, exact, near, skipped = asyncio.run(scenario())
+        self.assertIsNone(miss)
+        self.assertEqual(exact.hit.content, "bug")
+        self.assertIsNone(exact.scope)
+        self.assertEqual(near.hit.content, "bug")
+        self.assertIsNone(skipped.hit)
+        self.assertIsNone(skipped.key)
+
+
+if __name__ == "__main__":
+    unittest.main()
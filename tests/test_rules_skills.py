@@ -3,6 +3,7 @@ from tempfile import TemporaryDirectory
 import unittest
 
 from sea_turtle.core.rules import load_global_skills, load_skills
+from sea_turtle.security.system_prompt import _is_empty_skills
 
 
 class RulesSkillsTests(unittest.TestCase):
@@ -26,6 +27,12 @@ class RulesSkillsTests(unittest.TestCase):
             self.assertIn("agent common", merged)
             self.assertIn("agent discord", merged)
 
+    def test_empty_skills_detection_splits_lines_like_splitlines(self):
+        for newline in ("\n", "\r\n", "\r", "\f", "\u2028"):
+            with self.subTest(newline=newline):
+                self.assertTrue(_is_empty_skills(newline.join(["# Skills", "  <!-- none -->", "  "])))
+                self.assertFalse(_is_empty_skills(newline.join(["# Skills", "  use tools"])))
+
 
 if __name__ == "__main__":
     unittest.main()
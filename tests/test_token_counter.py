@@ -0,0 +1,98 @@
+import json
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+
+from sea_turtle.core.token_counter import TokenCounter, entry_time
+
+
+class TokenCounterTests(unittest.TestCase):
+    def _config(self, tmpdir: str) -> dict:
+        return {"global": {"data_dir": tmpdir}, "token_billing": {"enabled": True}}
+
+    def test_recorded_usage_is_aggregated_from_log(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            counter = TokenCounter(self._config(tmpdir), "agent")
+            counter.record("model-a", 100, 10)
+            counter.record("model-a", 50, 5)
+            counter.record("model-b", 1, 2)
+            counter.close()
+
+            total = TokenCounter(self._config(tmpdir), "agent").get_total_usage()
+            self.assertEqual(total["requests"], 3)
+            self.assertEqual(total["input_tokens"], 151)
+            self.assertEqual(total["output_tokens"], 17)
+            self.assertEqual(total["by_model"]["model-a"]["requests"], 2)
+            self.assertEqual(total["by_model"]["model-b"]["output_tokens"], 2)
+
+    def test_log_writes_are_visible_to_other_readers_immediately(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            first = TokenCounter(self._config(tmpdir), "agent")
+            second = TokenCounter(self._config(tmpdir), "agent")
+            reader = TokenCounter(self._config(tmpdir), "agent")
+            first.record("model-a", 10, 1)
+            second.record("model-b", 20, 2)
+            first.record("model-a", 30, 3)
+            total = reader.get_total_usage()
+            self.assertEqual(total["requests"], 3)
+            self.assertEqual(total["input_tokens"], 60)
+            first.close()
+            second.close()
+
+    def test_totals_checkpoint_only_parses_new_entries(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            writer = TokenCounter(self._config(tmpdir), "agent")
+            writer.record("model-a", 10, 1)
+            self.assertEqual(TokenCounter(self._config(tmpdir), "agent").get_total_usage()["requests"], 1)
+            self.assertTrue(Path(writer.totals_file).exists())
+
+            reader = TokenCounter(self._config(tmpdir), "agent")
+            writer.record("model-a", 20, 2)
+            writer.close()
+            with open(writer.log_file, "ab") as f:
+                f.write(b'{"model": "model-a", "input_tokens": 5')
+            total = reader.get_total_usage()
+            self.assertEqual(total["requests"], 2)
+            self.assertEqual(total["input_tokens"], 30)
+
+            with open(writer.log_file, "ab") as f:
+                f.write(b', "output_tokens": 0, "cost_usd": 0.0}\n')
+            total = reader.get_total_usage()
+            self.assertEqual(total["requests"], 3)
+            self.assertEqual(total["input_tokens"], 35)
+
+    def test_truncated_log_resets_checkpoint(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            counter = TokenCounter(self._config(tmpdir), "agent")
+            counter.record("model-a", 10, 1)
+            counter.record("model-a", 10, 1)
+            self.assertEqual(counter.get_total_usage()["requests"], 2)
+            Path(counter.log_file).write_bytes(b"")
+            counter.record("model-b", 3, 1)
+            total = counter.get_total_usage()
+            self.assertEqual(total["requests"], 1)
+            self.assertEqual(list(total["by_model"]), ["model-b"])
+
+    def test_missing_log_reports_zero_usage(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            total = TokenCounter(self._config(tmpdir), "agent").get_total_usage()
+            self.assertEqual(total["requests"], 0)
+            self.assertEqual(total["by_model"], {})
+
+    def test_entries_store_integer_nanosecond_timestamp(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            counter = TokenCounter(self._config(tmpdir), "agent")
+            counter.record("model-a", 1, 1)
+            counter.close()
+            with open(counter.log_file, encoding="utf-8") as f:
+                entry = json.loads(f.readline())
+            self.assertIsInstance(entry["ts"], int)
+            self.assertEqual(entry_time(entry).tzinfo, timezone.utc)
+
+        legacy = {"timestamp": "2025-01-02T03:04:05.000006+00:00"}
+        self.assertEqual(entry_time(legacy), datetime(2025, 1, 2, 3, 4, 5, 6, tzinfo=timezone.utc))
+
+
+if __name__ == "__main__":
+    unittest.main()
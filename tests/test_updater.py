@@ -0,0 +1,217 @@
+import http.client
+import io
+import subprocess
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from sea_turtle.updater import github
+
+
+class CheckUpdateTests(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+        patcher = mock.patch.object(github, "UPDATE_CACHE_FILE", Path(self._tmpdir.name) / "update_cache.json")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_not_modified_reuses_cached_version(self):
+        requests = []
+
+        def first(headers):
+            requests.append(headers)
+            return 200, {"ETag": '"abc"', "Last-Modified": "Mon"}, b'{"tag_name": "v0.3.0"}'
+
+        def second(headers):
+            requests.append(headers)
+            return 304, {}, b""
+
+        with mock.patch.object(github, "_github_get", first):
+            self.assertEqual(github.check_update(), "0.3.0")
+        with mock.patch.object(github, "_github_get", second):
+            self.assertEqual(github.check_update(force=True), "0.3.0")
+
+        self.assertNotIn("If-None-Match", requests[0])
+        self.assertEqual(requests[1]["If-None-Match"], '"abc"')
+        self.assertEqual(requests[1]["If-Modified-Since"], "Mon")
+
+    def test_fresh_cache_skips_the_network(self):
+        calls = []
+
+        def fetch(headers):
+            calls.append(headers)
+            return 200, {}, b'{"tag_name": "v0.4.0"}'
+
+        with mock.patch.object(github, "_github_get", fetch):
+            self.assertEqual(github.check_update(), "0.4.0")
+            self.assertEqual(github.check_update(), "0.4.0")
+            self.assertEqual(len(calls), 1)
+
+            expired = github.time.time() + github.UPDATE_CACHE_TTL_SECONDS + 1
+            with mock.patch.object(github.time, "time", return_value=expired):
+                self.assertEqual(github.check_update(), "0.4.0")
+            self.assertEqual(len(calls), 2)
+
+    def test_update_info_refreshes_stale_cache_in_background(self):
+        github._save_update_cache({"version": "0.3.0", "fetched_at": 0})
+        release = github.threading.Event()
+
+        def slow_check():
+            release.wait(5)
+            return "0.9.0"
+
+        with mock.patch.object(github, "check_update", slow_check), \
+                mock.patch.object(github, "_pending", None):
+            info = github.get_update_info()
+            self.assertEqual(info["latest_version"], "0.3.0")
+            pending = github._pending
+            self.assertIsNotNone(pending)
+            self.assertTrue(pending.daemon)
+            release.set()
+            pending.join(5)
+            self.assertEqual(github.get_update_info()["latest_version"], "0.9.0")
+
+    def test_cache_lives_in_the_configured_data_dir(self):
+        with mock.patch.object(github, "UPDATE_CACHE_FILE", None), \
+                mock.patch.object(github, "_data_dir", None):
+            github.set_data_dir(self._tmpdir.name)
+            github._save_update_cache({"version": "0.7.0"})
+        cache_file = Path(self._tmpdir.name) / github.UPDATE_CACHE_FILE_NAME
+        self.assertIn("0.7.0", cache_file.read_text(encoding="utf-8"))
+
+    def test_update_command_works_without_a_config_file(self):
+        from sea_turtle import cli
+
+        args = types.SimpleNamespace(config="/nonexistent/config.json", check=True)
+        with mock.patch.object(github, "check_update", return_value=None), \
+                mock.patch.object(github, "_data_dir", None), \
+                mock.patch("builtins.print"):
+            cli.cmd_update(args)
+            self.assertEqual(github._data_dir, "~/.sea_turtle")
+
+    def test_truncated_release_payload_still_yields_tag(self):
+        body = b'{"url": "x", "tag_name": "v0.5.1", "assets": [' + b'{"id": 1},' * 2000
+        body = body[:github.RELEASE_READ_LIMIT]
+        with mock.patch.object(github, "_github_get", return_value=(200, {}, body)):
+            self.assertEqual(github.check_update(force=True), "0.5.1")
+
+
+class GithubConnectionTests(unittest.TestCase):
+    def test_stale_kept_alive_connection_is_replaced_once(self):
+        created = []
+
+        class FakeConnection:
+            def __init__(self, host, timeout):
+                self.closed = False
+                created.append(self)
+
+            def request(self, method, path, headers):
+                if len(created) == 1 and getattr(self, "used", False):
+                    raise http.client.RemoteDisconnected("idle close")
+                self.used = True
+
+            def getresponse(self):
+                payload = io.BytesIO(b'{"body": "%s"}' % (b"x" * 65536))
+                return mock.Mock(status=200, headers={}, read=payload.read)
+
+            def close(self):
+                self.closed = True
+
+        with mock.patch.object(http.client, "HTTPSConnection", FakeConnection), \
+                mock.patch.object(github, "_connection", None):
+            self.assertEqual(github._github_get({})[0], 200)
+            self.assertEqual(github._github_get({})[0], 200)
+            status, _, body = github._github_get({})
+        self.assertEqual(status, 200)
+        self.assertEqual(len(body), github.RELEASE_READ_LIMIT)
+
+        self.assertEqual(len(created), 2)
+        self.assertTrue(created[0].closed)
+
+
+class InstallUpdateTests(unittest.TestCase):
+    def test_auto_strategy_prefers_git_checkout_and_falls_back_to_pip(self):
+        with tempfile.TemporaryDirectory() as checkout, tempfile.TemporaryDirectory() as sdist:
+            (Path(checkout) / ".git").mkdir()
+            with mock.patch.object(github, "_install_from_git", return_value=True) as git, \
+                    mock.patch.object(github, "_install_from_pypi", return_value=True) as pip:
+                with mock.patch.object(github, "_find_project_root", return_value=checkout):
+                    self.assertTrue(github.install_update())
+                with mock.patch.object(github, "_find_project_root", return_value=sdist):
+                    self.assertTrue(github.install_update())
+                    self.assertTrue(github.install_update("pip"))
+            git.assert_called_once_with(checkout, False)
+            self.assertEqual(pip.call_count, 2)
+
+        with self.assertRaises(ValueError):
+            github.install_update("svn")
+
+    def test_run_bounded_kills_the_process_group_on_timeout(self):
+        start = github.time.monotonic()
+        with self.assertRaises(subprocess.TimeoutExpired):
+            github._run_bounded(["sh", "-c", "sleep 30 & sleep 30"], timeout=0.2)
+        self.assertLess(github.time.monotonic() - start, 5)
+
+        with self.assertLogs("sea_turtle.updater", "INFO") as logs:
+            returncode = github._run_bounded(["sh", "-c", "echo ok; echo oops >&2; exit 3"], timeout=5, label="sh")
+        self.assertEqual(returncode, 3)
+        self.assertEqual(logs.output, ["INFO:sea_turtle.updater:sh: ok", "INFO:sea_turtle.updater:sh: oops"])
+
+    def test_pip_runs_in_process_only_when_requested(self):
+        calls = []
+
+        def fake_main(args):
+            calls.append(args)
+            print("Successfully installed sea-turtle")
+            return 0
+
+        fake_module = types.SimpleNamespace(main=fake_main)
+        with mock.patch.dict(sys.modules, {"pip._internal.cli.main": fake_module}), \
+                mock.patch.object(github, "_run_bounded") as run_bounded, \
+                self.assertLogs("sea_turtle.updater", "INFO") as logs:
+            self.assertEqual(github._pip_install(["--upgrade", "sea-turtle"], timeout=5, in_process=True), 0)
+        run_bounded.assert_not_called()
+        self.assertEqual(calls, [["install", "--upgrade", "sea-turtle"]])
+        self.assertEqual(logs.output, ["INFO:sea_turtle.updater:pip: Successfully installed sea-turtle"])
+
+        with mock.patch.dict(sys.modules, {"pip._internal.cli.main": fake_module}), \
+                mock.patch.object(github, "_run_bounded", return_value=0) as run_bounded:
+            self.assertEqual(github._pip_install(["--upgrade", "sea-turtle"], timeout=5), 0)
+        run_bounded.assert_called_once()
+        self.assertEqual(len(calls), 1)
+
+
+class CompareVersionsTests(unittest.TestCase):
+    def test_numeric_ordering(self):
+        self.assertEqual(github.compare_versions("0.2.0", "0.10.0"), -1)
+        self.assertEqual(github.compare_versions("1.2.0", "1.2.0"), 0)
+        self.assertEqual(github.compare_versions("1.3.0", "1.2.9"), 1)
+        self.assertEqual(github.compare_versions("1.2", "v1.2.0"), 0)
+
+    def test_fallback_compares_every_numeric_component(self):
+        with mock.patch.object(github, "Version", None):
+            self.assertEqual(github.compare_versions("1.2.3.4", "1.2.3.5"), -1)
+            self.assertEqual(github.compare_versions("1.2.3.1", "1.2.3"), 1)
+            self.assertEqual(github.compare_versions("1.2", "1.2.0.0"), 0)
+            self.assertEqual(github.compare_versions("0.0.0", "nightly"), 0)
+
+    def test_tag_loses_only_one_leading_v(self):
+        for tag, expected in (("v0.6.0", "0.6.0"), ("0.6.0rc1", "0.6.0rc1"), ("vv0.6.0", None), ("nightly", None)):
+            body = b'{"tag_name": "%s"}' % tag.encode()
+            with mock.patch.object(github, "_github_get", return_value=(200, {}, body)), \
+                    mock.patch.object(github, "_save_update_cache"), \
+                    mock.patch.object(github, "_load_update_cache", return_value={}):
+                self.assertEqual(github.check_update(force=True), expected)
+
+    @unittest.skipIf(github.Version is None, "packaging not installed")
+    def test_pre_releases_sort_before_the_release(self):
+        self.assertEqual(github.compare_versions("1.2.0rc1", "1.2.0"), -1)
+        self.assertEqual(github.compare_versions("1.2.0", "1.2"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()